@@ -1,18 +1,26 @@
 """Daily AI Assistant module for LEVQUANT calibration and context management."""
 
 from ai_assistant.context_journal import (
+    JournalWriter,
     add_context,
+    delta_since,
     get_all_context,
+    get_journal_writer,
     init_journal,
     read_entries,
+    stable_concat_context,
 )
 from ai_assistant.daily_calibration import DailyAICalibrator, save_daily_report
 
 __all__ = [
+    "JournalWriter",
     "add_context",
+    "delta_since",
     "get_all_context",
+    "get_journal_writer",
     "init_journal",
     "read_entries",
+    "stable_concat_context",
     "DailyAICalibrator",
     "save_daily_report",
 ]
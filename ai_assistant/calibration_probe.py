@@ -6,13 +6,20 @@ No engine modifications. No advocacy or optimisation.
 
 from __future__ import annotations
 
-import json
+import atexit
+import copy
+import hashlib
 import os
-import tempfile
+import re
+import threading
+from collections import OrderedDict
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Annotated, Any, Optional, Union
 
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, ValidationError
+
+from ai_assistant import jsonio
 from ai_assistant.context_journal import get_all_context
 
 # Fixed calibration probe prompt template (verbatim)
@@ -132,9 +139,33 @@ Required structure:
 Your role is calibration auditor, not advocate.
 """
 
+# Literal segments between the three slots, split once at import so each run
+# only joins strings instead of re-parsing the template's format spec.
+_PROMPT_SLOT = "\x00"
+_PROMPT_PARTS = tuple(
+    CALIBRATION_PROBE_PROMPT.format(
+        engine_snapshot=_PROMPT_SLOT,
+        assumptions_snapshot=_PROMPT_SLOT,
+        journal_context=_PROMPT_SLOT,
+    ).split(_PROMPT_SLOT)
+)
+
 DEFAULT_OUTPUT_DIR = Path("outputs/calibration")
 LOG_FILE = Path("logs/calibration.log")
 
+LOG_BUFFER_SIZE = 65536
+PROBE_CACHE_MAX = 128
+
+# blake2b(prompt) -> (llm_client, raw_output, parsed); scoped to the client
+# instance so different models never share answers.
+_PROBE_CACHE: OrderedDict[bytes, tuple[Any, str, dict]] = OrderedDict()
+OUTPUT_BUFFER_SIZE = 65536
+PROMPT_SIDECAR_THRESHOLD = 4096
+# Audit-log appends are flushed per probe by default; set a number of
+# seconds here (before import-time construction of the writer) to opt in to
+# timer-flushed buffering
+LOG_FLUSH_INTERVAL_S: Optional[float] = None
+
 REQUIRED_KEYS = [
     "probe_version",
     "timestamp_utc",
@@ -145,6 +176,32 @@ REQUIRED_KEYS = [
     "recommended_settlement_range_gbp",
     "drift_alert",
 ]
+_PROB_KEYS = ("fact_certainty_index", "procedural_risk_index", "insurer_exit_probability")
+
+_JSON_STRUCTURAL = re.compile(r'[{}"]')
+# Remainder of a JSON string after its opening quote, honouring escapes
+_JSON_STRING_TAIL = re.compile(r'(?:[^"\\]++|\\.)*+"', re.DOTALL)
+
+Probability = Annotated[Union[StrictInt, StrictFloat], Field(ge=0.0, le=1.0)]
+
+
+class ProbeResult(BaseModel):
+    """Schema for the probe's required top-level keys.
+
+    Section blocks and any other keys are kept as extras. Validation runs in
+    pydantic-core, so parsing and checking JSON output is a single pass.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    probe_version: Any
+    timestamp_utc: Any
+    fact_certainty_index: Probability
+    procedural_risk_index: Probability
+    insurer_exit_probability: Probability
+    law_firm_breakpoint_score: Annotated[StrictInt, Field(ge=0, le=100)]
+    recommended_settlement_range_gbp: Any
+    drift_alert: StrictBool
 
 
 def run_calibration_probe(
@@ -153,10 +210,14 @@ def run_calibration_probe(
     journal_path: Optional[Path] = None,
     llm_client: Optional[Any] = None,
     output_dir: Path = DEFAULT_OUTPUT_DIR,
+    use_cache: bool = False,
 ) -> dict:
     """Run the LLM Calibration Probe and return parsed JSON output.
     
     Persists raw + parsed output to disk. Appends summary to audit log.
+    Every call samples the LLM unless use_cache is set; then successful
+    responses are cached in-process per client and prompt, and re-probing
+    an unchanged snapshot returns status "cached" without a new query.
     
     Args:
         engine_snapshot: Current deterministic engine output
@@ -164,6 +225,8 @@ def run_calibration_probe(
         journal_path: Optional path to context journal
         llm_client: Optional LLM client with .query(prompt) -> str method
         output_dir: Directory for output files (default: outputs/calibration)
+        use_cache: Opt in to reusing a cached response for an identical
+            prompt and client (off by default so each probe samples the model)
     
     Returns:
         Parsed calibration probe result as dictionary
@@ -178,15 +241,17 @@ def run_calibration_probe(
     # Get journal context
     journal_context = get_all_context(journal_path) if journal_path else "[No journal context provided]"
     
-    # Build prompt
-    prompt = CALIBRATION_PROBE_PROMPT.format(
-        engine_snapshot=json.dumps(engine_snapshot, indent=2, default=str),
-        assumptions_snapshot=json.dumps(assumptions_snapshot, indent=2, default=str),
-        journal_context=journal_context if journal_context else "[Empty journal]",
+    # Build prompt. Snapshots are serialised sequentially on purpose: both
+    # orjson and the stdlib encoder hold the GIL, so a thread pool would add
+    # overhead without any parallelism.
+    prompt = _build_prompt(
+        jsonio.dumps_pretty(engine_snapshot, sort_keys=True),
+        jsonio.dumps_pretty(assumptions_snapshot, sort_keys=True),
+        journal_context if journal_context else "[Empty journal]",
     )
     
-    # Ensure output directory exists
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Ensure output directory exists (once per process)
+    jsonio.ensure_dir(output_dir)
     
     # If no LLM client, return prompt for manual use
     if llm_client is None:
@@ -198,18 +263,34 @@ def run_calibration_probe(
             "parsed_output": None,
             "error": None,
         }
-        _persist_output(result, output_dir, timestamp_str, prompt_only=True)
+        _persist_output(result, output_dir, timestamp, prompt_only=True)
+        return result
+    
+    cache_key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+    cached = _cache_get(cache_key, llm_client) if use_cache else None
+    if cached is not None:
+        raw_output, parsed = cached
+        result = {
+            "probe_version": "1.0",
+            "timestamp_utc": timestamp_str,
+            "status": "cached",
+            "prompt": prompt,
+            "raw_output": raw_output,
+            "parsed_output": parsed,
+            "error": None,
+        }
+        _persist_output(result, output_dir, timestamp, prompt_only=False)
+        _append_to_log(result)
         return result
     
     try:
         # Call LLM
         raw_output = llm_client.query(prompt)
         
-        # Parse and validate
+        # Parse and validate in one pass
         parsed = _parse_probe_output(raw_output)
-        
-        # Validate required keys
-        _validate_probe_output(parsed)
+        if use_cache:
+            _cache_put(cache_key, llm_client, raw_output, parsed)
         
         # Build result
         result = {
@@ -223,7 +304,7 @@ def run_calibration_probe(
         }
         
         # Persist
-        _persist_output(result, output_dir, timestamp_str, prompt_only=False)
+        _persist_output(result, output_dir, timestamp, prompt_only=False)
         _append_to_log(result)
         
         return result
@@ -239,13 +320,41 @@ def run_calibration_probe(
             "parsed_output": None,
             "error": str(e),
         }
-        _persist_output(result, output_dir, timestamp_str, prompt_only=False)
+        _persist_output(result, output_dir, timestamp, prompt_only=False)
         _append_to_log(result)
         raise RuntimeError(f"Calibration probe failed: {e}") from e
 
 
+def _cache_get(key: bytes, llm_client: Any) -> Optional[tuple[str, dict]]:
+    """Return (raw_output, parsed copy) for a cached response, or None."""
+    entry = _PROBE_CACHE.get(key)
+    if entry is None or entry[0] is not llm_client:
+        return None
+    _PROBE_CACHE.move_to_end(key)
+    return entry[1], copy.deepcopy(entry[2])
+
+
+def _cache_put(key: bytes, llm_client: Any, raw_output: str, parsed: dict) -> None:
+    """Store a validated response, evicting the least recently used entry."""
+    _PROBE_CACHE[key] = (llm_client, raw_output, copy.deepcopy(parsed))
+    _PROBE_CACHE.move_to_end(key)
+    if len(_PROBE_CACHE) > PROBE_CACHE_MAX:
+        _PROBE_CACHE.popitem(last=False)
+
+
+def _build_prompt(engine_json: str, assumptions_json: str, journal_context: str) -> str:
+    """Fill the pre-split probe template; equivalent to CALIBRATION_PROBE_PROMPT.format()."""
+    p0, p1, p2, p3 = _PROMPT_PARTS
+    return "".join((p0, engine_json, p1, assumptions_json, p2, journal_context, p3))
+
+
 def _parse_probe_output(output: str) -> dict:
-    """Parse LLM output, extracting JSON from markdown if necessary.
+    """Parse and validate LLM output, extracting the first JSON object.
+    
+    Markdown fences or prose around the object are ignored. The object is
+    located with a single brace-balanced scan that skips string contents,
+    then decoded straight into ProbeResult so parsing and validation happen
+    together.
     
     Args:
         output: Raw string from LLM
@@ -254,82 +363,139 @@ def _parse_probe_output(output: str) -> dict:
         Parsed dictionary
     
     Raises:
-        ValueError: If output cannot be parsed as JSON
+        ValueError: If output contains no JSON object, cannot be parsed,
+            or fails validation
     """
-    cleaned = output.strip()
-    
-    # Remove markdown code blocks if present
-    if cleaned.startswith("```json"):
-        cleaned = cleaned[7:]
-    elif cleaned.startswith("```"):
-        cleaned = cleaned[3:]
-    
-    if cleaned.endswith("```"):
-        cleaned = cleaned[:-3]
-    
-    cleaned = cleaned.strip()
+    try:
+        return ProbeResult.model_validate_json(_extract_json_object(output)).model_dump()
+    except ValidationError as e:
+        raise ValueError(_describe_validation_error(e)) from e
+
+
+def _extract_json_object(text: str) -> str:
+    """Return the first balanced {...} span in text.
     
-    # Check for non-JSON content
-    if not cleaned.startswith("{"):
-        raise ValueError(f"Output does not start with '{{'. Possible markdown or commentary detected.")
+    Jumps between structural characters with compiled regexes rather than
+    stepping through every character; braces inside strings (including
+    escaped quotes) are skipped.
     
-    try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON: {e}") from e
+    Raises:
+        ValueError: If there is no '{' or the object is never closed
+    """
+    start = text.find("{")
+    if start < 0:
+        raise ValueError("Output contains no JSON object. Possible markdown or commentary detected.")
+    
+    depth = 0
+    pos = start
+    while True:
+        match = _JSON_STRUCTURAL.search(text, pos)
+        if match is None:
+            raise ValueError("Invalid JSON: unbalanced braces in output")
+        pos = match.end()
+        char = match.group()
+        if char == '"':
+            string_end = _JSON_STRING_TAIL.match(text, pos)
+            if string_end is None:
+                raise ValueError("Invalid JSON: unterminated string in output")
+            pos = string_end.end()
+        elif char == "{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return text[start:pos]
 
 
 def _validate_probe_output(parsed: dict) -> None:
-    """Validate that parsed output contains all required keys.
+    """Validate that an already-parsed dictionary matches ProbeResult.
     
     Args:
         parsed: Parsed dictionary
     
     Raises:
-        ValueError: If required keys are missing
+        ValueError: If required keys are missing or have invalid values
     """
-    missing = [key for key in REQUIRED_KEYS if key not in parsed]
-    if missing:
-        raise ValueError(f"Missing required keys: {missing}")
-    
-    # Validate types
-    if not isinstance(parsed.get("drift_alert"), bool):
-        raise ValueError("drift_alert must be boolean")
-    
-    for key in ["fact_certainty_index", "procedural_risk_index", "insurer_exit_probability"]:
-        value = parsed.get(key)
-        if not isinstance(value, (int, float)):
-            raise ValueError(f"{key} must be numeric")
-        if not 0.0 <= float(value) <= 1.0:
-            raise ValueError(f"{key} must be between 0.0 and 1.0")
+    try:
+        ProbeResult.model_validate(parsed)
+    except ValidationError as e:
+        raise ValueError(_describe_validation_error(e)) from e
+
+
+def _describe_validation_error(error: ValidationError) -> str:
+    """Map pydantic errors to the probe's established error messages."""
+    errors = error.errors()
+    if any(err["type"] == "json_invalid" for err in errors):
+        return f"Invalid JSON: {error}"
     
-    score = parsed.get("law_firm_breakpoint_score")
-    if not isinstance(score, int) or not 0 <= score <= 100:
-        raise ValueError("law_firm_breakpoint_score must be integer 0–100")
+    failed = {err["loc"][0]: err["type"] for err in errors if err["loc"]}
+    missing = [key for key in REQUIRED_KEYS if failed.get(key) == "missing"]
+    if missing:
+        return f"Missing required keys: {missing}"
+    if "drift_alert" in failed:
+        return "drift_alert must be boolean"
+    for key in _PROB_KEYS:
+        if key in failed:
+            if failed[key] in ("greater_than_equal", "less_than_equal"):
+                return f"{key} must be between 0.0 and 1.0"
+            return f"{key} must be numeric"
+    if "law_firm_breakpoint_score" in failed:
+        return "law_firm_breakpoint_score must be integer 0–100"
+    return str(error)
 
 
 def _persist_output(
     result: dict,
     output_dir: Path,
-    timestamp_str: str,
+    timestamp: datetime,
     prompt_only: bool = False,
 ) -> Path:
     """Persist probe result to disk.
     
+    Prompts longer than PROMPT_SIDECAR_THRESHOLD characters are written
+    verbatim to ``<name>.prompt.txt`` and replaced in the JSON by
+    ``{"sha256": ..., "sidecar": ...}``. The caller's dict is not modified.
+    
     Args:
         result: Result dictionary
         output_dir: Output directory
-        timestamp_str: ISO timestamp string
+        timestamp: Probe timestamp (UTC)
         prompt_only: Whether this is a prompt-only result
     
     Returns:
         Path to saved file
     """
-    filename = f"calibration_{timestamp_str.replace(':', '').replace('-', '').replace('.', '')}.json"
+    filename = f"calibration_{timestamp.strftime('%Y%m%dT%H%M%S%f')}.json"
     filepath = output_dir / filename
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False, default=str)
+    # Large prompts go to a raw sidecar file; the JSON keeps only a pointer,
+    # so the prompt is neither stored twice nor JSON-escaped.
+    prompt = result.get("prompt")
+    sidecar = None
+    if isinstance(prompt, str) and len(prompt) > PROMPT_SIDECAR_THRESHOLD:
+        prompt_bytes = prompt.encode("utf-8")
+        sidecar = filepath.with_suffix(".prompt.txt")
+        result = {
+            **result,
+            "prompt": {
+                "sha256": hashlib.sha256(prompt_bytes).hexdigest(),
+                "sidecar": sidecar.name,
+            },
+        }
+    
+    # Compact by default; set LEVQUANT_PRETTY=1 for indented, human-review output
+    data = jsonio.dumps_bytes(result, pretty=bool(os.environ.get("LEVQUANT_PRETTY")))
+    try:
+        f = open(filepath, "wb", buffering=OUTPUT_BUFFER_SIZE)
+    except FileNotFoundError:
+        # Directory removed since it was cached as ensured; recreate it
+        jsonio.ensure_dir(output_dir, recreate=True)
+        f = open(filepath, "wb", buffering=OUTPUT_BUFFER_SIZE)
+    with f:
+        f.write(data)
+    if sidecar is not None:
+        with open(sidecar, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write(prompt_bytes)
     
     return filepath
 
@@ -340,8 +506,6 @@ def _append_to_log(result: dict) -> None:
     Args:
         result: Result dictionary
     """
-    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    
     # Create summary for log
     summary = {
         "timestamp_utc": result.get("timestamp_utc"),
@@ -364,9 +528,91 @@ def _append_to_log(result: dict) -> None:
     if result.get("error"):
         summary["error"] = result["error"]
     
-    # Append to log (JSONL)
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(json.dumps(summary, ensure_ascii=False, default=str) + "\n")
+    # Append to log (JSONL); failures are flushed immediately even when
+    # buffering is enabled
+    line = jsonio.dumps_line(summary) + "\n"
+    _LOG_WRITER.write(
+        LOG_FILE,
+        line.encode("utf-8"),
+        flush=result.get("status") == "failed",
+    )
+
+
+class _LogWriter:
+    """JSONL appender for the audit log.
+
+    Keeps one file handle open per process and reopens it if the log was
+    deleted or rotated. With interval_s None every write is flushed;
+    otherwise writes are buffered and flushed on a recurring timer, at
+    interpreter exit, and whenever a caller requests it (e.g. failures).
+    """
+
+    def __init__(self, interval_s: Optional[float] = LOG_FLUSH_INTERVAL_S) -> None:
+        self._interval_s = interval_s
+        self._lock = threading.Lock()
+        self._path: Optional[Path] = None
+        self._fh = None
+        self._timer: Optional[threading.Timer] = None
+        atexit.register(self.close)
+
+    def write(self, path: Path, data: bytes, flush: bool = False) -> None:
+        with self._lock:
+            if self._fh is None or self._path != path or self._is_stale():
+                self._open(path)
+            self._fh.write(data)
+            if flush or self._interval_s is None:
+                self._fh.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+                self._path = None
+
+    def _open(self, path: Path) -> None:
+        if self._fh is not None:
+            self._fh.close()
+        jsonio.ensure_dir(path.parent)
+        self._fh = open(path, "ab", buffering=LOG_BUFFER_SIZE)
+        self._path = path
+        if self._timer is None and self._interval_s is not None:
+            self._schedule()
+
+    def _is_stale(self) -> bool:
+        """Whether the open handle no longer refers to the file at self._path."""
+        st = os.fstat(self._fh.fileno())
+        if st.st_nlink == 0:
+            return True
+        try:
+            current = os.stat(self._path)
+        except FileNotFoundError:
+            return True
+        return (current.st_ino, current.st_dev) != (st.st_ino, st.st_dev)
+
+    def _schedule(self) -> None:
+        self._timer = threading.Timer(self._interval_s, self._tick)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _tick(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._fh is not None:
+                self._schedule()
+            else:
+                self._timer = None
+
+
+_LOG_WRITER = _LogWriter()
 
 
 def get_probe_history(limit: Optional[int] = None) -> list[dict]:
@@ -378,22 +624,34 @@ def get_probe_history(limit: Optional[int] = None) -> list[dict]:
     Returns:
         List of probe summary dictionaries
     """
+    _LOG_WRITER.flush()
     if not LOG_FILE.exists():
         return []
     
-    entries = []
-    with open(LOG_FILE, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-    
-    if limit:
-        entries = entries[-limit:]
+    if not limit:
+        with open(LOG_FILE, "rb") as f:
+            return _parse_log_lines(f.read().splitlines())
     
+    want = limit
+    while True:
+        lines = jsonio.tail_lines(LOG_FILE, want)
+        entries = _parse_log_lines(lines)
+        if len(entries) >= limit or len(lines) < want:
+            return entries[-limit:]
+        # Malformed lines were skipped; read further back to make up the shortfall
+        want += limit - len(entries)
+
+
+def _parse_log_lines(lines: list[bytes]) -> list[dict]:
+    """Decode audit log lines, skipping blank and malformed ones."""
+    entries = []
+    for line in lines:
+        line = line.strip()
+        if line:
+            try:
+                entries.append(jsonio.loads(line))
+            except jsonio.JSONDecodeError:
+                continue
     return entries
 
 
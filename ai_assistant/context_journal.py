@@ -1,35 +1,196 @@
 """File-based context journal for Daily AI Assistant.
 
-No vector store, no embeddings. Simple append-only JSON journal with UTC timestamps.
+No vector store, no embeddings. Simple append-only JSONL journal with UTC timestamps.
+Each entry is one JSON object per line, so appends never rewrite the file.
+
+A journal path without a suffix (the default, ``daily_context/``) is a
+directory sharded by UTC day (``2025-01-14.jsonl``), so reads bounded by
+``days`` or ``limit`` only open the most recent shards. A path with a suffix
+(e.g. ``journal.json``) is a single JSONL file.
 """
 
 from __future__ import annotations
 
-import json
+import atexit
+import io
+import mmap
 import os
 import tempfile
-from datetime import UTC, datetime
+import threading
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
-DEFAULT_JOURNAL_PATH = Path(__file__).parent.parent / "daily_context.json"
+from ai_assistant import jsonio
+
+DEFAULT_JOURNAL_PATH = Path(__file__).parent.parent / "daily_context"
+ENTRY_SEPARATOR = "\n\n---\n\n"
+SHARD_GLOB = "????-??-??.jsonl"
+
+# Journal paths already created/migrated by this process
+_INITIALIZED: set[Path] = set()
+# (path, limit, days) -> (journal signature, formatted context)
+_CONTEXT_CACHE: dict[tuple[Path, Optional[int], Optional[int]], tuple[tuple, str]] = {}
+# Persistent append-only writers, one per journal file or shard
+_WRITERS: dict[Path, JournalWriter] = {}
 
 
 def init_journal(path: Optional[str | Path] = None) -> Path:
-    """Initialize a new context journal file with [] if it does not exist.
+    """Initialize a new, empty context journal if it does not exist.
+
+    Each path is initialized once per process; repeat calls return
+    immediately without touching the filesystem. Opening a journal writer
+    clears the memo, so a removed journal is recreated. For a sharded journal the
+    directory is created, and a single-file ``<path>.json`` journal next to
+    it is split into daily shards once.
 
     Args:
-        path: Optional path to journal file. Defaults to daily_context.json in project root.
+        path: Optional journal path. Defaults to daily_context/ in project root.
 
     Returns:
-        Path to the journal file.
+        Path to the journal file or shard directory.
     """
     journal_path = Path(path) if path else DEFAULT_JOURNAL_PATH
-    if not journal_path.exists():
-        journal_path.write_text("[]", encoding="utf-8")
+    if journal_path in _INITIALIZED:
+        return journal_path
+    if _is_sharded(journal_path):
+        journal_path.mkdir(parents=True, exist_ok=True)
+        legacy = journal_path.with_suffix(".json")
+        if legacy.is_file():
+            _shard_single_file_journal(legacy, journal_path)
+        _INITIALIZED.add(journal_path)
+        return journal_path
+    try:
+        # Create-if-absent in a single syscall
+        os.close(os.open(journal_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+    except FileExistsError:
+        _migrate_legacy_journal(journal_path)
+    _INITIALIZED.add(journal_path)
     return journal_path
 
 
+def _migrate_legacy_journal(journal_path: Path) -> None:
+    """Rewrite a legacy JSON-array journal as JSONL (one-off, in place).
+
+    Journals written before the JSONL switch hold a single JSON array. Only the
+    first byte is inspected, so already-migrated journals cost one small read.
+    """
+    with open(journal_path, "rb") as f:
+        head = f.read(1)
+    if head != b"[":
+        return
+    entries = jsonio.loads(journal_path.read_bytes())
+    _atomic_write_bytes(
+        journal_path,
+        b"".join(jsonio.dumps_bytes(e) + b"\n" for e in entries),
+    )
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace path with data via a temp file in the same directory.
+
+    Readers see either the old or the new content, never a truncated file.
+    """
+    temp_fd, temp_path = tempfile.mkstemp(
+        dir=path.parent,
+        prefix="daily_context_tmp_",
+        suffix=".jsonl",
+    )
+    try:
+        with os.fdopen(temp_fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except Exception:
+        # Clean up temp file if something went wrong
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _shard_single_file_journal(legacy: Path, base: Path) -> None:
+    """Split a single-file journal into daily shards and retire the file.
+
+    Entries without a parseable ``timestamp_utc`` date stay next to their
+    neighbours: they go to the shard of the preceding dated entry (or the
+    following one, or the legacy file's modification day if none is dated).
+    Legacy entries predate anything already sharded, so they are written in
+    front of an existing shard's content, atomically.
+    """
+    by_day: dict[str, list[bytes]] = {}
+    undated: list[bytes] = []
+    day: Optional[str] = None
+    for e in read_entries(legacy):
+        line = jsonio.dumps_bytes(e) + b"\n"
+        entry_day = _entry_day(e)
+        if entry_day is not None:
+            day = entry_day
+            if undated:
+                # Leading entries without a date join the first dated day
+                by_day.setdefault(day, []).extend(undated)
+                undated.clear()
+        if day is None:
+            undated.append(line)
+        else:
+            by_day.setdefault(day, []).append(line)
+    if undated:
+        mtime_day = datetime.fromtimestamp(legacy.stat().st_mtime, UTC).date().isoformat()
+        by_day.setdefault(mtime_day, []).extend(undated)
+
+    for day, lines in by_day.items():
+        shard = base / f"{day}.jsonl"
+        try:
+            existing = shard.read_bytes()
+        except FileNotFoundError:
+            existing = b""
+        if existing and not existing.endswith(b"\n"):
+            existing += b"\n"
+        _atomic_write_bytes(shard, b"".join(lines) + existing)
+    legacy.rename(legacy.with_name(legacy.name + ".migrated"))
+
+
+def _entry_day(entry: dict) -> Optional[str]:
+    """The entry's UTC date as YYYY-MM-DD, or None if it has no usable timestamp."""
+    day = str(entry.get("timestamp_utc") or "")[:10]
+    # Extended format only, so the shard name matches SHARD_GLOB
+    if len(day) != 10 or day[4] != "-" or day[7] != "-":
+        return None
+    try:
+        date.fromisoformat(day)
+    except ValueError:
+        return None
+    return day
+
+
+def _is_sharded(journal_path: Path) -> bool:
+    return journal_path.suffix == ""
+
+
+def _shard_path_for(dt: datetime, base: Path) -> Path:
+    """Return the shard file holding entries for dt's UTC day."""
+    return base / f"{dt:%Y-%m-%d}.jsonl"
+
+
+def _cutoff_day(days: Optional[int]) -> Optional[str]:
+    """First UTC date (YYYY-MM-DD) covered by the last `days` calendar days."""
+    if days is None or days <= 0:
+        return None
+    return (datetime.now(UTC).date() - timedelta(days=days - 1)).isoformat()
+
+
+def _list_shards(base: Path, days: Optional[int] = None) -> list[Path]:
+    """Return shard files oldest-first, optionally only the last `days` days."""
+    shards = sorted(base.glob(SHARD_GLOB))
+    cutoff = _cutoff_day(days)
+    if cutoff is not None:
+        shards = [p for p in shards if p.stem >= cutoff]
+    return shards
+
+
 def add_context(
     doc_text: str,
     entry_type: str = "text",
@@ -43,7 +204,7 @@ def add_context(
         doc_text: Raw text added by the user. Must be non-empty when trimmed.
         entry_type: A simple category (e.g., "text", "email", "court_note", "phone_call", "other").
         source: Origin of the text (e.g., "user", "dashboard", "cli").
-        path: Optional path to journal file.
+        path: Optional journal path (file or shard directory).
         fact_status: Optional classification: REALISED / EVIDENCED / ALLEGED / PROSPECTIVE
 
     Raises:
@@ -60,79 +221,329 @@ def add_context(
     journal_path = Path(path) if path else DEFAULT_JOURNAL_PATH
     init_journal(journal_path)
 
+    now = datetime.now(UTC)
     entry = {
-        "timestamp_utc": datetime.now(UTC).isoformat(),
+        "timestamp_utc": now.isoformat(),
         "entry_type": entry_type,
         "source": source,
         "text": text_stripped,
         "fact_status": fact_status,
     }
 
-    # Atomic write: read current, append, write to temp, then rename
-    with open(journal_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    # Append-only JSONL: one line per entry, no read-modify-write cycle
+    _writer_for(journal_path, now).write(entry)
 
-    data.append(entry)
 
-    # Write to temp file in same directory, then rename for atomicity
-    temp_fd, temp_path = tempfile.mkstemp(
-        dir=journal_path.parent,
-        prefix="daily_context_tmp_",
-        suffix=".json",
-    )
-    try:
-        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        os.replace(temp_path, journal_path)
-    except Exception:
-        # Clean up temp file if something went wrong
+class JournalWriter:
+    """Append entries to a JSONL journal through a raw, persistent fd.
+
+    Each write is a single os.write on an O_APPEND descriptor, bypassing the
+    Python io stack. Inside ``with writer.batch():`` entries are buffered and
+    written with one os.write when the outermost batch exits; until then
+    they are not visible to readers. If the file is deleted or replaced
+    (e.g. rotated) the descriptor is reopened before the next write, so
+    entries never go to an unlinked inode.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._fd = self._open()
+        self._buf = bytearray()
+        self._batch_depth = 0
+        self._lock = threading.Lock()
+
+    def write(self, entry: dict) -> None:
+        """Append one entry, or buffer it while a batch is open."""
+        line = jsonio.dumps_bytes(entry) + b"\n"
+        with self._lock:
+            if self._batch_depth:
+                self._buf += line
+            else:
+                self._write(line)
+
+    @contextmanager
+    def batch(self) -> Iterator[JournalWriter]:
+        """Group writes into a single os.write on exit (nestable)."""
+        with self._lock:
+            self._batch_depth += 1
         try:
-            os.unlink(temp_path)
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._buf:
+                    self._write(bytes(self._buf))
+                    self._buf.clear()
+
+    @property
+    def closed(self) -> bool:
+        return self._fd < 0
+
+    def close(self) -> None:
+        """Flush any pending batch and close the descriptor."""
+        with self._lock:
+            if self._fd < 0:
+                return
+            if self._buf:
+                self._write(bytes(self._buf))
+                self._buf.clear()
+            os.close(self._fd)
+            self._fd = -1
+
+    def _open(self) -> int:
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        try:
+            return os.open(self.path, flags, 0o644)
         except FileNotFoundError:
-            pass
-        raise
+            # The shard directory was removed along with the file
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            return os.open(self.path, flags, 0o644)
+
+    def _is_stale(self) -> bool:
+        """Whether the open descriptor no longer refers to the file at self.path."""
+        st = os.fstat(self._fd)
+        if st.st_nlink == 0:
+            return True
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return True
+        return (current.st_ino, current.st_dev) != (st.st_ino, st.st_dev)
+
+    def _write(self, data: bytes) -> None:
+        """os.write data, first reopening the file if it was deleted or replaced."""
+        if self._is_stale():
+            os.close(self._fd)
+            self._fd = self._open()
+        os.write(self._fd, data)
+
+    def __enter__(self) -> JournalWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def get_journal_writer(path: Optional[str | Path] = None) -> JournalWriter:
+    """Return the process-wide JournalWriter for a journal path.
+
+    For a sharded journal this is the writer for today's shard. Use
+    ``with get_journal_writer(path).batch():`` around several add_context
+    calls to commit them with one write.
+    """
+    journal_path = Path(path) if path else DEFAULT_JOURNAL_PATH
+    init_journal(journal_path)
+    return _writer_for(journal_path, datetime.now(UTC))
 
 
-def read_entries(path: Optional[str | Path] = None) -> list[dict]:
+def _writer_for(journal_path: Path, now: datetime) -> JournalWriter:
+    target = _shard_path_for(now, journal_path) if _is_sharded(journal_path) else journal_path
+    writer = _WRITERS.get(target)
+    if writer is None or writer.closed:
+        # The journal may have been removed since it was first initialized
+        _INITIALIZED.discard(journal_path)
+        init_journal(journal_path)
+        writer = _WRITERS[target] = JournalWriter(target)
+        if _is_sharded(journal_path):
+            _retire_writers(journal_path, keep=target)
+    return writer
+
+
+def _retire_writers(base: Path, keep: Path) -> None:
+    """Close writers for earlier shards of base; only today's is appended to.
+
+    A writer with an open batch is left alone so the batch can still flush.
+    """
+    for shard in [p for p in _WRITERS if p.parent == base and p != keep]:
+        writer = _WRITERS[shard]
+        if not writer._batch_depth:
+            del _WRITERS[shard]
+            writer.close()
+
+
+@atexit.register
+def _close_writers() -> None:
+    for writer in _WRITERS.values():
+        writer.close()
+    _WRITERS.clear()
+
+
+def read_entries(
+    path: Optional[str | Path] = None,
+    days: Optional[int] = None,
+) -> list[dict]:
     """Read all entries from the journal.
 
     Args:
-        path: Optional path to journal file.
+        path: Optional journal path (file or shard directory).
+        days: Optional number of most recent UTC calendar days to include
+              (1 = today only). If None (default), includes ALL days.
 
     Returns:
-        List of entry dictionaries. Returns empty list if file doesn't exist.
+        List of entry dictionaries. Returns empty list if the journal doesn't exist.
     """
     journal_path = Path(path) if path else DEFAULT_JOURNAL_PATH
     if not journal_path.exists():
         return []
-    with open(journal_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return list(_iter_entries(journal_path, days=days))
 
 
 def get_all_context(
     path: Optional[str | Path] = None,
     limit: Optional[int] = None,
+    days: Optional[int] = None,
 ) -> str:
-    """Read the entire journal and return a single concatenated string of all entries.
+    """Read the journal and return a single concatenated string of its entries.
 
     Args:
-        path: Optional path to journal file.
+        path: Optional journal path (file or shard directory).
         limit: Optional maximum number of most recent entries to include.
                If None (default), includes ALL entries.
+        days: Optional number of most recent UTC calendar days to include.
+              For a sharded journal only those days' shards are read.
 
     Returns:
         Concatenated string of all entry texts in chronological order,
         separated by newlines. Returns empty string if no entries.
     """
-    entries = read_entries(path)
-    if not entries:
+    journal_path = Path(path) if path else DEFAULT_JOURNAL_PATH
+    signature = _journal_signature(journal_path, days)
+    if signature is None:
         return ""
 
-    if limit is not None and limit > 0:
-        entries = entries[-limit:]
+    # Unchanged journal: reuse the formatted text
+    cache_key = (journal_path, limit, days)
+    cached = _CONTEXT_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    # Stream formatted entries straight into one buffer; no intermediate list
+    buf = io.StringIO()
+    for e in _iter_entries(journal_path, limit, days):
+        if buf.tell():
+            buf.write(ENTRY_SEPARATOR)
+        buf.write(_format_entry(e))
+    text = buf.getvalue()
+    _CONTEXT_CACHE[cache_key] = (signature, text)
+    return text
+
+
+def stable_concat_context(entries: list[dict]) -> str:
+    """Concatenate entries oldest-first, formatted exactly like get_all_context.
+
+    Sorting by timestamp_utc (stable for ties) makes the output depend only
+    on the set of entries, so a later call that adds newer entries extends
+    the previous string and keeps it as a byte-identical prefix.
+
+    Args:
+        entries: Journal entry dictionaries, in any order.
+
+    Returns:
+        Entries joined by ENTRY_SEPARATOR; empty string if there are none.
+    """
+    ordered = sorted(entries, key=lambda e: e["timestamp_utc"])
+    return ENTRY_SEPARATOR.join(_format_entry(e) for e in ordered)
+
+
+def delta_since(prev: str, curr: str) -> str:
+    """Return the part of a context string added since a previous snapshot.
+
+    Args:
+        prev: Context text sent earlier (e.g. a cached prompt prefix).
+        curr: Current context text.
+
+    Returns:
+        The appended suffix without its leading separator if curr extends
+        prev, otherwise curr unchanged (history was rewritten).
+    """
+    if not prev or not curr.startswith(prev):
+        return curr
+    return curr[len(prev):].removeprefix(ENTRY_SEPARATOR)
+
+
+def _journal_signature(journal_path: Path, days: Optional[int]) -> Optional[tuple]:
+    """Cheap change-detection key: mtime+size of the file or newest shard.
+
+    Returns None if the journal does not exist. Appends only ever touch the
+    newest shard, so older shards are not stat'ed. The ``days`` cutoff is part
+    of the key, so a cached window is rebuilt once entries age out of it.
+    """
+    if not _is_sharded(journal_path):
+        try:
+            st = journal_path.stat()
+        except FileNotFoundError:
+            return None
+        return (_cutoff_day(days), st.st_mtime_ns, st.st_size)
+    if not journal_path.is_dir():
+        return None
+    shards = _list_shards(journal_path, days)
+    if not shards:
+        return ()
+    st = shards[-1].stat()
+    return (len(shards), shards[0].name, shards[-1].name, st.st_mtime_ns, st.st_size)
+
+
+def _iter_entries(
+    journal_path: Path,
+    limit: Optional[int] = None,
+    days: Optional[int] = None,
+) -> Iterator[dict]:
+    """Yield journal entries oldest-first, reading only what limit/days need."""
+    limited = limit is not None and limit > 0
+    if _is_sharded(journal_path):
+        shards = _list_shards(journal_path, days)
+        if not limited:
+            for shard in shards:
+                yield from _iter_jsonl(shard)
+            return
+        # Walk shards newest-first until enough tail lines are collected
+        lines: list[bytes] = []
+        for shard in reversed(shards):
+            lines = jsonio.tail_lines(shard, limit - len(lines)) + lines
+            if len(lines) >= limit:
+                break
+        for line in lines:
+            yield jsonio.loads(line)
+        return
+
+    with open(journal_path, "rb") as f:
+        legacy = f.read(1) == b"["
+    if legacy:
+        # JSON-array journal not yet migrated by init_journal
+        entries = _iter_legacy(journal_path)
+    elif limited and days is None:
+        entries = (jsonio.loads(line) for line in jsonio.tail_lines(journal_path, limit))
+    else:
+        entries = _iter_jsonl(journal_path)
+
+    cutoff = _cutoff_day(days)
+    if cutoff is not None:
+        entries = (e for e in entries if str(e.get("timestamp_utc", ""))[:10] >= cutoff)
+    yield from deque(entries, maxlen=limit) if limited else entries
+
+
+def _iter_legacy(journal_path: Path) -> Iterator[dict]:
+    yield from jsonio.loads(journal_path.read_bytes())
+
+
+def _iter_jsonl(journal_path: Path) -> Iterator[dict]:
+    """Yield every entry of a JSONL journal via a read-only memory map.
+
+    Pages are faulted in lazily from the OS page cache instead of being
+    copied into a Python-side read buffer.
+    """
+    with open(journal_path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap rejects zero-length files
+            return
+        with mm:
+            for line in iter(mm.readline, b""):
+                if line.strip():
+                    yield jsonio.loads(line)
 
-    def format_entry(e: dict) -> str:
-        status_tag = f" [{e.get('fact_status')}]" if e.get('fact_status') else ""
-        return f"[{e['timestamp_utc']}] [{e['entry_type']}]{status_tag} {e['text']}"
 
-    return "\n\n---\n\n".join(format_entry(e) for e in entries)
+def _format_entry(e: dict) -> str:
+    status_tag = f" [{e.get('fact_status')}]" if e.get('fact_status') else ""
+    return f"[{e['timestamp_utc']}] [{e['entry_type']}]{status_tag} {e['text']}"
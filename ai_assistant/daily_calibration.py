@@ -6,20 +6,80 @@ Uses @style source-of-truth prompt injection — prompts are loaded verbatim fro
 
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+import re
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from ai_assistant import jsonio
 from ai_assistant.prompt_loader import (
+    get_prompt_cache_key,
     get_prompt_metadata,
     interpolate_prompt,
     load_calibration_prompt,
+    load_compact_calibration_prompt,
 )
 
 
 DEFAULT_OUTPUTS_DIR = Path(__file__).parent.parent / "outputs"
 
+# Optional leading ``` / ```json fence and optional trailing ``` fence,
+# matched independently like the original startswith/endswith checks.
+_FENCE_RE = re.compile(r"\A\s*(?:```(?:json)?)?(.*?)(?:```)?\s*\Z", re.DOTALL)
+
+REQUIRED_OUTPUT_KEYS = (
+    "timestamp_utc",
+    "model_version",
+    "engine_snapshot",
+    "fact_checks",
+    "drift_detection",
+    "tripwire_calibration",
+    "settlement_corridor_check",
+    "daily_actions",
+)
+
+NARRATIVE_INDICATORS = ("I think", "In my opinion", "I believe", "should", "recommend")
+_NARRATIVE_RE = re.compile("|".join(map(re.escape, NARRATIVE_INDICATORS)))
+
+
+def _utc_compact_stamp(now: Optional[datetime] = None) -> str:
+    """UTC time as ``%Y%m%dT%H%M%S``; reads the clock without a datetime if now is None."""
+    tm = now.utctimetuple() if now is not None else time.gmtime(time.time_ns() // 1_000_000_000)
+    return (
+        f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}{tm.tm_min:02d}{tm.tm_sec:02d}"
+    )
+
+
+def _dig(node: Any, *path: str, default: Any = None) -> Any:
+    """Follow path through nested dicts, returning default at the first miss or non-dict."""
+    for key in path:
+        if not isinstance(node, dict):
+            return default
+        node = node.get(key, default)
+    return node
+
+
+def _write_bytes(filepath: Path, data: bytes) -> None:
+    """Write pre-encoded bytes to filepath, truncating any existing file."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(filepath, flags, 0o644)
+    except FileNotFoundError:
+        # Directory removed since it was cached as ensured; recreate it
+        jsonio.ensure_dir(filepath.parent, recreate=True)
+        fd = os.open(filepath, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 class DailyAICalibrator:
     """Driver for daily calibration prompting.
@@ -29,22 +89,34 @@ class DailyAICalibrator:
     
     Uses @style prompt injection: the prompt is loaded verbatim from a source
     file and interpolated with runtime context. The source file is immutable.
+    
+    Snapshots are rendered with sorted keys; callers should not rely on the
+    insertion order of engine_snapshot or assumptions_snapshot.
     """
 
     # Template version for tracking
     TEMPLATE_VERSION = "LEVQUANT_CALIBRATION_TEMPLATE_v1.0"
     PROMPT_VERSION = "v1"
+    PROMPT_CACHE_MAX = 4
 
-    def __init__(self, llm_client: Optional[Any] = None):
+    def __init__(self, llm_client: Optional[Any] = None, compact_schema: bool = False):
         """Initialize calibrator.
 
         Args:
             llm_client: Optional interface to an LLM with .query(prompt: str) -> str method.
                        If None (default), build_prompt is used for manual copy-paste.
+            compact_schema: Send the output schema example as single-line JSON
+                       to save prompt tokens. Off by default so the prompt
+                       stays verbatim for manual use.
         """
         self.llm = llm_client
+        self.compact_schema = compact_schema
         # Load the source-of-truth prompt
-        self._prompt_template = load_calibration_prompt(self.PROMPT_VERSION)
+        loader = load_compact_calibration_prompt if compact_schema else load_calibration_prompt
+        self._prompt_template = loader(self.PROMPT_VERSION)
+        # blake2b(small inputs) -> (all_context, built prompt), for reruns on
+        # unchanged state
+        self._prompt_cache: OrderedDict[bytes, tuple[str, str]] = OrderedDict()
 
     def build_prompt(
         self,
@@ -67,13 +139,32 @@ class DailyAICalibrator:
         Returns:
             Full prompt string ready for NotebookLM.
         """
-        return interpolate_prompt(
+        # Snapshots render with sorted keys, so key order must not split the cache.
+        # all_context can be large, so it is not serialised into the key; it is
+        # matched against the cached entry instead. get_all_context returns the
+        # same str object while the journal signature is unchanged, so the
+        # usual hit is an identity check.
+        key = hashlib.blake2b(
+            jsonio.dumps_bytes([new_context, engine_snapshot, assumptions_snapshot], sort_keys=True),
+            digest_size=16,
+        ).digest()
+        cached = self._prompt_cache.get(key)
+        if cached is not None and (cached[0] is all_context or cached[0] == all_context):
+            self._prompt_cache.move_to_end(key)
+            return cached[1]
+
+        prompt = interpolate_prompt(
             prompt_template=self._prompt_template,
             engine_snapshot=engine_snapshot,
             assumptions_snapshot=assumptions_snapshot,
             new_context=new_context,
             all_context=all_context,
         )
+        self._prompt_cache[key] = (all_context, prompt)
+        self._prompt_cache.move_to_end(key)
+        if len(self._prompt_cache) > self.PROMPT_CACHE_MAX:
+            self._prompt_cache.popitem(last=False)
+        return prompt
 
     def run(
         self,
@@ -84,8 +175,8 @@ class DailyAICalibrator:
     ) -> dict:
         """Run the calibration workflow.
 
-        If llm_client is provided, queries the LLM. Otherwise returns the prompt
-        for manual use.
+        If llm_client is provided, queries the LLM and checks the reply against
+        the calibration schema. Otherwise returns the prompt for manual use.
 
         Args:
             new_context: The new context added today.
@@ -94,7 +185,8 @@ class DailyAICalibrator:
             assumptions_snapshot: Current assumptions.
 
         Returns:
-            Dictionary with calibration results and/or prompt.
+            Dictionary with calibration results and/or prompt; when an LLM
+            answered, "validation_errors" lists schema problems (empty if valid).
         """
         prompt = self.build_prompt(
             all_context=all_context,
@@ -104,23 +196,29 @@ class DailyAICalibrator:
         )
 
         # Get prompt metadata for auditing
-        prompt_meta = get_prompt_metadata(self.PROMPT_VERSION)
+        prompt_meta = get_prompt_metadata(self.PROMPT_VERSION, self.compact_schema)
 
+        # One clock read shared by the report body and any output filenames
+        now = datetime.now(UTC)
         result = {
-            "date": datetime.now(UTC).isoformat(),
+            "date": now.isoformat(),
+            "stamp": _utc_compact_stamp(now),
             "new_context": new_context,
             "raw_prompt": prompt,
             "prompt_metadata": prompt_meta,
             "template_version": self.TEMPLATE_VERSION,
+            "prompt_cache_key": get_prompt_cache_key(self.PROMPT_VERSION, self.compact_schema),
             "llm_response_json": None,
+            "validation_errors": None,
             "delta_summary": None,
         }
 
         if self.llm is not None:
             try:
                 llm_output = self.llm.query(prompt)
-                parsed = parse_llm_output(llm_output)
+                parsed, errors = parse_and_validate(llm_output)
                 result["llm_response_json"] = parsed
+                result["validation_errors"] = errors
                 result["delta_summary"] = self._extract_delta_summary(parsed)
             except Exception as e:
                 result["llm_error"] = str(e)
@@ -129,14 +227,33 @@ class DailyAICalibrator:
 
     def _extract_delta_summary(self, parsed: dict) -> dict:
         """Extract a concise delta summary from parsed LLM output."""
+        actions = _dig(parsed, "daily_actions")
+        to_update = _dig(actions, "what_to_update_in_inputs")
+        watch_next = _dig(actions, "what_to_watch_next")
         return {
-            "drift_score": parsed.get("drift_detection", {}).get("drift_score", 0),
-            "corridor_alignment": parsed.get("settlement_corridor_check", {}).get("corridor_alignment", "unknown"),
-            "key_action": parsed.get("daily_actions", {}).get("what_to_update_in_inputs", [])[:1],
-            "watch_next": parsed.get("daily_actions", {}).get("what_to_watch_next", [])[:2],
+            "drift_score": _dig(parsed, "drift_detection", "drift_score", default=0),
+            "corridor_alignment": _dig(parsed, "settlement_corridor_check", "corridor_alignment", default="unknown"),
+            "key_action": to_update[:1] if isinstance(to_update, list) else [],
+            "watch_next": watch_next[:2] if isinstance(watch_next, list) else [],
         }
 
 
+class LLMJsonError(ValueError):
+    """Raised when LLM output is not valid JSON.
+
+    The message (with a 500-character preview of the output) is only built
+    when the exception is actually rendered.
+    """
+
+    def __init__(self, original: Exception, payload: str):
+        super().__init__(original, payload)
+        self.original = original
+        self.payload = payload
+
+    def __str__(self) -> str:
+        return f"LLM output is not valid JSON: {self.original}\nOutput preview: {self.payload.strip()[:500]}"
+
+
 def parse_llm_output(output: str) -> dict:
     """Safe JSON parse with fallback reporting.
 
@@ -147,26 +264,15 @@ def parse_llm_output(output: str) -> dict:
         Parsed dictionary.
 
     Raises:
-        ValueError: If output cannot be parsed as JSON.
+        LLMJsonError: If output cannot be parsed as JSON (a ValueError).
     """
-    # Try to extract JSON from markdown code blocks if present
-    cleaned = output.strip()
-
-    # Remove markdown code block markers if present
-    if cleaned.startswith("```json"):
-        cleaned = cleaned[7:]
-    elif cleaned.startswith("```"):
-        cleaned = cleaned[3:]
-
-    if cleaned.endswith("```"):
-        cleaned = cleaned[:-3]
-
-    cleaned = cleaned.strip()
+    # Extract JSON from markdown code blocks if present, in a single pass
+    body = _FENCE_RE.match(output).group(1)
 
     try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"LLM output is not valid JSON: {e}\nOutput preview: {cleaned[:500]}")
+        return jsonio.loads(body)
+    except jsonio.JSONDecodeError as e:
+        raise LLMJsonError(e, body) from e
 
 
 def validate_calibration_output(output: dict) -> tuple[bool, list[str]]:
@@ -181,18 +287,7 @@ def validate_calibration_output(output: dict) -> tuple[bool, list[str]]:
     errors = []
     
     # Check required top-level keys
-    required_keys = [
-        "timestamp_utc",
-        "model_version",
-        "engine_snapshot",
-        "fact_checks",
-        "drift_detection",
-        "tripwire_calibration",
-        "settlement_corridor_check",
-        "daily_actions",
-    ]
-    
-    for key in required_keys:
+    for key in REQUIRED_OUTPUT_KEYS:
         if key not in output:
             errors.append(f"Missing required key: {key}")
     
@@ -201,54 +296,107 @@ def validate_calibration_output(output: dict) -> tuple[bool, list[str]]:
         errors.append(f"Unexpected model_version: {output.get('model_version')}")
     
     # Check for narrative content (simple heuristic)
-    output_str = json.dumps(output)
-    narrative_indicators = ["I think", "In my opinion", "I believe", "should", "recommend"]
-    for indicator in narrative_indicators:
-        if indicator in output_str:
+    found = set()
+    for text in _iter_strings(output):
+        found.update(_NARRATIVE_RE.findall(text))
+    for indicator in NARRATIVE_INDICATORS:
+        if indicator in found:
             errors.append(f"Possible narrative content detected: '{indicator}'")
     
     return len(errors) == 0, errors
 
 
-def save_daily_report(report: dict, outputs_dir: Optional[Path] = None) -> Path:
+def parse_and_validate(output: str) -> tuple[dict, list[str]]:
+    """Parse raw LLM output and validate it against the calibration schema.
+    
+    The text is decoded once and the resulting tree is walked once for both
+    the key checks and the narrative scan.
+    
+    Args:
+        output: Raw string output from LLM.
+        
+    Returns:
+        Tuple of (parsed_output, list_of_errors); errors is empty when valid.
+        
+    Raises:
+        ValueError: If output cannot be parsed as JSON.
+    """
+    parsed = parse_llm_output(output)
+    if not isinstance(parsed, dict):
+        return parsed, [f"Expected a JSON object, got {type(parsed).__name__}"]
+    _, errors = validate_calibration_output(parsed)
+    return parsed, errors
+
+
+def _iter_strings(node: Any):
+    """Yield every string key and string leaf in a parsed JSON tree."""
+    if isinstance(node, str):
+        yield node
+    elif isinstance(node, dict):
+        for key, value in node.items():
+            if isinstance(key, str):
+                yield key
+            yield from _iter_strings(value)
+    elif isinstance(node, (list, tuple)):
+        for item in node:
+            yield from _iter_strings(item)
+
+
+def save_daily_report(
+    report: dict,
+    outputs_dir: Optional[Path] = None,
+    indent: bool = False,
+    *,
+    stamp: Optional[str] = None,
+) -> Path:
     """Save the daily calibration report with timestamp naming.
 
     Args:
         report: Dictionary containing calibration results.
         outputs_dir: Directory to save report. Defaults to outputs/.
+        indent: Pretty-print with 2-space indentation. Compact by default;
+            LEVQUANT_PRETTY=1 also enables it.
+        stamp: ``%Y%m%dT%H%M%S`` filename stamp, e.g. result["stamp"] from
+            DailyAICalibrator.run(). Defaults to the current UTC time.
 
     Returns:
         Path to saved JSON file.
     """
     out_dir = outputs_dir or DEFAULT_OUTPUTS_DIR
-    out_dir.mkdir(parents=True, exist_ok=True)
+    jsonio.ensure_dir(out_dir)
 
-    timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+    timestamp = stamp or _utc_compact_stamp()
     filename = f"daily_ai_{timestamp}.json"
     filepath = out_dir / filename
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    pretty = indent or bool(os.environ.get("LEVQUANT_PRETTY"))
+    _write_bytes(filepath, jsonio.dumps_bytes(report, pretty=pretty))
 
     return filepath
 
 
-def export_prompt_markdown(prompt: str, outputs_dir: Optional[Path] = None) -> Path:
+def export_prompt_markdown(
+    prompt: str,
+    outputs_dir: Optional[Path] = None,
+    *,
+    stamp: Optional[str] = None,
+) -> Path:
     """Export the prompt to a Markdown file for easy copy-paste.
 
     Args:
         prompt: The calibration prompt string.
         outputs_dir: Directory to save file. Defaults to outputs/.
+        stamp: ``%Y%m%dT%H%M%S`` filename stamp. Defaults to the current UTC time.
 
     Returns:
         Path to saved Markdown file.
     """
     out_dir = outputs_dir or DEFAULT_OUTPUTS_DIR
-    out_dir.mkdir(parents=True, exist_ok=True)
+    jsonio.ensure_dir(out_dir)
 
-    timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+    timestamp = stamp or _utc_compact_stamp()
     filename = f"daily_prompt_{timestamp}.md"
     filepath = out_dir / filename
 
-    filepath.write_text(prompt, encoding="utf-8")
+    _write_bytes(filepath, prompt.encode("utf-8"))
     return filepath
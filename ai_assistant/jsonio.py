@@ -0,0 +1,125 @@
+"""JSON / JSONL helpers for the Daily AI Assistant.
+
+Uses orjson when it is installed (``pip install .[fast]``) and falls back to
+the stdlib json module otherwise. For plain JSON data (str, int, finite
+float, bool, None, lists and dicts) both paths decode to the same value and
+only whitespace in compact output differs. Other values are rendered
+differently by the two backends:
+
+- datetime: orjson writes ISO 8601 (``2024-01-01T00:00:00+00:00``); the stdlib
+  path falls back to str() (``2024-01-01 00:00:00+00:00``).
+- NaN and +/-Infinity: orjson writes ``null``; the stdlib path writes the
+  non-standard tokens ``NaN`` / ``Infinity``.
+- numpy arrays: orjson writes JSON arrays; the stdlib path writes str(array).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+TAIL_BLOCK_SIZE = 65536
+
+# Output directories already created by this process (see ensure_dir)
+_ENSURED_DIRS: set[Path] = set()
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception regardless of backend.
+JSONDecodeError = json.JSONDecodeError
+
+# default=str is only invoked for values the encoder cannot handle natively
+# (orjson already covers datetime, date, UUID, enums, dataclasses and numpy),
+# so passing it costs nothing on native data. Pre-normalising snapshots in
+# Python before encoding was measured ~10x slower and is deliberately avoided.
+if orjson is not None:
+    _PRETTY_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _COMPACT_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps_pretty(obj: Any, sort_keys: bool = False) -> str:
+        """Serialize with 2-space indentation; unknown types fall back to str()."""
+        opts = _PRETTY_OPTS | orjson.OPT_SORT_KEYS if sort_keys else _PRETTY_OPTS
+        return orjson.dumps(obj, default=str, option=opts).decode("utf-8")
+
+    def dumps_line(obj: Any) -> str:
+        """Serialize to a single line suitable for JSONL (no trailing newline)."""
+        return orjson.dumps(obj, default=str, option=_COMPACT_OPTS).decode("utf-8")
+
+    def dumps_bytes(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+        """Serialize straight to UTF-8 bytes, indented only when pretty is set."""
+        opts = _PRETTY_OPTS if pretty else _COMPACT_OPTS
+        if sort_keys:
+            opts |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=opts)
+
+    def loads(data: str | bytes) -> Any:
+        """Parse a JSON document from str or bytes."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps_pretty(obj: Any, sort_keys: bool = False) -> str:
+        """Serialize with 2-space indentation; unknown types fall back to str()."""
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str, sort_keys=sort_keys)
+
+    def dumps_line(obj: Any) -> str:
+        """Serialize to a single line suitable for JSONL (no trailing newline)."""
+        return json.dumps(obj, ensure_ascii=False, default=str)
+
+    def dumps_bytes(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+        """Serialize straight to UTF-8 bytes, indented only when pretty is set."""
+        if pretty:
+            return dumps_pretty(obj, sort_keys=sort_keys).encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, default=str, sort_keys=sort_keys).encode("utf-8")
+
+    def loads(data: str | bytes) -> Any:
+        """Parse a JSON document from str or bytes."""
+        return json.loads(data)
+
+
+def ensure_dir(path: Path, recreate: bool = False) -> None:
+    """Create a directory once per process; later calls skip the mkdir syscall.
+
+    Args:
+        path: Directory to create (parents included)
+        recreate: Forget the cached result first, e.g. after an open failed
+            because the directory was removed
+    """
+    if recreate:
+        _ENSURED_DIRS.discard(path)
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def tail_lines(path: Path, n: int) -> list[bytes]:
+    """Return the last n non-empty lines of a file, reading backwards in blocks.
+
+    Cost is proportional to the bytes in those lines, not the file size.
+
+    Args:
+        path: File to read
+        n: Number of trailing lines wanted
+
+    Returns:
+        Up to n lines (without newlines), oldest first
+    """
+    lines: list[bytes] = []
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b""
+        while pos > 0 and len(lines) < n:
+            step = min(TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            parts = (f.read(step) + partial).split(b"\n")
+            # The first line may be partial until we reach the start of file
+            partial = parts.pop(0) if pos > 0 else b""
+            lines[:0] = [line.rstrip(b"\r") for line in parts if line.strip()]
+    return lines[-n:] if n > 0 else []
@@ -6,19 +6,39 @@ No trimming, no templating, no interpolation — verbatim injection.
 
 from __future__ import annotations
 
+import hashlib
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 
+from ai_assistant import jsonio
+
 
 # Source of truth prompt files
 PROMPTS_DIR: Final[Path] = Path(__file__).parent / "prompts"
 
 CALIBRATION_PROMPT_V1: Final[str] = "LEVQUANT_CALIBRATION_OUTPUT_PROMPT_v1.txt"
 
+# Every runtime placeholder lives after this marker in the template; the text
+# before it is byte-identical across runs and forms the cacheable prefix.
+DYNAMIC_MARKER: Final[str] = "{{"
+
+# The output schema example is the template's only fenced JSON block
+_SCHEMA_BLOCK_RE: Final[re.Pattern[str]] = re.compile(r"```json\n(.*?)\n```", re.DOTALL)
+
+_PLACEHOLDER_RE: Final[re.Pattern[str]] = re.compile(
+    r"\{\{(ENGINE_SNAPSHOT|ASSUMPTIONS_SNAPSHOT|NEW_CONTEXT|ALL_CONTEXT|PRESSURE_LEVEL)\}\}"
+)
 
+
+@lru_cache(maxsize=4)
 def load_calibration_prompt(version: str = "v1") -> str:
     """Load the calibration prompt by reference (@style semantics).
     
+    The source file is immutable, so it is read once per process and served
+    from memory afterwards. Call clear_prompt_cache() to force a re-read.
+    
     Args:
         version: Prompt version to load. Currently only "v1" is supported.
         
@@ -49,22 +69,52 @@ def load_calibration_prompt(version: str = "v1") -> str:
     return prompt_path.read_text(encoding="utf-8")
 
 
-def get_prompt_metadata(version: str = "v1") -> dict:
+@lru_cache(maxsize=4)
+def load_compact_calibration_prompt(version: str = "v1") -> str:
+    """Load the calibration prompt with the output schema example minified.
+    
+    Identical to load_calibration_prompt() except that the pretty-printed
+    JSON schema example is re-encoded on a single line, saving the
+    indentation tokens on every LLM call. The LLM is still asked for JSON.
+    
+    Args:
+        version: Prompt version to load.
+        
+    Returns:
+        Prompt text with a compact output schema block.
+    """
+    return _SCHEMA_BLOCK_RE.sub(
+        lambda m: f"```json\n{jsonio.dumps_line(jsonio.loads(m.group(1)))}\n```",
+        load_calibration_prompt(version),
+        count=1,
+    )
+
+
+def get_prompt_metadata(version: str = "v1", compact_schema: bool = False) -> dict:
     """Get metadata about the loaded prompt.
     
     Args:
         version: Prompt version.
+        compact_schema: Describe the compact-schema variant of the template
+            (load_compact_calibration_prompt) instead of the verbatim file.
         
     Returns:
         Dictionary with prompt metadata for auditing.
     """
+    return dict(_prompt_metadata(version, compact_schema))
+
+
+@lru_cache(maxsize=8)
+def _prompt_metadata(version: str, compact_schema: bool) -> dict:
     prompt_path = PROMPTS_DIR / CALIBRATION_PROMPT_V1
-    prompt_text = load_calibration_prompt(version)
+    loader = load_compact_calibration_prompt if compact_schema else load_calibration_prompt
+    prompt_text = loader(version)
     
     return {
         "version": version,
         "filename": CALIBRATION_PROMPT_V1,
         "path": str(prompt_path),
+        "compact_schema": compact_schema,
         "size_bytes": len(prompt_text.encode("utf-8")),
         "size_chars": len(prompt_text),
         "line_count": len(prompt_text.splitlines()),
@@ -72,6 +122,47 @@ def get_prompt_metadata(version: str = "v1") -> dict:
     }
 
 
+def static_prompt_prefix(prompt_template: str) -> str:
+    """Return the invariant leading part of a prompt template.
+    
+    The template keeps role, lexicon, questionnaire and output schema ahead of
+    the first placeholder so LLM providers can serve that prefix from their
+    prompt cache.
+    
+    Args:
+        prompt_template: Raw template from load_calibration_prompt().
+        
+    Returns:
+        Template text up to (not including) the first placeholder.
+    """
+    end = prompt_template.find(DYNAMIC_MARKER)
+    return prompt_template if end == -1 else prompt_template[:end]
+
+
+@lru_cache(maxsize=8)
+def get_prompt_cache_key(version: str = "v1", compact_schema: bool = False) -> str:
+    """SHA-256 of the static prompt prefix, stable until the template changes.
+    
+    Args:
+        version: Prompt version.
+        compact_schema: Key the compact-schema variant of the template.
+        
+    Returns:
+        Hex digest suitable for a provider's prompt_cache_key parameter.
+    """
+    loader = load_compact_calibration_prompt if compact_schema else load_calibration_prompt
+    prefix = static_prompt_prefix(loader(version))
+    return hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+
+
+def clear_prompt_cache() -> None:
+    """Drop cached prompt text and metadata (e.g. after editing a prompt in tests)."""
+    load_calibration_prompt.cache_clear()
+    load_compact_calibration_prompt.cache_clear()
+    _prompt_metadata.cache_clear()
+    get_prompt_cache_key.cache_clear()
+
+
 def interpolate_prompt(
     prompt_template: str,
     engine_snapshot: dict,
@@ -94,26 +185,28 @@ def interpolate_prompt(
     Returns:
         Interpolated prompt ready for LLM consumption.
     """
-    import json
+    if DYNAMIC_MARKER not in prompt_template:
+        return prompt_template
     
-    # Format engine snapshot as JSON
-    engine_json = json.dumps(engine_snapshot, indent=2)
-    assumptions_json = json.dumps(assumptions_snapshot, indent=2)
+    # Format snapshots as JSON with sorted keys so equal snapshots render
+    # byte-identically regardless of dict insertion order
+    engine_json = jsonio.dumps_pretty(engine_snapshot, sort_keys=True)
+    assumptions_json = jsonio.dumps_pretty(assumptions_snapshot, sort_keys=True)
     
     # Get pressure level for specific interpolation
     scores = engine_snapshot.get("scores", {})
     pressure_level = scores.get("tripwire", 0)
     
-    # Handle empty contexts
-    new_context_display = new_context.strip() if new_context.strip() else "[No new context added today]"
-    all_context_display = all_context.strip() if all_context.strip() else "[No prior context in journal]"
+    # Handle empty contexts; strip once, all_context can be large
+    new_context_display = new_context.strip() or "[No new context added today]"
+    all_context_display = all_context.strip() or "[No prior context in journal]"
     
-    # Substitute placeholders
-    result = prompt_template
-    result = result.replace("{{ENGINE_SNAPSHOT}}", f"```json\n{engine_json}\n```")
-    result = result.replace("{{ASSUMPTIONS_SNAPSHOT}}", f"```json\n{assumptions_json}\n```")
-    result = result.replace("{{NEW_CONTEXT}}", new_context_display)
-    result = result.replace("{{ALL_CONTEXT}}", all_context_display)
-    result = result.replace("{{PRESSURE_LEVEL}}", str(pressure_level))
-    
-    return result
+    # Substitute all placeholders in a single pass over the template
+    subs = {
+        "ENGINE_SNAPSHOT": f"```json\n{engine_json}\n```",
+        "ASSUMPTIONS_SNAPSHOT": f"```json\n{assumptions_json}\n```",
+        "NEW_CONTEXT": new_context_display,
+        "ALL_CONTEXT": all_context_display,
+        "PRESSURE_LEVEL": str(pressure_level),
+    }
+    return _PLACEHOLDER_RE.sub(lambda m: subs[m.group(1)], prompt_template)
@@ -15,16 +15,11 @@ Exit Codes:
 import sys
 import json
 import argparse
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Optional
 
-# Add parent directory to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from ai_assistant.context_journal import add_context, get_all_context
-from ai_assistant.daily_calibration import DailyAICalibrator, export_prompt_markdown, save_daily_report
-from ai_assistant.calibration_probe import run_calibration_probe
 from engine.state import get_current_state, load_state
 from engine.scoring import calculate_comprehensive_score
 from engine.evaluation import get_risk_assessment
@@ -32,16 +27,56 @@ from engine.interpretation import format_summary, get_full_interpretation
 
 VERSION = "1.0"
 
+# Options accepted by the default (no subcommand) engine run
+DEFAULT_COMMAND_FLAGS = frozenset({'--json', '-j'})
+
+# Reused encoder; output is identical to json.dumps(result, indent=2)
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+# Posture defaults layered over the monetary ASSUMPTIONS; CLI uses simplified posture
+ASSUMPTIONS_OVERLAY = MappingProxyType({
+    "current_posture": "NORMAL",
+    "fear_index": 0.0,
+    "kill_switches_active": (),
+})
+
+DESCRIPTION = 'Procedural Leverage Engine - Commercial dispute settlement decision support'
+CALIBRATE_DESCRIPTION = 'Run an external LLM calibration probe to detect drift, overconfidence, and assumption inflation.'
+DAILY_AI_DESCRIPTION = 'Add new context to the journal and generate a calibration prompt for NotebookLM.'
+
+EPILOG = """
+Examples:
+  python -m cli.run                    # Run engine (default)
+  python -m cli.run --json             # Machine-readable JSON output
+  python -m cli.run daily-ai --text "New email from HMRC..."
+
+Commands:
+  (no command)    Run the leverage engine
+  daily-ai        Save context and generate NotebookLM calibration prompt
+
+Output Schema (JSON mode):
+  {
+    "inputs": {"SV1a": 0.38, "SV1b": 0.86, "SV1c": 0.75},
+    "scores": {"upls": 0.641, "tripwire": 6.41},
+    "evaluation": {"decision": "HOLD", "confidence": "Moderate", "tripwire_triggered": false},
+    "interpretation": {"leverage_position": "...", "decision_explanation": "...", "tripwire_status": "...", "confidence_explanation": "..."},
+    "version": "1.0"
+  }
+"""
+
 
-def run_engine(state: Optional[Dict] = None) -> Dict:
+def run_engine(state: Optional[Dict] = None, include_interpretation: bool = True) -> Dict:
     """
     Core engine logic - testable without CLI layer.
     
     Args:
         state: Optional state dictionary. If None, uses current state from engine/state.py
+        include_interpretation: Build the plain-English interpretation block.
+            Callers that only print format_summary() can skip it.
     
     Returns:
-        Complete result dictionary with inputs, scores, evaluation, and interpretation
+        Complete result dictionary with inputs, scores, evaluation, and
+        interpretation (omitted when include_interpretation is False)
     """
     # Step 1: Load or validate state
     if state is None:
@@ -60,27 +95,56 @@ def run_engine(state: Optional[Dict] = None) -> Dict:
         scores['tripwire']
     )
     
-    # Step 4: Get interpretation
-    interpretation = get_full_interpretation(
-        scores['upls'],
-        scores['tripwire'],
-        risk_assessment['decision'],
-        risk_assessment['confidence']
-    )
-    
-    return {
+    result = {
         'inputs': state,
         'scores': scores,
         'evaluation': risk_assessment,
-        'interpretation': interpretation,
-        'version': VERSION
     }
+    
+    # Step 4: Get interpretation
+    if include_interpretation:
+        result['interpretation'] = get_full_interpretation(
+            scores['upls'],
+            scores['tripwire'],
+            risk_assessment['decision'],
+            risk_assessment['confidence']
+        )
+    
+    result['version'] = VERSION
+    return result
+
+
+def build_assumptions_snapshot() -> Dict:
+    """
+    Assumptions snapshot shared by the calibrate and daily-ai commands.
+    
+    Returns:
+        Monetary corridor ASSUMPTIONS plus the CLI's simplified posture defaults
+    """
+    # Import here to avoid circular import at module load time
+    from decision_support.monetary import ASSUMPTIONS
+    
+    return {**ASSUMPTIONS, **ASSUMPTIONS_OVERLAY}
+
+
+def add_sv_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --sv1a/--sv1b/--sv1c engine snapshot options to a subcommand parser."""
+    for name, label in (
+        ('SV1a', 'Right to Bring the Claim'),
+        ('SV1b', 'Rule-Breaking Leverage'),
+        ('SV1c', 'Cost Pressure on Them'),
+    ):
+        parser.add_argument(
+            f'--{name.lower()}',
+            type=float,
+            default=0.5,
+            help=f'{name} value ({label}) for engine snapshot (default: 0.5)'
+        )
 
 
 def cmd_calibrate(args) -> int:
     """Execute the calibrate command: run LLM Calibration Probe."""
-    from decision_support.monetary import ASSUMPTIONS
-    from ai_assistant.calibration_probe import get_probe_history
+    from ai_assistant.calibration_probe import get_probe_history, run_calibration_probe
     
     # Show history if requested
     if args.history:
@@ -108,13 +172,7 @@ def cmd_calibrate(args) -> int:
             "SV1c": args.sv1c,
         })
         
-        # Build assumptions snapshot
-        assumptions_snapshot = {
-            **ASSUMPTIONS,
-            "current_posture": "NORMAL",
-            "fear_index": 0.0,
-            "kill_switches_active": [],
-        }
+        assumptions_snapshot = build_assumptions_snapshot()
         
         # Run calibration probe (no LLM client = prompt only mode)
         result = run_calibration_probe(
@@ -150,8 +208,9 @@ def cmd_calibrate(args) -> int:
 
 def cmd_daily_ai(args) -> int:
     """Execute the daily-ai command: save context and generate calibration prompt."""
-    # Import here to avoid circular import at module load time
-    from decision_support.monetary import ASSUMPTIONS
+    # Import here so the default engine command does not load the AI assistant
+    from ai_assistant.context_journal import ENTRY_SEPARATOR, add_context, get_all_context
+    from ai_assistant.daily_calibration import DailyAICalibrator, export_prompt_markdown, save_daily_report
 
     try:
         # Add new context to journal
@@ -172,13 +231,7 @@ def cmd_daily_ai(args) -> int:
             "SV1c": args.sv1c,
         })
 
-        # Build assumptions snapshot
-        assumptions_snapshot = {
-            **ASSUMPTIONS,
-            "current_posture": "NORMAL",  # Default; CLI uses simplified posture
-            "fear_index": 0.0,
-            "kill_switches_active": [],
-        }
+        assumptions_snapshot = build_assumptions_snapshot()
 
         # Build and run calibration
         calibrator = DailyAICalibrator(llm_client=None)
@@ -191,12 +244,14 @@ def cmd_daily_ai(args) -> int:
 
         # Save report
         outputs_dir = Path(__file__).parent.parent / "outputs"
-        report_path = save_daily_report(result, outputs_dir=outputs_dir)
+        report_path = save_daily_report(result, outputs_dir=outputs_dir, stamp=result["stamp"])
         print(f"✓ Report saved: {report_path}")
 
         # Optionally export prompt as markdown
         if args.export_md:
-            md_path = export_prompt_markdown(result["raw_prompt"], outputs_dir=outputs_dir)
+            md_path = export_prompt_markdown(
+                result["raw_prompt"], outputs_dir=outputs_dir, stamp=result["stamp"]
+            )
             print(f"✓ Prompt exported: {md_path}")
 
         # Print prompt to stdout
@@ -211,7 +266,7 @@ def cmd_daily_ai(args) -> int:
         print("\nCalibration Summary:")
         print(f"  Date: {result['date']}")
         print(f"  New context length: {len(args.text)} chars")
-        print(f"  Total context entries: {len(all_context.split('---')) if all_context else 0}")
+        print(f"  Total context entries: {all_context.count(ENTRY_SEPARATOR) + 1 if all_context else 0}")
         print(f"  Engine UPLS: {engine_result['scores']['upls']:.3f}")
         print(f"  Engine Tripwire: {engine_result['scores']['tripwire']:.2f}")
 
@@ -222,42 +277,18 @@ def cmd_daily_ai(args) -> int:
         return 1
 
 
-def main(argv: Optional[list] = None) -> int:
+@lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
     """
-    Main CLI entry point.
-    
-    Args:
-        argv: Optional argument list (for testing). If None, uses sys.argv.
+    Build the full CLI parser with all subcommands (once per process).
     
     Returns:
-        Exit code (0 for success, 1 for error)
+        Configured argument parser
     """
-    # Parse arguments
-    if argv is None:
-        argv = sys.argv[1:]
-    
     parser = argparse.ArgumentParser(
-        description='Procedural Leverage Engine - Commercial dispute settlement decision support',
+        description=DESCRIPTION,
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python -m cli.run                    # Run engine (default)
-  python -m cli.run --json             # Machine-readable JSON output
-  python -m cli.run daily-ai --text "New email from HMRC..."
-
-Commands:
-  (no command)    Run the leverage engine
-  daily-ai        Save context and generate NotebookLM calibration prompt
-
-Output Schema (JSON mode):
-  {
-    "inputs": {"SV1a": 0.38, "SV1b": 0.86, "SV1c": 0.75},
-    "scores": {"upls": 0.641, "tripwire": 6.41},
-    "evaluation": {"decision": "HOLD", "confidence": "Moderate", "tripwire_triggered": false},
-    "interpretation": {"leverage_position": "...", "decision_explanation": "...", "tripwire_status": "...", "confidence_explanation": "..."},
-    "version": "1.0"
-  }
-"""
+        epilog=EPILOG
     )
     
     parser.add_argument(
@@ -273,26 +304,9 @@ Output Schema (JSON mode):
     calibrate_parser = subparsers.add_parser(
         'calibrate',
         help='Run LLM Calibration Probe for independent assessment',
-        description='Run an external LLM calibration probe to detect drift, overconfidence, and assumption inflation.'
-    )
-    calibrate_parser.add_argument(
-        '--sv1a',
-        type=float,
-        default=0.5,
-        help='SV1a value (Right to Bring the Claim) for engine snapshot (default: 0.5)'
-    )
-    calibrate_parser.add_argument(
-        '--sv1b',
-        type=float,
-        default=0.5,
-        help='SV1b value (Rule-Breaking Leverage) for engine snapshot (default: 0.5)'
-    )
-    calibrate_parser.add_argument(
-        '--sv1c',
-        type=float,
-        default=0.5,
-        help='SV1c value (Cost Pressure on Them) for engine snapshot (default: 0.5)'
+        description=CALIBRATE_DESCRIPTION
     )
+    add_sv_arguments(calibrate_parser)
     calibrate_parser.add_argument(
         '--print-prompt', '-p',
         action='store_true',
@@ -308,7 +322,7 @@ Output Schema (JSON mode):
     daily_ai_parser = subparsers.add_parser(
         'daily-ai',
         help='Save context and generate NotebookLM calibration prompt',
-        description='Add new context to the journal and generate a calibration prompt for NotebookLM.'
+        description=DAILY_AI_DESCRIPTION
     )
     daily_ai_parser.add_argument(
         '--text', '-t',
@@ -321,24 +335,7 @@ Output Schema (JSON mode):
         choices=['text', 'email', 'court_note', 'phone_call', 'other'],
         help='Type of context entry (default: text)'
     )
-    daily_ai_parser.add_argument(
-        '--sv1a',
-        type=float,
-        default=0.5,
-        help='SV1a value (Right to Bring the Claim) for engine snapshot (default: 0.5)'
-    )
-    daily_ai_parser.add_argument(
-        '--sv1b',
-        type=float,
-        default=0.5,
-        help='SV1b value (Rule-Breaking Leverage) for engine snapshot (default: 0.5)'
-    )
-    daily_ai_parser.add_argument(
-        '--sv1c',
-        type=float,
-        default=0.5,
-        help='SV1c value (Cost Pressure on Them) for engine snapshot (default: 0.5)'
-    )
+    add_sv_arguments(daily_ai_parser)
     daily_ai_parser.add_argument(
         '--limit', '-l',
         type=int,
@@ -356,24 +353,31 @@ Output Schema (JSON mode):
         help='Print generated prompt to stdout'
     )
     
-    args = parser.parse_args(argv)
-    
-    # Route to appropriate command
-    if args.command == 'daily-ai':
-        return cmd_daily_ai(args)
+    return parser
+
+
+def run_default(json_mode: bool = False) -> int:
+    """
+    Run the engine on current state and print the result.
     
-    if args.command == 'calibrate':
-        return cmd_calibrate(args)
+    Args:
+        json_mode: Print machine-readable JSON instead of the summary
     
-    # Default: run engine
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
     try:
-        result = run_engine()
+        # The human summary does not use the interpretation prose
+        result = run_engine(include_interpretation=json_mode)
         
         # Output
-        if args.json:
-            # JSON mode: machine-readable output
-            json_output = json.dumps(result, indent=2)
-            print(json_output)
+        if json_mode:
+            # JSON mode: machine-readable output, streamed in chunks like
+            # json.dump (indented encoding is pure Python either way)
+            write = sys.stdout.write
+            for chunk in _JSON_ENCODER.iterencode(result):
+                write(chunk)
+            write("\n")
         else:
             # Human-readable mode: formatted summary
             summary = format_summary(
@@ -391,5 +395,37 @@ Output Schema (JSON mode):
         return 1
 
 
+def main(argv: Optional[list] = None) -> int:
+    """
+    Main CLI entry point.
+    
+    Args:
+        argv: Optional argument list (for testing). If None, uses sys.argv.
+    
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    # Parse arguments
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Fast path: the default command only takes --json, so skip building
+    # the subcommand parsers unless something else was passed
+    if all(arg in DEFAULT_COMMAND_FLAGS for arg in argv):
+        return run_default(json_mode=bool(argv))
+    
+    args = build_parser().parse_args(argv)
+    
+    # Route to appropriate command
+    if args.command == 'daily-ai':
+        return cmd_daily_ai(args)
+    
+    if args.command == 'calibrate':
+        return cmd_calibrate(args)
+    
+    # Default: run engine
+    return run_default(json_mode=args.json)
+
+
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
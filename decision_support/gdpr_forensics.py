@@ -6,12 +6,30 @@ Uses "potential exposure indicators" not absolute criminal assertions.
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import UTC, datetime
+from types import MappingProxyType
 from typing import Optional
 
+import numpy as np
+
+
+# Reused encoder; byte-identical to json.dumps(obj, sort_keys=True)
+_canonical_json = json.JSONEncoder(sort_keys=True).encode
+
+# Lower bounds of each risk band above LOW; bisect_right picks the band
+_RISK_THRESHOLDS = (20, 40, 60, 80)
+_RISK_LABELS = (
+    "LOW - Limited exposure indicators",
+    "ELEVATED - Some exposure indicators",
+    "MODERATE - Multiple exposure indicators present",
+    "HIGH - Elevated exposure indicators",
+    "CRITICAL - Immediate assessment required",
+)
+
 
 @dataclass
 class ForensicAssumptions:
@@ -26,20 +44,47 @@ class ForensicAssumptions:
     )
 
 
+@dataclass(slots=True)
+class IntegrityRiskResult:
+    """Court-safe integrity risk record returned by calculate_integrity_risk."""
+    timestamp_utc: str
+    audit_hash: str
+    model_version: str
+    assumptions: dict
+    integrity_risk: dict
+    statutory_exposures: list  # read-only MappingProxyType records
+    ico_reportable: bool
+    ico_reportability_note: str
+    insurer_impact: dict
+    court_safe_summary: str
+    disclaimer: str
+    
+    def to_dict(self) -> dict:
+        """Return the record as a plain JSON-serialisable dict."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["statutory_exposures"] = [dict(e) for e in self.statutory_exposures]
+        return data
+
+
 class GDPRForensics:
     """GDPR forensic analysis for data integrity risk.
     
     Court-safe language: "potential exposure indicators" not "proven violations".
     """
     
-    # Risk scoring weights
-    RISK_WEIGHTS = {
+    # Risk scoring weights (read-only; results carry a copy)
+    RISK_WEIGHTS = MappingProxyType({
         "sar_gap_proven": 25,
         "manual_override_proven": 35,
         "special_category_involved": 20,
         "shadow_data_discovered": 15,
         "systemic_pattern": 15,
-    }
+    })
+    # (indicator, weight) in calculate_integrity_risk argument order
+    _INDICATORS = tuple(RISK_WEIGHTS.items())
+    _WEIGHT_VECTOR = np.fromiter(RISK_WEIGHTS.values(), dtype=np.int64)
+    _MASK_BITS = np.left_shift(1, np.arange(len(RISK_WEIGHTS), dtype=np.int64))
+    _DISPLAY_NAMES = MappingProxyType({name: name.replace("_", " ") for name in RISK_WEIGHTS})
     
     # Court-safe statutory liability descriptions
     STATUTORY_EXPOSURES = {
@@ -51,6 +96,36 @@ class GDPRForensics:
         "article_15": "Potential Article 15 access right indicator",
     }
     
+    # Exposure records per trigger, expanded once at class definition and
+    # shared read-only by every result
+    _EXPOSURE_DPA173 = MappingProxyType({
+        "statute": "DPA 2018", "section": "s.173",
+        "description": STATUTORY_EXPOSURES["dpa_173"], "severity": "high",
+    })
+    _EXPOSURE_COMPUTER_MISUSE = MappingProxyType({
+        "statute": "Computer Misuse Act", "section": "s.1-3",
+        "description": STATUTORY_EXPOSURES["computer_misuse"], "severity": "high",
+    })
+    _EXPOSURE_ARTICLE_5 = MappingProxyType({
+        "statute": "UK GDPR", "section": "Article 5(1)(d)",
+        "description": STATUTORY_EXPOSURES["article_5"], "severity": "moderate",
+    })
+    _EXPOSURE_ARTICLE_12 = MappingProxyType({
+        "statute": "UK GDPR", "section": "Article 12(3)",
+        "description": STATUTORY_EXPOSURES["article_12"], "severity": "moderate",
+    })
+    _EXPOSURE_ARTICLE_15 = MappingProxyType({
+        "statute": "UK GDPR", "section": "Article 15",
+        "description": STATUTORY_EXPOSURES["article_15"], "severity": "moderate",
+    })
+    _EXPOSURE_ARTICLE_9 = MappingProxyType({
+        "statute": "UK GDPR", "section": "Article 9",
+        "description": STATUTORY_EXPOSURES["article_9"], "severity": "high",
+    })
+    _MANUAL_OVERRIDE_EXPOSURES = (_EXPOSURE_DPA173, _EXPOSURE_COMPUTER_MISUSE)
+    _SAR_GAP_EXPOSURES = (_EXPOSURE_ARTICLE_5, _EXPOSURE_ARTICLE_12, _EXPOSURE_ARTICLE_15)
+    _SPECIAL_CATEGORY_EXPOSURES = (_EXPOSURE_ARTICLE_9,)
+    
     def __init__(self, assumptions: Optional[ForensicAssumptions] = None):
         self.assumptions = assumptions or ForensicAssumptions()
     
@@ -61,7 +136,7 @@ class GDPRForensics:
         special_category_involved: bool = True,
         shadow_data_discovered: bool = True,
         systemic_pattern: bool = True,
-    ) -> dict:
+    ) -> IntegrityRiskResult:
         """Calculate data integrity risk score.
         
         Args:
@@ -72,40 +147,36 @@ class GDPRForensics:
             systemic_pattern: Pattern suggests systemic issue
             
         Returns:
-            Integrity risk analysis with court-safe language
+            IntegrityRiskResult with court-safe language; use to_dict()
+            for JSON output
         """
         # Calculate risk score
+        flags = (
+            sar_gap_proven,
+            manual_override_proven,
+            special_category_involved,
+            shadow_data_discovered,
+            systemic_pattern,
+        )
         risk_score = 0
         triggered_indicators = []
+        for (indicator, weight), flag in zip(self._INDICATORS, flags, strict=True):
+            if flag:
+                risk_score += weight
+                triggered_indicators.append(indicator)
         
-        if sar_gap_proven:
-            risk_score += self.RISK_WEIGHTS["sar_gap_proven"]
-            triggered_indicators.append("sar_gap_proven")
-        
-        if manual_override_proven:
-            risk_score += self.RISK_WEIGHTS["manual_override_proven"]
-            triggered_indicators.append("manual_override_proven")
-        
-        if special_category_involved:
-            risk_score += self.RISK_WEIGHTS["special_category_involved"]
-            triggered_indicators.append("special_category_involved")
-        
-        if shadow_data_discovered:
-            risk_score += self.RISK_WEIGHTS["shadow_data_discovered"]
-            triggered_indicators.append("shadow_data_discovered")
-        
-        if systemic_pattern:
-            risk_score += self.RISK_WEIGHTS["systemic_pattern"]
-            triggered_indicators.append("systemic_pattern")
-        
-        # Cap at 100
+        # Cap at 100 (all five weights sum to 110)
         risk_score = min(100, risk_score)
+        risk_level = self._categorize_risk(risk_score)
         
         # Determine statutory exposures
         statutory_exposures = self._identify_statutory_exposures(
             sar_gap_proven, manual_override_proven, special_category_involved
         )
         
+        # One timestamp for both the audit hash and the reported result
+        timestamp = datetime.now(UTC).isoformat()
+        
         # Generate audit hash
         audit_data = {
             "sar_gap": sar_gap_proven,
@@ -114,105 +185,103 @@ class GDPRForensics:
             "shadow_data": shadow_data_discovered,
             "systemic": systemic_pattern,
             "score": risk_score,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": timestamp,
         }
         audit_hash = hashlib.sha256(
-            json.dumps(audit_data, sort_keys=True).encode()
+            _canonical_json(audit_data).encode()
         ).hexdigest()[:16]
         
-        return {
-            "timestamp_utc": datetime.now(UTC).isoformat(),
-            "audit_hash": audit_hash,
-            "model_version": self.assumptions.model_version,
-            "assumptions": {
+        return IntegrityRiskResult(
+            timestamp_utc=timestamp,
+            audit_hash=audit_hash,
+            model_version=self.assumptions.model_version,
+            assumptions={
                 "sar_gap_proven": sar_gap_proven,
                 "manual_override_proven": manual_override_proven,
                 "special_category_involved": special_category_involved,
                 "shadow_data_discovered": shadow_data_discovered,
                 "systemic_pattern": systemic_pattern,
-                "risk_weights": self.RISK_WEIGHTS,
+                "risk_weights": dict(self.RISK_WEIGHTS),
             },
-            "integrity_risk": {
+            integrity_risk={
                 "risk_score": risk_score,
-                "risk_level": self._categorize_risk(risk_score),
+                "risk_level": risk_level,
                 "triggered_indicators": triggered_indicators,
             },
-            "statutory_exposures": statutory_exposures,
-            "ico_reportable": risk_score >= 50,
-            "ico_reportability_note": (
+            statutory_exposures=statutory_exposures,
+            ico_reportable=risk_score >= 50,
+            ico_reportability_note=(
                 "Likely reportable to ICO" if risk_score >= 50 
                 else "Assessment required for reportability"
             ),
-            "insurer_impact": self._assess_insurer_impact(risk_score, manual_override_proven),
-            "court_safe_summary": self._generate_summary(risk_score, triggered_indicators),
-            "disclaimer": self.assumptions.disclaimer,
-        }
+            insurer_impact=self._assess_insurer_impact(risk_score, manual_override_proven),
+            court_safe_summary=self._generate_summary(risk_level, triggered_indicators),
+            disclaimer=self.assumptions.disclaimer,
+        )
+    
+    def calculate_integrity_risk_batch(self, flags: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Score many indicator combinations at once for scenario sweeps.
+        
+        Only the numeric core of calculate_integrity_risk: no timestamps,
+        audit hashes or narrative. Call the scalar method for rows that need
+        a full court-safe record.
+        
+        Args:
+            flags: (N, 5) boolean array, columns in RISK_WEIGHTS order
+                (sar_gap_proven, manual_override_proven, special_category_involved,
+                shadow_data_discovered, systemic_pattern)
+            
+        Returns:
+            Tuple of (risk_scores, indicator_masks), each an (N,) int64 array.
+            Scores are capped at 100; bit j of a mask is set when column j is.
+            
+        Raises:
+            TypeError: If flags are neither boolean nor integer (e.g. floats
+                or strings, which would otherwise all coerce to True)
+            ValueError: If flags is not two-dimensional with 5 columns, or
+                integer flags hold values other than 0 and 1
+        """
+        flags = np.asarray(flags)
+        if flags.ndim != 2 or flags.shape[1] != len(self._INDICATORS):
+            raise ValueError(
+                f"flags must have shape (N, {len(self._INDICATORS)}), got {flags.shape}"
+            )
+        if flags.dtype.kind in "iu":
+            if flags.size and not (0 <= flags.min() and flags.max() <= 1):
+                raise ValueError("integer flags must be 0 or 1")
+        elif flags.dtype.kind != "b":
+            raise TypeError(f"flags must be a boolean array, got dtype {flags.dtype}")
+        
+        as_int = flags.astype(np.int64)
+        risk_scores = np.minimum(as_int @ self._WEIGHT_VECTOR, 100)
+        indicator_masks = as_int @ self._MASK_BITS
+        return risk_scores, indicator_masks
     
     def _identify_statutory_exposures(
         self,
         sar_gap_proven: bool,
         manual_override_proven: bool,
         special_category_involved: bool,
-    ) -> list[dict]:
-        """Identify potential statutory exposures with court-safe language."""
+    ) -> list[MappingProxyType]:
+        """Identify potential statutory exposures with court-safe language.
+        
+        Returns shared read-only records; callers that annotate one must
+        dict() it first.
+        """
         exposures = []
         
         if manual_override_proven:
-            exposures.append({
-                "statute": "DPA 2018",
-                "section": "s.173",
-                "description": self.STATUTORY_EXPOSURES["dpa_173"],
-                "severity": "high",
-            })
-            exposures.append({
-                "statute": "Computer Misuse Act",
-                "section": "s.1-3",
-                "description": self.STATUTORY_EXPOSURES["computer_misuse"],
-                "severity": "high",
-            })
-        
+            exposures.extend(self._MANUAL_OVERRIDE_EXPOSURES)
         if sar_gap_proven:
-            exposures.append({
-                "statute": "UK GDPR",
-                "section": "Article 5(1)(d)",
-                "description": self.STATUTORY_EXPOSURES["article_5"],
-                "severity": "moderate",
-            })
-            exposures.append({
-                "statute": "UK GDPR",
-                "section": "Article 12(3)",
-                "description": self.STATUTORY_EXPOSURES["article_12"],
-                "severity": "moderate",
-            })
-            exposures.append({
-                "statute": "UK GDPR",
-                "section": "Article 15",
-                "description": self.STATUTORY_EXPOSURES["article_15"],
-                "severity": "moderate",
-            })
-        
+            exposures.extend(self._SAR_GAP_EXPOSURES)
         if special_category_involved:
-            exposures.append({
-                "statute": "UK GDPR",
-                "section": "Article 9",
-                "description": self.STATUTORY_EXPOSURES["article_9"],
-                "severity": "high",
-            })
+            exposures.extend(self._SPECIAL_CATEGORY_EXPOSURES)
         
         return exposures
     
     def _categorize_risk(self, score: int) -> str:
         """Categorize risk level."""
-        if score >= 80:
-            return "CRITICAL - Immediate assessment required"
-        elif score >= 60:
-            return "HIGH - Elevated exposure indicators"
-        elif score >= 40:
-            return "MODERATE - Multiple exposure indicators present"
-        elif score >= 20:
-            return "ELEVATED - Some exposure indicators"
-        else:
-            return "LOW - Limited exposure indicators"
+        return _RISK_LABELS[bisect.bisect_right(_RISK_THRESHOLDS, score)]
     
     def _assess_insurer_impact(self, risk_score: int, manual_override: bool) -> dict:
         """Assess impact on insurance coverage."""
@@ -238,17 +307,15 @@ class GDPRForensics:
                 "recommendation": "Standard notification procedures",
             }
     
-    def _generate_summary(self, score: int, indicators: list[str]) -> str:
-        """Generate court-safe summary."""
-        level = self._categorize_risk(score)
-        
+    def _generate_summary(self, level: str, indicators: list[str]) -> str:
+        """Generate court-safe summary for an already categorized risk level."""
         if not indicators:
             return (
                 "Limited data integrity exposure indicators identified. "
                 "Standard data protection compliance measures appear adequate."
             )
         
-        indicator_text = ", ".join(ind.replace("_", " ") for ind in indicators[:3])
+        indicator_text = ", ".join(self._DISPLAY_NAMES[ind] for ind in indicators[:3])
         
         return (
             f"Data integrity assessment indicates {level.lower()}. "
@@ -266,4 +333,4 @@ def quick_integrity_check(
     return forensics.calculate_integrity_risk(
         sar_gap_proven=sar_gap_proven,
         manual_override_proven=manual_override_proven,
-    )
+    ).to_dict()
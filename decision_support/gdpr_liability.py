@@ -6,13 +6,98 @@ post-DSAR refusal.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, List
+import functools
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Callable, Iterator, List, Optional, TypeVar
 
+import numpy as np
 
-@dataclass
+
+# Date stamped on every exposure report
+ANALYSIS_DATE = "2026-02-08"
+
+# Column layout for GdprLiabilityPricer.batch_report inputs
+CONTROLLER_DTYPE = np.dtype([
+    ("annual_turnover_gbp", np.float64),
+    ("data_subjects_affected", np.int64),
+    ("special_category_data", np.bool_),
+    ("dsar_refused", np.bool_),
+    ("shadow_data_discovered", np.bool_),
+])
+
+# Row layout returned by GdprLiabilityPricer.batch_report
+REPORT_DTYPE = np.dtype([
+    ("distress_index", np.int8),       # index into DISTRESS_RANGES order
+    ("total_exposure_low", np.float64),
+    ("total_exposure_high", np.float64),
+    ("violations", np.int8),
+    ("fine_band_index", np.int8),      # index into FINE_BANDS order
+    ("max_fine_calculated", np.float64),
+    ("shadow_multiplier", np.float64), # 0.0 when no DSAR refusal
+    ("shadow_adjusted_exposure", np.float64),
+    ("compensatory_low", np.float64),
+    ("compensatory_high", np.float64),
+    ("combined_maximum_exposure", np.float64),
+])
+
+
+# Fine band index per violation count (0..4): minor, minor, moderate, moderate, serious
+_FINE_BAND_BY_VIOLATIONS = (0, 0, 1, 1, 2)
+
+
+def _derive_flag_state(
+    special: bool, dsar: bool, shadow: bool
+) -> tuple[int, int, int, float, Optional[str]]:
+    """Every flag-dependent value for one controller state.
+    
+    Returns:
+        (distress_index, violations, fine_band_index, shadow_multiplier,
+        shadow_risk_level); the multiplier is 0.0 and the level None when
+        there was no DSAR refusal
+    """
+    distress = special * 2 + dsar  # low / moderate / high / severe
+    # Article 12(3) + Article 15, Article 9 processing, Article 5(1)(d) accuracy
+    violations = dsar * 2 + special + shadow
+    if not dsar:
+        multiplier, level = 0.0, None
+    elif special:
+        multiplier, level = 3.0, "CRITICAL"  # Special category under Article 9
+    elif shadow:
+        multiplier, level = 2.5, "HIGH"
+    else:
+        multiplier, level = 1.5, "ELEVATED"
+    return distress, violations, _FINE_BAND_BY_VIOLATIONS[violations], multiplier, level
+
+
+def _flag_state(special: bool, dsar: bool, shadow: bool) -> int:
+    """3-bit state index: special << 2 | dsar << 1 | shadow.
+    
+    Flags are coerced with bool() so truthy non-bool values (e.g. 2) still
+    index one of the 8 states.
+    """
+    return bool(special) << 2 | bool(dsar) << 1 | bool(shadow)
+
+
+# All 8 flag states, derived once: Python rows for the scalar methods and a
+# structured array for batch_report
+_STATE_ROWS = tuple(
+    _derive_flag_state(bool(state & 4), bool(state & 2), bool(state & 1))
+    for state in range(8)
+)
+_STATE_TABLE = np.array(
+    [row[:4] for row in _STATE_ROWS],
+    dtype=[
+        ("distress", np.int8),
+        ("violations", np.int8),
+        ("band", np.int8),
+        ("shadow_mult", np.float64),
+    ],
+)
+
+@dataclass(frozen=True, slots=True)
 class DataControllerExposure:
-    """Exposure configuration for a data controller."""
+    """Exposure configuration for a data controller (immutable, hashable)."""
     controller_name: str
     annual_turnover_gbp: float
     data_subjects_affected: int
@@ -21,6 +106,154 @@ class DataControllerExposure:
     shadow_data_discovered: bool
 
 
+def _flat_result_dict(result: object) -> dict:
+    """Shallow dict of a slotted result whose fields are all scalars or strings.
+    
+    Equivalent to dataclasses.asdict for these records without its recursive
+    deep copy; __slots__ lists the fields in declaration order.
+    """
+    return {name: getattr(result, name) for name in result.__slots__}
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Article82Result:
+    """Article 82 non-material distress damages exposure."""
+    article: str = "Article 82 UK GDPR"
+    legal_basis: str = "Right to compensation for material/non-material damage"
+    data_subjects: int
+    distress_level: str
+    per_subject_range: str
+    total_exposure_low: int
+    total_exposure_high: int
+    notes: str = "Distress damages for unlawful processing and DSAR refusal"
+    
+    def to_dict(self) -> dict:
+        """Return the result as a plain JSON-serialisable dict."""
+        return _flat_result_dict(self)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class IcoFineResult:
+    """ICO administrative fine exposure."""
+    regulator: str = "Information Commissioner's Office (ICO)"
+    legal_basis: str = "Article 83(5) UK GDPR - Administrative fines"
+    annual_turnover: float
+    fine_band: str
+    violations_identified: int
+    max_fine_calculated: float
+    fine_percentage: str
+    notes: str = "Fine for unlawful processing and failure to comply with DSAR"
+    
+    def to_dict(self) -> dict:
+        """Return the result as a plain JSON-serialisable dict."""
+        return _flat_result_dict(self)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ShadowDataResult:
+    """Shadow data discovery risk; only risk_present and notes apply without a DSAR refusal."""
+    risk_present: bool
+    risk_level: Optional[str] = None
+    legal_basis: Optional[str] = None
+    base_exposure: int = 0
+    adjusted_exposure: float = 0.0
+    multiplier: float = 0.0
+    special_category_involved: bool = False
+    notes: str
+    
+    def to_dict(self) -> dict:
+        """Return the result as a plain JSON-serialisable dict."""
+        if not self.risk_present:
+            return {"risk_present": False, "notes": self.notes}
+        return _flat_result_dict(self)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TotalExposureReport:
+    """Complete GDPR liability analysis for one controller."""
+    controller: str
+    analysis_date: str
+    article_82_exposure: Article82Result
+    ico_fine_exposure: IcoFineResult
+    shadow_data_risk: ShadowDataResult
+    total_compensatory_low: float
+    total_compensatory_high: float
+    regulatory_fine_exposure: float
+    combined_maximum_exposure: float
+    tactical_insights: tuple[str, ...]
+    
+    def to_dict(self) -> dict:
+        """Return the report as a plain JSON-serialisable dict."""
+        return {
+            "controller": self.controller,
+            "analysis_date": self.analysis_date,
+            "article_82_exposure": self.article_82_exposure.to_dict(),
+            "ico_fine_exposure": self.ico_fine_exposure.to_dict(),
+            "shadow_data_risk": self.shadow_data_risk.to_dict(),
+            "total_compensatory_exposure": {
+                "low": self.total_compensatory_low,
+                "high": self.total_compensatory_high,
+            },
+            "regulatory_fine_exposure": self.regulatory_fine_exposure,
+            "combined_maximum_exposure": self.combined_maximum_exposure,
+            "tactical_insights": list(self.tactical_insights),
+        }
+    
+    def to_flat_dict(self) -> dict:
+        """Return a single-level record with dotted keys for bulk export.
+        
+        Every report has the same keys in the same order (shadow-data fields
+        are present even without a DSAR refusal), so records can be written
+        straight to CSV/Parquet columns. Insights are newline-joined.
+        """
+        record = {"controller": self.controller, "analysis_date": self.analysis_date}
+        for keys, result in (
+            (_ARTICLE_82_FLAT_KEYS, self.article_82_exposure),
+            (_ICO_FINE_FLAT_KEYS, self.ico_fine_exposure),
+            (_SHADOW_DATA_FLAT_KEYS, self.shadow_data_risk),
+        ):
+            record.update((key, getattr(result, name)) for key, name in keys)
+        record["total_compensatory.low"] = self.total_compensatory_low
+        record["total_compensatory.high"] = self.total_compensatory_high
+        record["regulatory_fine_exposure"] = self.regulatory_fine_exposure
+        record["combined_maximum_exposure"] = self.combined_maximum_exposure
+        record["tactical_insights"] = "\n".join(self.tactical_insights)
+        return record
+
+
+# (dotted column, field name) pairs for TotalExposureReport.to_flat_dict
+_ARTICLE_82_FLAT_KEYS = tuple((f"article_82.{f.name}", f.name) for f in fields(Article82Result))
+_ICO_FINE_FLAT_KEYS = tuple((f"ico_fine.{f.name}", f.name) for f in fields(IcoFineResult))
+_SHADOW_DATA_FLAT_KEYS = tuple((f"shadow_data.{f.name}", f.name) for f in fields(ShadowDataResult))
+
+# Identical for every controller without a DSAR refusal, and immutable
+_NO_SHADOW_RISK = ShadowDataResult(
+    risk_present=False,
+    notes="No DSAR refusal - standard data mapping applies",
+)
+
+_R = TypeVar("_R")
+
+
+def _memoized_report(method: Callable[[GdprLiabilityPricer], _R]) -> Callable[[GdprLiabilityPricer], _R]:
+    """Build a report once per controller; results are frozen, so share them."""
+    name = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self: GdprLiabilityPricer) -> _R:
+        # The controller is frozen, so reports only go stale if it is replaced
+        if self._memo_controller is not self.controller:
+            self._memo_controller = self.controller
+            self._memo = {}
+        try:
+            report = self._memo[name]
+        except KeyError:
+            report = self._memo[name] = method(self)
+        return report
+    
+    return wrapper
+
+
 class GdprLiabilityPricer:
     """Prices GDPR liability exposure under UK GDPR and Data Protection Act 2018.
     
@@ -30,25 +263,46 @@ class GdprLiabilityPricer:
     - Shadow data discovery (unknown holdings post-DSAR)
     """
     
-    # ICO fine bands (simplified from GDPR Article 83)
-    FINE_BANDS = {
+    # ICO fine bands (simplified from GDPR Article 83); read-only
+    FINE_BANDS = MappingProxyType({
         "minor": 0.005,      # 0.5% of turnover
         "moderate": 0.02,    # 2% of turnover  
         "serious": 0.04,     # 4% of turnover
-    }
+    })
     
-    # Article 82 distress damages (per data subject, based on case law)
-    DISTRESS_RANGES = {
+    # Article 82 distress damages (per data subject, based on case law); read-only
+    DISTRESS_RANGES = MappingProxyType({
         "low": (100, 500),
         "moderate": (500, 2000),
         "high": (2000, 5000),
         "severe": (5000, 10000),
+    })
+    
+    # Positional views of the tables above, indexed by band / distress index
+    _FINE_BAND_NAMES = tuple(FINE_BANDS)
+    _FINE_PCT_TUPLE = tuple(FINE_BANDS.values())
+    _DISTRESS_LEVELS = tuple(DISTRESS_RANGES)
+    _DISTRESS_RANGES_TUPLE = tuple(DISTRESS_RANGES.values())
+    
+    # Display strings for each band, formatted once
+    _RANGE_STR = {
+        level: f"£{low:,} - £{high:,}" for level, (low, high) in DISTRESS_RANGES.items()
     }
+    _FINE_PCT_STR = {band: f"{pct * 100}%" for band, pct in FINE_BANDS.items()}
+    
+    # Array views of the tables above for batch_report
+    _DISTRESS_TABLE = np.array(list(DISTRESS_RANGES.values()), dtype=np.float64)
+    _FINE_PCT = np.array(list(FINE_BANDS.values()), dtype=np.float64)
+    _FINE_BAND_INDEX = np.array(_FINE_BAND_BY_VIOLATIONS, dtype=np.int8)
+    _ICO_FINE_FLOOR = 17_500_000.0
     
     def __init__(self, controller: DataControllerExposure):
         self.controller = controller
+        self._memo_controller: Optional[DataControllerExposure] = None
+        self._memo: dict[str, object] = {}
         
-    def calculate_article_82_exposure(self) -> dict:
+    @_memoized_report
+    def calculate_article_82_exposure(self) -> Article82Result:
         """Calculate Article 82 non-material distress damages.
         
         Based on UK case law (Vidal-Hall v Google, Lloyd v Google):
@@ -63,21 +317,20 @@ class GdprLiabilityPricer:
         subjects = self.controller.data_subjects_affected
         
         # Determine distress level based on severity factors
-        distress_level = self._assess_distress_level()
-        low, high = self.DISTRESS_RANGES[distress_level]
+        distress_index = self._state_row()[0]
+        distress_level = self._DISTRESS_LEVELS[distress_index]
+        low, high = self._DISTRESS_RANGES_TUPLE[distress_index]
         
-        return {
-            "article": "Article 82 UK GDPR",
-            "legal_basis": "Right to compensation for material/non-material damage",
-            "data_subjects": subjects,
-            "distress_level": distress_level,
-            "per_subject_range": f"£{low:,} - £{high:,}",
-            "total_exposure_low": subjects * low,
-            "total_exposure_high": subjects * high,
-            "notes": "Distress damages for unlawful processing and DSAR refusal",
-        }
+        return Article82Result(
+            data_subjects=subjects,
+            distress_level=distress_level,
+            per_subject_range=self._RANGE_STR[distress_level],
+            total_exposure_low=subjects * low,
+            total_exposure_high=subjects * high,
+        )
     
-    def calculate_ico_fine_exposure(self) -> dict:
+    @_memoized_report
+    def calculate_ico_fine_exposure(self) -> IcoFineResult:
         """Calculate ICO administrative fine exposure.
         
         ICO can fine up to £17.5m or 4% global turnover (whichever higher)
@@ -89,30 +342,22 @@ class GdprLiabilityPricer:
         turnover = self.controller.annual_turnover_gbp
         
         # Determine fine band based on violations
-        violations = self._count_gdpr_violations()
-        
-        if violations >= 4:
-            fine_band = "serious"
-            max_fine = max(turnover * self.FINE_BANDS["serious"], 17_500_000)
-        elif violations >= 2:
-            fine_band = "moderate"
-            max_fine = turnover * self.FINE_BANDS["moderate"]
-        else:
-            fine_band = "minor"
-            max_fine = turnover * self.FINE_BANDS["minor"]
+        _, violations, band_index, _, _ = self._state_row()
+        fine_band = self._FINE_BAND_NAMES[band_index]
+        max_fine = turnover * self._FINE_PCT_TUPLE[band_index]
+        if band_index == 2:  # serious
+            max_fine = max(max_fine, 17_500_000)
         
-        return {
-            "regulator": "Information Commissioner's Office (ICO)",
-            "legal_basis": "Article 83(5) UK GDPR - Administrative fines",
-            "annual_turnover": turnover,
-            "fine_band": fine_band,
-            "violations_identified": violations,
-            "max_fine_calculated": max_fine,
-            "fine_percentage": f"{self.FINE_BANDS[fine_band] * 100}%",
-            "notes": "Fine for unlawful processing and failure to comply with DSAR",
-        }
+        return IcoFineResult(
+            annual_turnover=turnover,
+            fine_band=fine_band,
+            violations_identified=violations,
+            max_fine_calculated=max_fine,
+            fine_percentage=self._FINE_PCT_STR[fine_band],
+        )
     
-    def calculate_shadow_data_risk(self) -> dict:
+    @_memoized_report
+    def calculate_shadow_data_risk(self) -> ShadowDataResult:
         """Calculate shadow data discovery risk.
         
         Shadow data = data holdings discovered after DSAR that were
@@ -121,126 +366,174 @@ class GdprLiabilityPricer:
         Returns:
             Shadow data risk analysis
         """
-        if not self.controller.dsar_refused:
-            return {
-                "risk_present": False,
-                "notes": "No DSAR refusal - standard data mapping applies",
-            }
+        _, _, _, multiplier, risk_level = self._state_row()
+        if risk_level is None:  # no DSAR refusal
+            return _NO_SHADOW_RISK
         
         # DSAR refusal with "special category data" admission = high risk
         base_exposure = self.controller.data_subjects_affected * 1000
         
-        if self.controller.special_category_data:
-            multiplier = 3.0  # Special category under Article 9
-            risk_level = "CRITICAL"
-        elif self.controller.shadow_data_discovered:
-            multiplier = 2.5
-            risk_level = "HIGH"
-        else:
-            multiplier = 1.5
-            risk_level = "ELEVATED"
-        
-        return {
-            "risk_present": True,
-            "risk_level": risk_level,
-            "legal_basis": "Article 5(1)(d) - Accuracy and data minimisation",
-            "base_exposure": base_exposure,
-            "adjusted_exposure": base_exposure * multiplier,
-            "multiplier": multiplier,
-            "special_category_involved": self.controller.special_category_data,
-            "notes": "DSAR refusal suggests inadequate data mapping and potential systemic breach",
-        }
+        return ShadowDataResult(
+            risk_present=True,
+            risk_level=risk_level,
+            legal_basis="Article 5(1)(d) - Accuracy and data minimisation",
+            base_exposure=base_exposure,
+            adjusted_exposure=base_exposure * multiplier,
+            multiplier=multiplier,
+            special_category_involved=self.controller.special_category_data,
+            notes="DSAR refusal suggests inadequate data mapping and potential systemic breach",
+        )
     
-    def generate_total_exposure_report(self) -> dict:
+    @_memoized_report
+    def generate_total_exposure_report(self) -> TotalExposureReport:
         """Generate comprehensive GDPR exposure report.
         
         Returns:
-            Complete GDPR liability analysis
+            Complete GDPR liability analysis; use to_dict() for JSON output
         """
         article_82 = self.calculate_article_82_exposure()
         ico_fine = self.calculate_ico_fine_exposure()
         shadow_data = self.calculate_shadow_data_risk()
         
         # Calculate total exposure range
-        total_low = article_82["total_exposure_low"]
-        total_high = article_82["total_exposure_high"]
+        total_low = article_82.total_exposure_low
+        total_high = article_82.total_exposure_high
         
-        if shadow_data["risk_present"]:
-            total_low += shadow_data["adjusted_exposure"]
-            total_high += shadow_data["adjusted_exposure"]
+        if shadow_data.risk_present:
+            total_low += shadow_data.adjusted_exposure
+            total_high += shadow_data.adjusted_exposure
         
         # ICO fine is separate (regulatory, not compensatory)
-        ico_exposure = ico_fine["max_fine_calculated"]
+        ico_exposure = ico_fine.max_fine_calculated
         
-        return {
-            "controller": self.controller.controller_name,
-            "analysis_date": "2026-02-08",
-            "article_82_exposure": article_82,
-            "ico_fine_exposure": ico_fine,
-            "shadow_data_risk": shadow_data,
-            "total_compensatory_exposure": {
-                "low": total_low,
-                "high": total_high,
-            },
-            "regulatory_fine_exposure": ico_exposure,
-            "combined_maximum_exposure": total_high + ico_exposure,
-            "tactical_insights": self._generate_tactical_insights(),
-        }
+        return TotalExposureReport(
+            controller=self.controller.controller_name,
+            analysis_date=ANALYSIS_DATE,
+            article_82_exposure=article_82,
+            ico_fine_exposure=ico_fine,
+            shadow_data_risk=shadow_data,
+            total_compensatory_low=total_low,
+            total_compensatory_high=total_high,
+            regulatory_fine_exposure=ico_exposure,
+            combined_maximum_exposure=total_high + ico_exposure,
+            tactical_insights=tuple(self._iter_tactical_insights(article_82)),
+        )
     
-    def _assess_distress_level(self) -> str:
-        """Assess distress level based on violation severity."""
-        if self.controller.special_category_data and self.controller.dsar_refused:
-            return "severe"
-        elif self.controller.special_category_data:
-            return "high"
-        elif self.controller.dsar_refused:
-            return "moderate"
-        else:
-            return "low"
+    def generate_total_exposure_report_flat(self) -> dict:
+        """Generate the exposure report as a flat record for bulk export.
+        
+        Returns:
+            Single-level dict with dotted keys (see TotalExposureReport.to_flat_dict)
+        """
+        return self.generate_total_exposure_report().to_flat_dict()
     
-    def _count_gdpr_violations(self) -> int:
-        """Count identified GDPR violations."""
-        violations = 0
+    @classmethod
+    def ico_fine_batch(
+        cls, turnover_gbp: np.ndarray, violations: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorised fine band and maximum fine for many controllers.
         
-        if self.controller.dsar_refused:
-            violations += 2  # Article 12(3) + Article 15
-        if self.controller.special_category_data:
-            violations += 1  # Article 9 processing
-        if self.controller.shadow_data_discovered:
-            violations += 1  # Article 5(1)(d) accuracy
+        Args:
+            turnover_gbp: Annual turnover per controller
+            violations: Violation counts per controller; counts above 4
+                are treated as 4
             
-        return violations
+        Returns:
+            Tuple of (fine_band_index, max_fine); band indices follow
+            FINE_BANDS order
+        """
+        band = cls._FINE_BAND_INDEX[np.minimum(violations, 4)]
+        max_fine = np.asarray(turnover_gbp, dtype=np.float64) * cls._FINE_PCT[band]
+        # £17.5m floor applies to the serious band only
+        return band, np.maximum(max_fine, np.where(band == 2, cls._ICO_FINE_FLOOR, 0.0))
     
-    def _generate_tactical_insights(self) -> List[str]:
-        """Generate tactical insights for negotiators."""
-        insights = []
+    @classmethod
+    def batch_report(cls, controllers: np.ndarray) -> np.ndarray:
+        """Score a portfolio of controllers in one vectorised pass.
         
+        Numeric core of generate_total_exposure_report only; the scalar
+        methods remain the source of narrative and per-article detail.
+        
+        Args:
+            controllers: Structured array (or recarray) with the
+                CONTROLLER_DTYPE fields; extra fields are ignored
+            
+        Returns:
+            Structured array of REPORT_DTYPE, one row per controller
+        """
+        turnover = np.asarray(controllers["annual_turnover_gbp"], dtype=np.float64)
+        subjects = np.asarray(controllers["data_subjects_affected"], dtype=np.float64)
+        special = np.asarray(controllers["special_category_data"], dtype=bool)
+        dsar = np.asarray(controllers["dsar_refused"], dtype=bool)
+        shadow = np.asarray(controllers["shadow_data_discovered"], dtype=bool)
+        
+        out = np.empty(turnover.shape, dtype=REPORT_DTYPE)
+        
+        # Same 3-bit layout as _flag_state; the arrays are already bool
+        rows = _STATE_TABLE[special.astype(np.uint8) << 2 | dsar << 1 | shadow]
+        
+        # Article 82 distress band
+        bands = cls._DISTRESS_TABLE[rows["distress"]]
+        out["distress_index"] = rows["distress"]
+        out["total_exposure_low"] = subjects * bands[..., 0]
+        out["total_exposure_high"] = subjects * bands[..., 1]
+        
+        # ICO fine
+        out["violations"] = rows["violations"]
+        out["fine_band_index"], out["max_fine_calculated"] = cls.ico_fine_batch(
+            turnover, rows["violations"]
+        )
+        
+        # Shadow data: only priced after a DSAR refusal
+        out["shadow_multiplier"] = rows["shadow_mult"]
+        out["shadow_adjusted_exposure"] = subjects * 1000 * rows["shadow_mult"]
+        
+        out["compensatory_low"] = out["total_exposure_low"] + out["shadow_adjusted_exposure"]
+        out["compensatory_high"] = out["total_exposure_high"] + out["shadow_adjusted_exposure"]
+        out["combined_maximum_exposure"] = out["compensatory_high"] + out["max_fine_calculated"]
+        return out
+    
+    def _state_row(self) -> tuple[int, int, int, float, Optional[str]]:
+        """Precomputed flag-derived values for this controller (see _derive_flag_state)."""
+        c = self.controller
+        return _STATE_ROWS[
+            _flag_state(c.special_category_data, c.dsar_refused, c.shadow_data_discovered)
+        ]
+    
+    def _iter_tactical_insights(self, article_82: Article82Result) -> Iterator[str]:
+        """Yield tactical insights for negotiators."""
         if self.controller.special_category_data:
-            insights.append(
-                "Special category data involved - ICO prioritises enforcement under Article 9"
-            )
+            yield "Special category data involved - ICO prioritises enforcement under Article 9"
         
         if self.controller.dsar_refused:
-            insights.append(
-                "DSAR refusal creates standalone Article 82 claim for frustration/distress"
-            )
-            insights.append(
-                "ICO complaint recommended - triggers regulatory timeline pressure"
-            )
+            yield "DSAR refusal creates standalone Article 82 claim for frustration/distress"
+            yield "ICO complaint recommended - triggers regulatory timeline pressure"
         
         if self.controller.shadow_data_discovered:
-            insights.append(
-                "Shadow data indicates systemic breach - class action risk elevated"
-            )
+            yield "Shadow data indicates systemic breach - class action risk elevated"
         
-        exposure = self.calculate_article_82_exposure()
-        if exposure["total_exposure_high"] > 500_000:
-            insights.append(
-                f"£{exposure['total_exposure_high']/1e6:.1f}m+ Article 83 exposure - "
+        if article_82.total_exposure_high > 500_000:
+            yield (
+                f"£{article_82.total_exposure_high/1e6:.1f}m+ Article 83 exposure - "
                 "significant contingent liability for balance sheet"
             )
-        
-        return insights
+
+
+def controllers_to_array(controllers: List[DataControllerExposure]) -> np.ndarray:
+    """Pack exposure configs into a CONTROLLER_DTYPE array for batch_report."""
+    return np.array(
+        [
+            (
+                c.annual_turnover_gbp,
+                c.data_subjects_affected,
+                c.special_category_data,
+                c.dsar_refused,
+                c.shadow_data_discovered,
+            )
+            for c in controllers
+        ],
+        dtype=CONTROLLER_DTYPE,
+    )
 
 
 def create_hiloka_exposure() -> GdprLiabilityPricer:
@@ -281,6 +574,18 @@ def create_maven_exposure() -> GdprLiabilityPricer:
     return GdprLiabilityPricer(maven)
 
 
-# Pre-configured exposure models for immediate use
-HILOKA_GDPR_EXPOSURE = create_hiloka_exposure()
-MAVEN_GDPR_EXPOSURE = create_maven_exposure()
+# Pre-configured exposure models, built on first access (PEP 562)
+_PRECONFIGURED_EXPOSURES = {
+    "HILOKA_GDPR_EXPOSURE": create_hiloka_exposure,
+    "MAVEN_GDPR_EXPOSURE": create_maven_exposure,
+}
+
+
+def __getattr__(name: str) -> GdprLiabilityPricer:
+    """Build a pre-configured exposure model once and cache it as a global."""
+    try:
+        factory = _PRECONFIGURED_EXPOSURES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = factory()
+    return value
@@ -6,8 +6,68 @@ negotiation leverage calculation.
 
 from __future__ import annotations
 
+import bisect
+import math
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional
+
+import numpy as np
+
+
+# Coverage stress weight per evidence flag; bit i of a flag mask is the
+# i-th trigger in this order
+FLAG_BITS = {
+    "sra_formal_action": 1,
+    "adverse_judicial_language": 2,
+    "criminal_investigation_escalation": 4,
+    "shadow_director_proven": 8,
+    "metadata_12june_creation": 16,
+}
+FLAG_WEIGHTS = np.array([0.3, 0.25, 0.4, 0.2, 0.15])
+
+# Capped stress score for every possible mask, so scoring is a lookup
+_MASK_BITS = (np.arange(1 << len(FLAG_BITS))[:, None] >> np.arange(len(FLAG_BITS))) & 1
+_STRESS_BY_MASK = np.minimum(_MASK_BITS @ FLAG_WEIGHTS, 1.0)
+_STRESS_BY_MASK_LIST = _STRESS_BY_MASK.tolist()
+
+# Lower bounds of each band above the lowest; bisect_right picks the band.
+# The first bound is the smallest positive float, so only exactly 0 is lowest.
+_STRESS_THRESHOLDS = (math.nextafter(0.0, 1.0), 0.3, 0.5, 0.7)
+_STRESS_LABELS = (
+    "NORMAL - Standard reserve position",
+    "MODERATE - Monitor closely",
+    "ELEVATED - Reserve escalation required",
+    "HIGH - Iniquity exclusion triggered",
+    "CRITICAL - Coverage voidance likely",
+)
+_LEVERAGE_THRESHOLDS = (math.nextafter(0.0, 1.0), 3, 5, 7)
+_LEVERAGE_LABELS = (
+    "NONE - No leverage from reserves",
+    "LIMITED - Reserve adequate",
+    "MODERATE - Standard negotiation position",
+    "HIGH - Significant reserve pressure",
+    "MAXIMUM - Insurer in crisis mode",
+)
+
+
+def flags_to_mask(active_flags: list[str]) -> int:
+    """Encode evidence flags as a FLAG_BITS mask; unknown flags are ignored."""
+    mask = 0
+    for flag in active_flags:
+        mask |= FLAG_BITS.get(flag, 0)
+    return mask
+
+
+def coverage_stress_scores(masks: np.ndarray) -> np.ndarray:
+    """Coverage stress scores for many flag masks at once.
+    
+    Args:
+        masks: Integer array of FLAG_BITS masks (see flags_to_mask)
+        
+    Returns:
+        Float array of capped stress scores, same shape as masks
+    """
+    return _STRESS_BY_MASK[np.asarray(masks) & ((1 << len(FLAG_BITS)) - 1)]
 
 
 @dataclass
@@ -83,14 +143,22 @@ class InsuranceReserveModel:
         Returns:
             Gap analysis dictionary
         """
-        reserve_data = self.calculate_total_reserve(settlement_demand_gbp)
-        gap = settlement_demand_gbp - reserve_data["total_reserve"]
+        return self._calculate_reserve_gap_from(
+            self.calculate_total_reserve(settlement_demand_gbp), settlement_demand_gbp
+        )
+    
+    def _calculate_reserve_gap_from(
+        self, reserve_data: dict, settlement_demand_gbp: float
+    ) -> dict:
+        """Gap analysis from an already computed calculate_total_reserve result."""
+        total_reserve = reserve_data["total_reserve"]
+        gap = settlement_demand_gbp - total_reserve
         
         return {
             "settlement_demand": settlement_demand_gbp,
-            "total_reserve": reserve_data["total_reserve"],
+            "total_reserve": total_reserve,
             "reserve_gap": gap,
-            "gap_percentage": (gap / reserve_data["total_reserve"] * 100) if reserve_data["total_reserve"] > 0 else 0,
+            "gap_percentage": (gap / total_reserve * 100) if total_reserve > 0 else 0,
             "within_policy_limit": settlement_demand_gbp <= self.policy_limit,
             "reserve_adequate": gap <= 0,
         }
@@ -103,30 +171,21 @@ class InsuranceReserveModel:
         2. Reserve gap is significant
         3. Policy limits approach
         
+        Flags are treated as a set: a repeated flag contributes its weight
+        once, unknown flags are ignored, and triggered_exclusions lists the
+        recognised flags in FLAG_BITS order whatever order they were passed
+        in. The score therefore depends only on which flags are active.
+        
         Args:
             active_flags: List of active evidence flags
             
         Returns:
             Coverage stress analysis
         """
-        stress_triggers = {
-            "sra_formal_action": 0.3,
-            "adverse_judicial_language": 0.25,
-            "criminal_investigation_escalation": 0.4,
-            "shadow_director_proven": 0.2,
-            "metadata_12june_creation": 0.15,
-        }
-        
-        stress_score = 0.0
-        triggered_exclusions = []
-        
-        for flag in active_flags:
-            if flag in stress_triggers:
-                stress_score += stress_triggers[flag]
-                triggered_exclusions.append(flag)
-        
-        # Cap at 1.0 (100% stress)
-        stress_score = min(stress_score, 1.0)
+        mask = flags_to_mask(active_flags)
+        # Weights summed in FLAG_BITS order and capped at 1.0 (100% stress)
+        stress_score = _STRESS_BY_MASK_LIST[mask]
+        triggered_exclusions = [flag for flag, bit in FLAG_BITS.items() if mask & bit]
         
         return {
             "coverage_stress_score": stress_score,
@@ -136,18 +195,31 @@ class InsuranceReserveModel:
             "reserve_escalation_required": stress_score > 0.3,
         }
     
+    def check_coverage_stress_batch(
+        self, flag_sets: list[list[str]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Score many flag combinations at once for sensitivity sweeps.
+        
+        Only the numeric core of check_coverage_stress: no stress labels or
+        exclusion lists. Decode a mask with FLAG_BITS when those are needed.
+        
+        Args:
+            flag_sets: One list of active evidence flags per scenario
+            
+        Returns:
+            Tuple of (stress_scores, flag_masks); scores are float64 capped
+            at 1.0, masks are int64 FLAG_BITS masks of the triggered flags
+        """
+        masks = np.fromiter(
+            (flags_to_mask(flags) for flags in flag_sets),
+            dtype=np.int64,
+            count=len(flag_sets),
+        )
+        return coverage_stress_scores(masks), masks
+    
     def _categorize_stress(self, stress_score: float) -> str:
         """Categorize coverage stress level."""
-        if stress_score >= 0.7:
-            return "CRITICAL - Coverage voidance likely"
-        elif stress_score >= 0.5:
-            return "HIGH - Iniquity exclusion triggered"
-        elif stress_score >= 0.3:
-            return "ELEVATED - Reserve escalation required"
-        elif stress_score > 0:
-            return "MODERATE - Monitor closely"
-        else:
-            return "NORMAL - Standard reserve position"
+        return _STRESS_LABELS[bisect.bisect_right(_STRESS_THRESHOLDS, stress_score)]
     
     def generate_reserve_report(
         self,
@@ -164,7 +236,7 @@ class InsuranceReserveModel:
             Complete reserve analysis
         """
         reserve_data = self.calculate_total_reserve(settlement_demand_gbp)
-        gap_analysis = self.calculate_reserve_gap(settlement_demand_gbp)
+        gap_analysis = self._calculate_reserve_gap_from(reserve_data, settlement_demand_gbp)
         stress_analysis = self.check_coverage_stress(active_flags)
         
         # Calculate negotiation leverage
@@ -185,21 +257,12 @@ class InsuranceReserveModel:
                 "rating": self._categorize_leverage(leverage_score),
                 "key_insight": self._generate_leverage_insight(gap_analysis, stress_analysis),
             },
-            "tactical_recommendations": self._generate_tactics(gap_analysis, stress_analysis),
+            "tactical_recommendations": list(self._iter_tactics(gap_analysis, stress_analysis)),
         }
     
     def _categorize_leverage(self, score: float) -> str:
         """Categorize negotiation leverage."""
-        if score >= 7:
-            return "MAXIMUM - Insurer in crisis mode"
-        elif score >= 5:
-            return "HIGH - Significant reserve pressure"
-        elif score >= 3:
-            return "MODERATE - Standard negotiation position"
-        elif score > 0:
-            return "LIMITED - Reserve adequate"
-        else:
-            return "NONE - No leverage from reserves"
+        return _LEVERAGE_LABELS[bisect.bisect_right(_LEVERAGE_THRESHOLDS, score)]
     
     def _generate_leverage_insight(
         self,
@@ -218,32 +281,32 @@ class InsuranceReserveModel:
         else:
             return "Reserves adequate. Focus on liability merits rather than reserve pressure."
     
-    def _generate_tactics(
+    def _iter_tactics(
         self,
         gap_analysis: dict,
         stress_analysis: dict,
-    ) -> list[str]:
-        """Generate tactical recommendations."""
-        tactics = []
+    ) -> Iterator[str]:
+        """Yield tactical recommendations."""
+        iniquity = stress_analysis["iniquity_exclusion_risk"]
+        large_gap = gap_analysis["reserve_gap"] > 3_000_000
+        over_limit = not gap_analysis["within_policy_limit"]
         
-        if stress_analysis["iniquity_exclusion_risk"]:
-            tactics.append("Emphasize personal liability exposure to Greeff/Jagusz if coverage voids")
-            tactics.append("Request insurer confirm coverage position in writing")
-            tactics.append("Consider approaching defendants directly, bypassing insurers")
+        if iniquity:
+            yield "Emphasize personal liability exposure to Greeff/Jagusz if coverage voids"
+            yield "Request insurer confirm coverage position in writing"
+            yield "Consider approaching defendants directly, bypassing insurers"
         
-        if gap_analysis["reserve_gap"] > 3_000_000:
-            tactics.append("Highlight reserve inadequacy to claims handlers")
-            tactics.append("Request reserve escalation to senior underwriters")
-            tactics.append("Threaten full trial to force reserve increase")
+        if large_gap:
+            yield "Highlight reserve inadequacy to claims handlers"
+            yield "Request reserve escalation to senior underwriters"
+            yield "Threaten full trial to force reserve increase"
         
-        if not gap_analysis["within_policy_limit"]:
-            tactics.append("Demand excess layer participation")
-            tactics.append("Structure settlement within primary layer to avoid complexity")
+        if over_limit:
+            yield "Demand excess layer participation"
+            yield "Structure settlement within primary layer to avoid complexity"
         
-        if not tactics:
-            tactics.append("Standard negotiation approach - reserves not a pressure point")
-            
-        return tactics
+        if not (iniquity or large_gap or over_limit):
+            yield "Standard negotiation approach - reserves not a pressure point"
 
 
 def calculate_settlement_with_reserve_pressure(
@@ -279,3 +342,65 @@ def calculate_settlement_with_reserve_pressure(
         "reserve_report": report,
         "recommended_demand": min(adjusted_settlement, reserve_model.policy_limit),
     }
+
+
+def reserve_pressure_sweep(
+    base_settlement_gbp: np.ndarray,
+    reserve_model: InsuranceReserveModel,
+    active_flags: list[str],
+) -> np.ndarray:
+    """Vectorised calculate_settlement_with_reserve_pressure for scenario sweeps.
+    
+    Computes only the numeric core (gap, leverage and multiplier) for many
+    base settlements against one reserve model and flag set.
+    
+    Args:
+        base_settlement_gbp: 1-D array of base settlements (one per draw)
+        reserve_model: Configured reserve model
+        active_flags: Active evidence flags, shared by every draw
+        
+    Returns:
+        (N, 3) float64 array with columns reserve_adjusted_settlement,
+        leverage_multiplier and recommended_demand
+    """
+    base = np.asarray(base_settlement_gbp, dtype=np.float64)
+    stress = _STRESS_BY_MASK_LIST[flags_to_mask(active_flags)]
+    
+    total_reserve = reserve_model.case_reserve + base * reserve_model.ibnr_percentage
+    gap = base - total_reserve
+    leverage = np.where(gap > 0, np.minimum(gap / 1_000_000, 5.0), 0.0)
+    if stress > 0.5:
+        leverage += 3.0
+    leverage += np.where(base > reserve_model.policy_limit, 2.0, 0.0)
+    
+    out = np.empty((base.shape[0], 3), dtype=np.float64)
+    out[:, 1] = 1.0 + (leverage / 10.0) * 0.2
+    out[:, 0] = base * out[:, 1]
+    out[:, 2] = np.minimum(out[:, 0], reserve_model.policy_limit)
+    return out
+
+
+def calculate_settlement_with_reserve_pressure_batch(
+    base_settlement_gbp: np.ndarray,
+    reserve_model: InsuranceReserveModel,
+    active_flags: list[str],
+) -> dict[str, np.ndarray]:
+    """Batch calculate_settlement_with_reserve_pressure without reserve reports.
+    
+    Args:
+        base_settlement_gbp: 1-D array of base settlements
+        reserve_model: Configured reserve model
+        active_flags: Active evidence flags, shared by every settlement
+        
+    Returns:
+        Dictionary of arrays keyed like the scalar result: base_settlement,
+        reserve_adjusted_settlement, leverage_multiplier, recommended_demand
+    """
+    base = np.asarray(base_settlement_gbp, dtype=np.float64)
+    sweep = reserve_pressure_sweep(base, reserve_model, active_flags)
+    return {
+        "base_settlement": base,
+        "reserve_adjusted_settlement": sweep[:, 0],
+        "leverage_multiplier": sweep[:, 1],
+        "recommended_demand": sweep[:, 2],
+    }
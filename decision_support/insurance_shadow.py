@@ -8,9 +8,89 @@ from __future__ import annotations
 
 import hashlib
 import json
+import math
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+
+# Reused encoder; byte-identical to json.dumps(obj, sort_keys=True)
+_canonical_json = json.JSONEncoder(sort_keys=True).encode
+_encode_str = json.encoder.encode_basestring_ascii
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last rendered timestamp
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_now_isoformat() -> str:
+    """Current UTC time, formatted exactly as datetime.now(UTC).isoformat().
+    
+    The date/time prefix only changes once a second, so it is rendered once
+    per second and reused; only the microseconds are formatted per call.
+    """
+    global _iso_second_cache
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _iso_second_cache
+    if seconds != cached_second:
+        prefix = datetime.fromtimestamp(seconds, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _iso_second_cache = (seconds, prefix)
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
+
+
+def _is_plain_number(value: object) -> bool:
+    """Whether json would encode value exactly as repr() does."""
+    return type(value) is int or (type(value) is float and math.isfinite(value))
+
+
+def _audit_hash(
+    claim_value: float, stage: str, reserve_ratio: float, coc: float, timestamp: str
+) -> str:
+    """Audit hash over the canonical JSON of the calculation inputs.
+    
+    The key set is fixed, so the sorted JSON is assembled directly; plain
+    finite int/float inputs produce the same bytes as _canonical_json, and
+    anything else (bools, numpy scalars, NaN, non-str stages) takes the
+    encoder path.
+    """
+    if _is_plain_number(claim_value) and _is_plain_number(coc) and type(stage) is str:
+        payload = (
+            f'{{"claim_value": {claim_value!r}, "coc": {coc!r}, '
+            f'"reserve_ratio": {reserve_ratio!r}, "stage": {_encode_str(stage)}, '
+            f'"timestamp": {_encode_str(timestamp)}}}'
+        )
+    else:
+        payload = _canonical_json({
+            "claim_value": claim_value,
+            "stage": stage,
+            "reserve_ratio": reserve_ratio,
+            "coc": coc,
+            "timestamp": timestamp,
+        })
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class _StageInfo(NamedTuple):
+    """Illustrative reserve ratio and description for one litigation stage."""
+    reserve_ratio: float
+    description: str
+
+
+# Read-only stage table, built once at import
+_STAGE_TABLE = MappingProxyType({
+    "notification": _StageInfo(0.05, "Claim notified, initial assessment"),
+    "defence_filed": _StageInfo(0.15, "Defence filed, liability contested"),
+    "procedural_irregularity_flagged": _StageInfo(
+        0.35, "Procedural issues identified, exposure increased"
+    ),
+    "trial_listed": _StageInfo(0.65, "Trial listed, full reserve required"),
+})
 
 
 @dataclass
@@ -28,31 +108,175 @@ class ShadowReserveAssumptions:
     )
 
 
+def _stage_views(
+    table: Mapping[str, _StageInfo],
+) -> tuple[MappingProxyType, np.ndarray]:
+    """Positional views of a stage table for calculate_shadow_reserve_batch.
+    
+    Returns:
+        (stage name -> index, reserve ratio per index)
+    """
+    index = MappingProxyType({stage: i for i, stage in enumerate(table)})
+    lut = np.array([info.reserve_ratio for info in table.values()])
+    return index, lut
+
+
+_STAGE_INDEX, _RATIO_LUT = _stage_views(_STAGE_TABLE)
+
+# reserve_percentage display string per stage ratio, formatted once
+_RESERVE_PCT_STR = MappingProxyType({
+    info.reserve_ratio: f"{info.reserve_ratio * 100:.0f}%" for info in _STAGE_TABLE.values()
+})
+
+# (lever_strength, rationale builder, suggested_tactic) per stage; the
+# builder takes the locked capital and monthly dead money cost. f-strings
+# are used rather than str.format templates, which measure about 1.8x slower
+_LEVER_TEMPLATES = MappingProxyType({
+    "trial_listed": (
+        "MAXIMUM",
+        lambda locked, monthly: (
+            f"Trial listed with £{locked:,.0f} locked capital. "
+            f"Insurer paying £{monthly:,.0f}/month in dead money costs. "
+            "Strong incentive to settle before trial costs escalate."
+        ),
+        "Emphasise trial cost escalation and certainty of judgment",
+    ),
+    "procedural_irregularity_flagged": (
+        "HIGH",
+        lambda locked, monthly: (
+            f"Procedural issues flagged with £{locked:,.0f} reserved. "
+            "Reserve escalation creates pressure for early resolution."
+        ),
+        "Highlight reserve inadequacy and need for escalation",
+    ),
+    "defence_filed": (
+        "MODERATE",
+        lambda locked, monthly: (
+            f"Active litigation with £{locked:,.0f} reserved. "
+            "Moderate pressure as case develops."
+        ),
+        "Build leverage through evidence development",
+    ),
+})
+_DEFAULT_LEVER = (
+    "LOW",
+    lambda locked, monthly: (
+        f"Early stage with £{locked:,.0f} provisionally reserved. "
+        "Limited reserve pressure at this stage."
+    ),
+    "Focus on liability merits rather than reserve pressure",
+)
+
+
+def _lever(stage: str, locked_capital: float, monthly_cost: float) -> dict:
+    """Generate negotiation lever insight."""
+    strength, rationale, tactic = _LEVER_TEMPLATES.get(stage, _DEFAULT_LEVER)
+    return {
+        "lever_strength": strength,
+        "rationale": rationale(locked_capital, monthly_cost),
+        "suggested_tactic": tactic,
+    }
+
+
+def _court_safe_summary(stage: str, locked: float) -> str:
+    """Generate court-safe summary."""
+    return (
+        f"At the {stage.replace('_', ' ')} stage, illustrative analysis suggests "
+        f"£{locked:,.0f} in reserve capital may be allocated. "
+        f"This represents a negotiation consideration, not an actual insurer reserve."
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ShadowReserveResult:
+    """Shadow reserve figures; presentation fields are built by to_dict()."""
+    timestamp_utc: str
+    audit_hash: str
+    model_version: str
+    claim_value_gbp: float
+    litigation_stage: str
+    cost_of_capital_rate: float
+    reserve_ratio: float
+    stage_description: str
+    reserve_locked_gbp: float
+    annual_dead_money_gbp: float
+    disclaimer: str
+    
+    @property
+    def monthly_dead_money_gbp(self) -> float:
+        """Monthly dead money cost (annual / 12)."""
+        return self.annual_dead_money_gbp / 12
+    
+    def to_dict(self) -> dict:
+        """Return the full report as a plain JSON-serialisable dict."""
+        monthly = self.monthly_dead_money_gbp
+        return {
+            "timestamp_utc": self.timestamp_utc,
+            "audit_hash": self.audit_hash,
+            "model_version": self.model_version,
+            "assumptions": {
+                "claim_value_gbp": self.claim_value_gbp,
+                "litigation_stage": self.litigation_stage,
+                "cost_of_capital_rate": self.cost_of_capital_rate,
+                "reserve_ratio_applied": self.reserve_ratio,
+                "stage_description": self.stage_description,
+            },
+            "shadow_reserve": {
+                "estimated_reserve_locked_gbp": round(self.reserve_locked_gbp, 2),
+                "reserve_ratio": self.reserve_ratio,
+                "reserve_percentage": (
+                    _RESERVE_PCT_STR.get(self.reserve_ratio)
+                    or f"{self.reserve_ratio * 100:.0f}%"
+                ),
+            },
+            "dead_money_cost": {
+                "annual_cost_gbp": round(self.annual_dead_money_gbp, 2),
+                "monthly_cost_gbp": round(monthly, 2),
+                "cost_of_capital_rate": f"{self.cost_of_capital_rate * 100:.1f}%",
+            },
+            "negotiation_lever": _lever(self.litigation_stage, self.reserve_locked_gbp, monthly),
+            "illustrative_note": self.disclaimer,
+            "court_safe_summary": _court_safe_summary(
+                self.litigation_stage, self.reserve_locked_gbp
+            ),
+        }
+
 class InsuranceShadowReserve:
     """Shadow reserve model for locked capital estimation.
     
     Estimates capital locked in reserves and cost of "dead money".
     Uses illustrative ratios - not actual insurer data.
+    
+    LITIGATION_STAGES is read-only. To use different stages or ratios,
+    override it in a subclass (it must keep a "notification" entry, the
+    fallback for unknown stages); the lookup tables are rebuilt once when
+    the subclass is defined. Assigning it on an instance has no effect.
     """
     
-    LITIGATION_STAGES = {
-        "notification": {
-            "reserve_ratio": 0.05,
-            "description": "Claim notified, initial assessment",
-        },
-        "defence_filed": {
-            "reserve_ratio": 0.15,
-            "description": "Defence filed, liability contested",
-        },
-        "procedural_irregularity_flagged": {
-            "reserve_ratio": 0.35,
-            "description": "Procedural issues identified, exposure increased",
-        },
-        "trial_listed": {
-            "reserve_ratio": 0.65,
-            "description": "Trial listed, full reserve required",
-        },
-    }
+    # Dict-shaped view of _STAGE_TABLE for existing callers
+    LITIGATION_STAGES = MappingProxyType({
+        stage: info._asdict() for stage, info in _STAGE_TABLE.items()
+    })
+    
+    # Lookup tables derived from LITIGATION_STAGES; see __init_subclass__
+    _stage_table = _STAGE_TABLE
+    _stage_index = _STAGE_INDEX
+    _ratio_lut = _RATIO_LUT
+    
+    def __init_subclass__(cls, **kwargs):
+        """Rebuild the stage lookups when a subclass overrides LITIGATION_STAGES."""
+        super().__init_subclass__(**kwargs)
+        if "LITIGATION_STAGES" not in cls.__dict__:
+            return
+        if "notification" not in cls.LITIGATION_STAGES:
+            raise ValueError(
+                f"{cls.__name__}.LITIGATION_STAGES must define a 'notification' stage"
+            )
+        cls._stage_table = MappingProxyType({
+            stage: _StageInfo(info["reserve_ratio"], info["description"])
+            for stage, info in cls.LITIGATION_STAGES.items()
+        })
+        cls._stage_index, cls._ratio_lut = _stage_views(cls._stage_table)
     
     def __init__(self, assumptions: Optional[ShadowReserveAssumptions] = None):
         self.assumptions = assumptions or ShadowReserveAssumptions()
@@ -62,7 +286,7 @@ class InsuranceShadowReserve:
         claim_value_gbp: float,
         litigation_stage: str,
         cost_of_capital_rate: Optional[float] = None,
-    ) -> dict:
+    ) -> ShadowReserveResult:
         """Calculate shadow reserve and dead money cost.
         
         Args:
@@ -71,66 +295,115 @@ class InsuranceShadowReserve:
             cost_of_capital_rate: Override default cost of capital
             
         Returns:
-            Shadow reserve analysis with court-safe language
+            ShadowReserveResult; to_dict() gives the report with court-safe
+            language
         """
         coc = cost_of_capital_rate if cost_of_capital_rate is not None else self.assumptions.cost_of_capital_rate
         
         # Get reserve ratio for stage
-        stage_info = self.LITIGATION_STAGES.get(
-            litigation_stage, 
-            self.LITIGATION_STAGES["notification"]
-        )
-        reserve_ratio = stage_info["reserve_ratio"]
+        stage_table = self._stage_table
+        stage_info = stage_table.get(litigation_stage) or stage_table["notification"]
+        reserve_ratio = stage_info.reserve_ratio
         
         # Calculate locked capital
         estimated_reserve_locked = claim_value_gbp * reserve_ratio
         
-        # Calculate annual dead money cost
-        annual_dead_money_cost = estimated_reserve_locked * coc
+        # One timestamp for both the audit hash and the reported result
+        timestamp = _utc_now_isoformat()
         
-        # Generate negotiation lever insight
-        negotiation_lever = self._generate_lever(
-            litigation_stage, estimated_reserve_locked, annual_dead_money_cost
+        audit_hash = _audit_hash(
+            claim_value_gbp, litigation_stage, reserve_ratio, coc, timestamp
         )
         
-        # Generate audit hash
-        audit_data = {
-            "claim_value": claim_value_gbp,
-            "stage": litigation_stage,
-            "reserve_ratio": reserve_ratio,
-            "coc": coc,
-            "timestamp": datetime.now(UTC).isoformat(),
-        }
-        audit_hash = hashlib.sha256(
-            json.dumps(audit_data, sort_keys=True).encode()
-        ).hexdigest()[:16]
+        return ShadowReserveResult(
+            timestamp_utc=timestamp,
+            audit_hash=audit_hash,
+            model_version=self.assumptions.model_version,
+            claim_value_gbp=claim_value_gbp,
+            litigation_stage=litigation_stage,
+            cost_of_capital_rate=coc,
+            reserve_ratio=reserve_ratio,
+            stage_description=stage_info.description,
+            reserve_locked_gbp=estimated_reserve_locked,
+            # Annual dead money cost of the locked capital
+            annual_dead_money_gbp=estimated_reserve_locked * coc,
+            disclaimer=self.assumptions.disclaimer,
+        )
+    
+    def calculate_shadow_reserve_batch(
+        self,
+        claim_values_gbp: np.ndarray,
+        stages: np.ndarray | Sequence[str],
+        cost_of_capital_rate: Optional[float] = None,
+    ) -> dict:
+        """Score a portfolio of claims in one vectorised pass.
+        
+        Numeric core of calculate_shadow_reserve: unrounded amounts, no
+        levers or summaries, and one audit hash for the whole batch.
+        
+        Args:
+            claim_values_gbp: 1-D array of claim values
+            stages: Stage names (unknown names fall back to notification,
+                as in calculate_shadow_reserve) or integer indices into
+                LITIGATION_STAGES order
+            cost_of_capital_rate: Override default cost of capital
+            
+        Returns:
+            Batch analysis with per-claim arrays under "stage_index",
+            "reserve_ratio", "estimated_reserve_locked_gbp",
+            "annual_cost_gbp" and "monthly_cost_gbp"
+            
+        Raises:
+            TypeError: If stages are neither integers nor names (e.g. floats
+                or bools)
+            ValueError: If shapes differ or an integer stage is out of range
+        """
+        coc = cost_of_capital_rate if cost_of_capital_rate is not None else self.assumptions.cost_of_capital_rate
+        claims = np.asarray(claim_values_gbp, dtype=np.float64)
+        stage_index = np.asarray(stages)
+        if stage_index.size == 0:
+            # np.asarray([]) is float64; an empty portfolio has nothing to type-check
+            stage_index = stage_index.astype(np.intp)
+        elif stage_index.dtype.kind in "iu":
+            stage_index = stage_index.astype(np.intp)
+            if not (0 <= stage_index.min() and stage_index.max() < len(self._ratio_lut)):
+                raise ValueError(f"stage indices must be in [0, {len(self._ratio_lut)})")
+        elif stage_index.dtype.kind not in "UO":
+            raise TypeError(
+                f"stages must be integer indices or stage names, got dtype {stage_index.dtype}"
+            )
+        else:
+            notification = self._stage_index["notification"]
+            stage_index = np.fromiter(
+                (self._stage_index.get(stage, notification) for stage in stage_index.ravel().tolist()),
+                dtype=np.intp,
+                count=stage_index.size,
+            ).reshape(stage_index.shape)
+        if stage_index.shape != claims.shape:
+            raise ValueError(
+                f"stages shape {stage_index.shape} does not match claims shape {claims.shape}"
+            )
+        
+        reserve_ratio = self._ratio_lut[stage_index]
+        reserves = claims * reserve_ratio
+        annual = reserves * coc
+        
+        timestamp = _utc_now_isoformat()
+        digest = hashlib.sha256(claims.tobytes())
+        digest.update(stage_index.astype(np.int64).tobytes())
+        digest.update(_canonical_json({"coc": coc, "timestamp": timestamp}).encode())
         
         return {
-            "timestamp_utc": datetime.now(UTC).isoformat(),
-            "audit_hash": audit_hash,
+            "timestamp_utc": timestamp,
+            "audit_hash": digest.hexdigest()[:16],
             "model_version": self.assumptions.model_version,
-            "assumptions": {
-                "claim_value_gbp": claim_value_gbp,
-                "litigation_stage": litigation_stage,
-                "cost_of_capital_rate": coc,
-                "reserve_ratio_applied": reserve_ratio,
-                "stage_description": stage_info["description"],
-            },
-            "shadow_reserve": {
-                "estimated_reserve_locked_gbp": round(estimated_reserve_locked, 2),
-                "reserve_ratio": reserve_ratio,
-                "reserve_percentage": f"{reserve_ratio * 100:.0f}%",
-            },
-            "dead_money_cost": {
-                "annual_cost_gbp": round(annual_dead_money_cost, 2),
-                "monthly_cost_gbp": round(annual_dead_money_cost / 12, 2),
-                "cost_of_capital_rate": f"{coc * 100:.1f}%",
-            },
-            "negotiation_lever": negotiation_lever,
+            "cost_of_capital_rate": coc,
+            "stage_index": stage_index,
+            "reserve_ratio": reserve_ratio,
+            "estimated_reserve_locked_gbp": reserves,
+            "annual_cost_gbp": annual,
+            "monthly_cost_gbp": annual / 12,
             "illustrative_note": self.assumptions.disclaimer,
-            "court_safe_summary": self._generate_summary(
-                claim_value_gbp, litigation_stage, estimated_reserve_locked
-            ),
         }
     
     def calculate_stage_progression(
@@ -149,11 +422,9 @@ class InsuranceShadowReserve:
         Returns:
             Stage progression analysis
         """
-        current = self.calculate_shadow_reserve(claim_value_gbp, current_stage)
-        target = self.calculate_shadow_reserve(claim_value_gbp, target_stage)
-        
-        current_reserve = current["shadow_reserve"]["estimated_reserve_locked_gbp"]
-        target_reserve = target["shadow_reserve"]["estimated_reserve_locked_gbp"]
+        # Same rounding as estimated_reserve_locked_gbp in calculate_shadow_reserve
+        current_reserve = round(self._reserve(claim_value_gbp, current_stage), 2)
+        target_reserve = round(self._reserve(claim_value_gbp, target_stage), 2)
         
         reserve_increase = target_reserve - current_reserve
         
@@ -172,75 +443,16 @@ class InsuranceShadowReserve:
             ),
         }
     
-    def _generate_lever(
-        self,
-        stage: str,
-        locked_capital: float,
-        annual_cost: float,
-    ) -> dict:
-        """Generate negotiation lever insight."""
-        if stage == "trial_listed":
-            return {
-                "lever_strength": "MAXIMUM",
-                "rationale": (
-                    f"Trial listed with £{locked_capital:,.0f} locked capital. "
-                    f"Insurer paying £{annual_cost/12:,.0f}/month in dead money costs. "
-                    "Strong incentive to settle before trial costs escalate."
-                ),
-                "suggested_tactic": (
-                    "Emphasise trial cost escalation and certainty of judgment"
-                ),
-            }
-        elif stage == "procedural_irregularity_flagged":
-            return {
-                "lever_strength": "HIGH",
-                "rationale": (
-                    f"Procedural issues flagged with £{locked_capital:,.0f} reserved. "
-                    "Reserve escalation creates pressure for early resolution."
-                ),
-                "suggested_tactic": (
-                    "Highlight reserve inadequacy and need for escalation"
-                ),
-            }
-        elif stage == "defence_filed":
-            return {
-                "lever_strength": "MODERATE",
-                "rationale": (
-                    f"Active litigation with £{locked_capital:,.0f} reserved. "
-                    "Moderate pressure as case develops."
-                ),
-                "suggested_tactic": (
-                    "Build leverage through evidence development"
-                ),
-            }
-        else:
-            return {
-                "lever_strength": "LOW",
-                "rationale": (
-                    f"Early stage with £{locked_capital:,.0f} provisionally reserved. "
-                    "Limited reserve pressure at this stage."
-                ),
-                "suggested_tactic": (
-                    "Focus on liability merits rather than reserve pressure"
-                ),
-            }
-    
-    def _generate_summary(
-        self,
-        claim_value: float,
-        stage: str,
-        locked: float,
-    ) -> str:
-        """Generate court-safe summary."""
-        stage_desc = self.LITIGATION_STAGES.get(stage, {}).get(
-            "description", "Litigation in progress"
-        )
-        
-        return (
-            f"At the {stage.replace('_', ' ')} stage, illustrative analysis suggests "
-            f"£{locked:,.0f} in reserve capital may be allocated. "
-            f"This represents a negotiation consideration, not an actual insurer reserve."
-        )
+    def _reserve(self, claim_value_gbp: float, stage: str) -> float:
+        """Locked capital for a stage, without the audit hash or report."""
+        stage_table = self._stage_table
+        stage_info = stage_table.get(stage) or stage_table["notification"]
+        return claim_value_gbp * stage_info.reserve_ratio
+
+
+# Default-assumption model shared by quick_shadow_check; the model holds no
+# per-call state, so one instance serves every call
+_DEFAULT_SHADOW = InsuranceShadowReserve()
 
 
 def quick_shadow_check(
@@ -248,5 +460,4 @@ def quick_shadow_check(
     litigation_stage: str = "procedural_irregularity_flagged",
 ) -> dict:
     """Quick shadow reserve check without full initialization."""
-    shadow = InsuranceShadowReserve()
-    return shadow.calculate_shadow_reserve(claim_value_gbp, litigation_stage)
+    return _DEFAULT_SHADOW.calculate_shadow_reserve(claim_value_gbp, litigation_stage).to_dict()
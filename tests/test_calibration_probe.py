@@ -48,6 +48,19 @@ class TestCalibrationProbePrompt:
             assert key in CALIBRATION_PROBE_PROMPT, f"Required key '{key}' not in prompt"
 
 
+    def test_presplit_prompt_matches_format(self) -> None:
+        """Pre-split template must render identically to str.format."""
+        from ai_assistant.calibration_probe import _build_prompt
+
+        args = ('{"upls": 0.55}', '{"key": "{braces}"}', "[journal] {not a slot}")
+        expected = CALIBRATION_PROBE_PROMPT.format(
+            engine_snapshot=args[0],
+            assumptions_snapshot=args[1],
+            journal_context=args[2],
+        )
+        assert _build_prompt(*args) == expected
+
+
 class TestRunCalibrationProbe:
     """Tests for run_calibration_probe function."""
 
@@ -128,6 +141,53 @@ class TestRunCalibrationProbe:
         saved = json.loads(files[0].read_text())
         assert saved["status"] == "prompt_only"
 
+    def test_large_prompt_written_to_sidecar(self, tmp_path: Path) -> None:
+        """Test that a large prompt is stored once, in a sidecar referenced by hash."""
+        import hashlib
+
+        output_dir = tmp_path / "calibration"
+        result = run_calibration_probe(
+            engine_snapshot={"notes": "x" * 5000},
+            assumptions_snapshot={},
+            llm_client=None,
+            output_dir=output_dir,
+        )
+
+        saved_path = next(output_dir.glob("calibration_*.json"))
+        saved = json.loads(saved_path.read_text())
+        sidecar = output_dir / saved["prompt"]["sidecar"]
+        assert sidecar.read_text() == result["prompt"]
+        assert saved["prompt"]["sha256"] == hashlib.sha256(result["prompt"].encode()).hexdigest()
+        assert isinstance(result["prompt"], str)
+
+    def test_output_dir_recreated_if_removed(self, tmp_path: Path) -> None:
+        """Test that a cached output directory deleted mid-process is recreated."""
+        import shutil
+
+        output_dir = tmp_path / "calibration"
+        kwargs = dict(engine_snapshot={}, assumptions_snapshot={}, llm_client=None, output_dir=output_dir)
+        run_calibration_probe(**kwargs)
+        shutil.rmtree(output_dir)
+
+        run_calibration_probe(**kwargs)
+
+        assert len(list(output_dir.glob("calibration_*.json"))) == 1
+
+    def test_output_pretty_printed_when_requested(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that LEVQUANT_PRETTY switches the persisted file to indented JSON."""
+        output_dir = tmp_path / "calibration"
+        monkeypatch.setenv("LEVQUANT_PRETTY", "1")
+
+        run_calibration_probe(
+            engine_snapshot={"inputs": {}, "scores": {}, "evaluation": {}},
+            assumptions_snapshot={},
+            llm_client=None,
+            output_dir=output_dir,
+        )
+
+        text = next(output_dir.glob("calibration_*.json")).read_text()
+        assert '\n  "status": "prompt_only"' in text
+
     def test_run_with_mock_llm_success(self) -> None:
         """Test successful run with mock LLM client."""
         mock_llm = MagicMock()
@@ -156,6 +216,56 @@ class TestRunCalibrationProbe:
         assert result["parsed_output"]["fact_certainty_index"] == 0.75
         mock_llm.query.assert_called_once()
 
+    def test_repeat_prompt_served_from_cache(self, tmp_path: Path) -> None:
+        """Test that an identical prompt reuses the cached response for the same client."""
+        mock_llm = MagicMock()
+        mock_llm.query.return_value = json.dumps(VALID_PROBE)
+        kwargs = dict(
+            engine_snapshot={"scores": {"upls": 0.123456}},
+            assumptions_snapshot={},
+            llm_client=mock_llm,
+            output_dir=tmp_path,
+        )
+
+        first = run_calibration_probe(**kwargs, use_cache=True)
+        second = run_calibration_probe(**kwargs, use_cache=True)
+        uncached = run_calibration_probe(**kwargs)
+
+        assert first["status"] == "completed"
+        assert second["status"] == "cached"
+        assert second["parsed_output"] == first["parsed_output"]
+        assert uncached["status"] == "completed"
+        assert mock_llm.query.call_count == 2
+
+    def test_repeat_probe_queries_model_by_default(self, tmp_path: Path) -> None:
+        """Test that without opting in every probe samples the model."""
+        mock_llm = MagicMock()
+        mock_llm.query.return_value = json.dumps(VALID_PROBE)
+        kwargs = dict(
+            engine_snapshot={"scores": {"upls": 0.111111}},
+            assumptions_snapshot={},
+            llm_client=mock_llm,
+            output_dir=tmp_path,
+        )
+
+        results = [run_calibration_probe(**kwargs) for _ in range(2)]
+
+        assert [r["status"] for r in results] == ["completed", "completed"]
+        assert mock_llm.query.call_count == 2
+
+    def test_cache_scoped_to_client(self, tmp_path: Path) -> None:
+        """Test that a different client never receives another client's cached answer."""
+        kwargs = dict(engine_snapshot={"scores": {"upls": 0.654321}}, assumptions_snapshot={}, output_dir=tmp_path)
+        llm_a, llm_b = MagicMock(), MagicMock()
+        llm_a.query.return_value = json.dumps(VALID_PROBE)
+        llm_b.query.return_value = json.dumps({**VALID_PROBE, "drift_alert": True})
+
+        run_calibration_probe(llm_client=llm_a, use_cache=True, **kwargs)
+        result_b = run_calibration_probe(llm_client=llm_b, use_cache=True, **kwargs)
+
+        assert result_b["status"] == "completed"
+        assert result_b["parsed_output"]["drift_alert"] is True
+
     def test_run_with_mock_llm_invalid_json(self) -> None:
         """Test handling of invalid JSON from LLM."""
         mock_llm = MagicMock()
@@ -219,6 +329,72 @@ class TestRunCalibrationProbe:
         assert result["parsed_output"]["fact_certainty_index"] == 0.75
 
 
+VALID_PROBE = {
+    "probe_version": "1.0",
+    "timestamp_utc": "2024-01-01",
+    "fact_certainty_index": 0.75,
+    "procedural_risk_index": 0.3,
+    "insurer_exit_probability": 0.4,
+    "law_firm_breakpoint_score": 65,
+    "recommended_settlement_range_gbp": "£3m–£5m",
+    "drift_alert": False,
+}
+
+
+class TestParseProbeOutput:
+    """Tests for _parse_probe_output."""
+
+    def test_parses_bare_object(self) -> None:
+        """Test that a bare JSON object is parsed."""
+        from ai_assistant.calibration_probe import _parse_probe_output
+
+        assert _parse_probe_output(json.dumps(VALID_PROBE)) == VALID_PROBE
+
+    def test_ignores_fences_and_whitespace(self) -> None:
+        """Test that surrounding fences and whitespace are ignored."""
+        from ai_assistant.calibration_probe import _parse_probe_output
+
+        assert _parse_probe_output(f"\n```json\n{json.dumps(VALID_PROBE)}\n```\n") == VALID_PROBE
+
+    def test_ignores_braces_in_strings_and_trailing_prose(self) -> None:
+        """Test that braces inside strings or after the object do not confuse extraction."""
+        from ai_assistant.calibration_probe import _parse_probe_output
+
+        payload = {**VALID_PROBE, "recommended_settlement_range_gbp": "£X–£Y {\"low\"}"}
+        output = f"Here you go:\n{json.dumps(payload)}\nNote: ranges use {{low, high}}."
+        assert _parse_probe_output(output) == payload
+
+    def test_keeps_extra_sections(self) -> None:
+        """Test that keys beyond the required set are preserved."""
+        from ai_assistant.calibration_probe import _parse_probe_output
+
+        payload = {**VALID_PROBE, "section_1_facts": {"weakest_facts": ["x"]}}
+        assert _parse_probe_output(json.dumps(payload))["section_1_facts"] == {"weakest_facts": ["x"]}
+
+    def test_validates_while_parsing(self) -> None:
+        """Test that schema violations surface from the parse step."""
+        from ai_assistant.calibration_probe import _parse_probe_output
+
+        with pytest.raises(ValueError, match="law_firm_breakpoint_score must be integer 0–100"):
+            _parse_probe_output(json.dumps({**VALID_PROBE, "law_firm_breakpoint_score": 150}))
+        with pytest.raises(ValueError, match="Missing required keys"):
+            _parse_probe_output('{"a": {"b": 1}}')
+
+    def test_rejects_output_without_braces(self) -> None:
+        """Test that output with no braces is rejected."""
+        from ai_assistant.calibration_probe import _parse_probe_output
+
+        with pytest.raises(ValueError, match="no JSON object"):
+            _parse_probe_output("not valid json")
+
+    def test_rejects_malformed_object(self) -> None:
+        """Test that malformed JSON between braces is rejected."""
+        from ai_assistant.calibration_probe import _parse_probe_output
+
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            _parse_probe_output('{"a": }')
+
+
 class TestGetProbeHistory:
     """Tests for get_probe_history function."""
 
@@ -262,6 +438,83 @@ class TestGetProbeHistory:
         assert history[0]["timestamp_utc"] == "2024-01-03"
 
 
+    def test_history_limit_reads_across_blocks(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that the reverse tail read stitches lines split across blocks."""
+        from ai_assistant import calibration_probe
+        log_file = tmp_path / "calibration.log"
+        monkeypatch.setattr(calibration_probe, "LOG_FILE", log_file)
+        monkeypatch.setattr(calibration_probe.jsonio, "TAIL_BLOCK_SIZE", 16)
+
+        with open(log_file, "w") as f:
+            for i in range(20):
+                f.write(json.dumps({"timestamp_utc": f"2024-01-{i+1:02d}", "status": "completed"}) + "\n")
+
+        history = get_probe_history(limit=4)
+        assert [h["timestamp_utc"] for h in history] == [f"2024-01-{i:02d}" for i in range(17, 21)]
+        assert len(get_probe_history(limit=100)) == 20
+
+    def test_history_limit_skips_malformed_lines(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that malformed lines do not shrink a limited history."""
+        from ai_assistant import calibration_probe
+        log_file = tmp_path / "calibration.log"
+        monkeypatch.setattr(calibration_probe, "LOG_FILE", log_file)
+
+        with open(log_file, "w") as f:
+            for i in range(5):
+                f.write(json.dumps({"timestamp_utc": f"2024-01-0{i+1}", "status": "completed"}) + "\n")
+                f.write("{truncated\n")
+
+        history = get_probe_history(limit=3)
+        assert [h["timestamp_utc"] for h in history] == ["2024-01-03", "2024-01-04", "2024-01-05"]
+        assert len(get_probe_history(limit=10)) == 5
+
+    def test_buffered_log_entries_visible_in_history(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that buffered log writes are flushed before history is read."""
+        from ai_assistant import calibration_probe
+        log_file = tmp_path / "calibration.log"
+        monkeypatch.setattr(calibration_probe, "LOG_FILE", log_file)
+
+        calibration_probe._append_to_log({"timestamp_utc": "2024-01-01", "status": "completed"})
+
+        history = get_probe_history()
+        assert history[-1]["timestamp_utc"] == "2024-01-01"
+
+    def test_failed_probe_flushed_immediately(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that failed probe summaries reach disk without an explicit flush."""
+        from ai_assistant import calibration_probe
+        log_file = tmp_path / "calibration.log"
+        monkeypatch.setattr(calibration_probe, "LOG_FILE", log_file)
+
+        calibration_probe._append_to_log({"timestamp_utc": "2024-01-01", "status": "failed", "error": "boom"})
+
+        assert json.loads(log_file.read_text().splitlines()[-1])["error"] == "boom"
+
+    def test_completed_probe_flushed_by_default(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that every probe summary reaches disk unless buffering is opted in."""
+        from ai_assistant import calibration_probe
+        log_file = tmp_path / "calibration.log"
+        monkeypatch.setattr(calibration_probe, "LOG_FILE", log_file)
+
+        calibration_probe._append_to_log({"timestamp_utc": "2024-01-01", "status": "completed"})
+
+        assert json.loads(log_file.read_text())["status"] == "completed"
+
+    def test_rotated_log_is_reopened(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that appends after a log rotation go to the new file."""
+        from ai_assistant import calibration_probe
+        log_file = tmp_path / "calibration.log"
+        monkeypatch.setattr(calibration_probe, "LOG_FILE", log_file)
+
+        calibration_probe._append_to_log({"timestamp_utc": "2024-01-01", "status": "completed"})
+        log_file.rename(tmp_path / "calibration.log.1")
+        calibration_probe._append_to_log({"timestamp_utc": "2024-01-02", "status": "completed"})
+        log_file.unlink()
+        calibration_probe._append_to_log({"timestamp_utc": "2024-01-03", "status": "completed"})
+
+        assert [h["timestamp_utc"] for h in get_probe_history()] == ["2024-01-03"]
+        assert json.loads((tmp_path / "calibration.log.1").read_text())["timestamp_utc"] == "2024-01-01"
+
+
 class TestCompareProbes:
     """Tests for compare_probes function."""
 
@@ -346,3 +599,10 @@ class TestValidation:
         
         with pytest.raises(ValueError, match="drift_alert must be boolean"):
             _validate_probe_output(invalid)
+
+    def test_validate_probability_type(self) -> None:
+        """Test that non-numeric probabilities are rejected."""
+        from ai_assistant.calibration_probe import _validate_probe_output
+
+        with pytest.raises(ValueError, match="procedural_risk_index must be numeric"):
+            _validate_probe_output({**VALID_PROBE, "procedural_risk_index": "0.3"})
@@ -67,6 +67,16 @@ class TestRunEngine:
         # Check version
         assert result['version'] == "1.0"
         
+    def test_run_engine_without_interpretation(self):
+        """Test that interpretation can be skipped without changing the scores."""
+        full = run_engine()
+        lean = run_engine(include_interpretation=False)
+        
+        assert 'interpretation' not in lean
+        assert lean['scores'] == full['scores']
+        assert lean['evaluation'] == full['evaluation']
+        assert list(lean) == ['inputs', 'scores', 'evaluation', 'version']
+        
     def test_run_engine_custom_state(self):
         """Test that run_engine accepts custom state."""
         custom_state = {'SV1a': 0.90, 'SV1b': 0.95, 'SV1c': 0.80}
@@ -185,6 +195,21 @@ class TestCLIOutput:
         assert "JSON" in captured.out
 
 
+    def test_default_command_skips_full_parser(self, capsys, monkeypatch):
+        """Test that the default run does not build the subcommand parser."""
+        import cli.run
+
+        def fail():
+            raise AssertionError("full parser built")
+
+        monkeypatch.setattr(cli.run, 'build_parser', fail)
+        
+        assert main([]) == 0
+        assert main(['--json']) == 0
+        captured = capsys.readouterr()
+        assert "PROCEDURAL LEVERAGE ENGINE" in captured.out
+
+
 class TestCLIErrors:
     """
     Test CLI error handling.
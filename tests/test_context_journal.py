@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import json
 import tempfile
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
 
 from ai_assistant.context_journal import (
+    JournalWriter,
     add_context,
+    delta_since,
     get_all_context,
+    get_journal_writer,
     init_journal,
     read_entries,
+    stable_concat_context,
 )
 
 
@@ -20,7 +25,7 @@ class TestInitJournal:
     """Tests for init_journal function."""
 
     def test_creates_new_file_if_missing(self, tmp_path: Path) -> None:
-        """Test that init_journal creates an empty JSON file if it doesn't exist."""
+        """Test that init_journal creates an empty JSONL file if it doesn't exist."""
         journal_path = tmp_path / "test_journal.json"
         assert not journal_path.exists()
 
@@ -28,8 +33,8 @@ class TestInitJournal:
 
         assert result == journal_path
         assert journal_path.exists()
-        content = json.loads(journal_path.read_text())
-        assert content == []
+        assert journal_path.read_text() == ""
+        assert read_entries(journal_path) == []
 
     def test_does_not_overwrite_existing_file(self, tmp_path: Path) -> None:
         """Test that init_journal doesn't overwrite existing journal."""
@@ -40,8 +45,39 @@ class TestInitJournal:
         result = init_journal(journal_path)
 
         assert result == journal_path
-        content = json.loads(journal_path.read_text())
-        assert content == existing_entry
+        assert read_entries(journal_path) == existing_entry
+
+    def test_migrates_legacy_json_array_to_jsonl(self, tmp_path: Path) -> None:
+        """Test that a legacy JSON-array journal is rewritten one entry per line."""
+        journal_path = tmp_path / "test_journal.json"
+        legacy = [
+            {"timestamp_utc": "2024-01-01T00:00:00", "text": "first"},
+            {"timestamp_utc": "2024-01-02T00:00:00", "text": "second"},
+        ]
+        journal_path.write_text(json.dumps(legacy, indent=2))
+
+        init_journal(journal_path)
+
+        lines = journal_path.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == legacy
+
+    def test_failed_migration_leaves_legacy_journal_intact(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that the JSONL rewrite replaces the journal atomically."""
+        import os
+
+        journal_path = tmp_path / "test_journal.json"
+        original = json.dumps([{"timestamp_utc": "2024-01-01T00:00:00", "text": "first"}], indent=2)
+        journal_path.write_text(original)
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        with pytest.raises(OSError, match="disk full"):
+            init_journal(journal_path)
+
+        assert journal_path.read_text() == original
+        assert [p.name for p in tmp_path.iterdir()] == ["test_journal.json"]
 
     def test_uses_default_path_when_none_provided(self) -> None:
         """Test that init_journal uses default path when no path provided."""
@@ -71,6 +107,7 @@ class TestAddContext:
         entries = read_entries(journal_path)
         assert len(entries) == 1
         assert entries[0]["text"] == "Test context entry"
+        assert len(journal_path.read_text().splitlines()) == 1
         assert entries[0]["entry_type"] == "text"
         assert entries[0]["source"] == "user"
         assert "timestamp_utc" in entries[0]
@@ -152,6 +189,122 @@ class TestAddContext:
         assert len(entries) == 1
 
 
+    def test_appends_to_legacy_json_array_journal(self, tmp_path: Path) -> None:
+        """Test that appending to a legacy JSON-array journal keeps old entries."""
+        journal_path = tmp_path / "test_journal.json"
+        legacy = [{"timestamp_utc": "2024-01-01T00:00:00", "entry_type": "text", "source": "user", "text": "Old"}]
+        journal_path.write_text(json.dumps(legacy))
+
+        add_context("New", "text", "cli", journal_path)
+
+        entries = read_entries(journal_path)
+        assert [e["text"] for e in entries] == ["Old", "New"]
+
+
+class TestJournalWriter:
+    """Tests for JournalWriter and batched appends."""
+
+    def test_batch_defers_writes_until_exit(self, tmp_path: Path) -> None:
+        """Test that entries written in a batch land together on exit."""
+        journal_path = tmp_path / "test_journal.json"
+        init_journal(journal_path)
+
+        with get_journal_writer(journal_path).batch():
+            add_context("One", "text", "cli", journal_path)
+            add_context("Two", "text", "cli", journal_path)
+            assert read_entries(journal_path) == []
+
+        assert [e["text"] for e in read_entries(journal_path)] == ["One", "Two"]
+
+    def test_standalone_writer_context_manager(self, tmp_path: Path) -> None:
+        """Test that a standalone writer flushes a pending batch on close."""
+        journal_path = tmp_path / "test_journal.json"
+
+        with JournalWriter(journal_path) as writer:
+            writer.write({"timestamp_utc": "t0", "entry_type": "text", "text": "direct"})
+            with writer.batch():
+                writer.write({"timestamp_utc": "t1", "entry_type": "text", "text": "batched"})
+
+        assert writer.closed
+        assert [e["text"] for e in read_entries(journal_path)] == ["direct", "batched"]
+
+    def test_closed_singleton_is_replaced(self, tmp_path: Path) -> None:
+        """Test that add_context keeps working after the shared writer is closed."""
+        journal_path = tmp_path / "test_journal.json"
+        add_context("Before", "text", "cli", journal_path)
+        get_journal_writer(journal_path).close()
+
+        add_context("After", "text", "cli", journal_path)
+
+        assert [e["text"] for e in read_entries(journal_path)] == ["Before", "After"]
+
+    def test_previous_day_writer_closed_on_rollover(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that moving to a new day's shard closes the previous day's writer."""
+        from ai_assistant import context_journal
+
+        class FrozenDatetime(datetime):
+            current = datetime(2024, 1, 10, 23, 59, tzinfo=UTC)
+
+            @classmethod
+            def now(cls, tz=None):
+                return cls.current
+
+        monkeypatch.setattr(context_journal, "datetime", FrozenDatetime)
+        journal_path = tmp_path / "daily_context"
+        add_context("Day one", "text", "cli", journal_path)
+        first = get_journal_writer(journal_path)
+        FrozenDatetime.current = datetime(2024, 1, 11, 0, 1, tzinfo=UTC)
+
+        add_context("Day two", "text", "cli", journal_path)
+
+        assert first.closed
+        assert [p for p in context_journal._WRITERS if p.parent == journal_path] == [
+            journal_path / "2024-01-11.jsonl"
+        ]
+        assert [e["text"] for e in read_entries(journal_path)] == ["Day one", "Day two"]
+
+    def test_removed_shard_directory_is_recreated(self, tmp_path: Path) -> None:
+        """Test that a journal removed after init_journal is recreated on append."""
+        import shutil
+
+        journal_path = tmp_path / "daily_context"
+        init_journal(journal_path)
+        shutil.rmtree(journal_path)
+
+        add_context("After removal", "text", "cli", journal_path)
+
+        assert [e["text"] for e in read_entries(journal_path)] == ["After removal"]
+
+
+    @pytest.mark.parametrize("name", ["journal.jsonl", "daily_context"])
+    def test_deleted_journal_is_reopened(self, tmp_path: Path, name: str) -> None:
+        """Test that an entry added after the journal file is deleted is not lost."""
+        import shutil
+
+        journal_path = tmp_path / name
+        add_context("first", "text", "cli", journal_path)
+        if journal_path.is_dir():
+            shutil.rmtree(journal_path)
+        else:
+            journal_path.unlink()
+
+        add_context("second", "text", "cli", journal_path)
+
+        assert [e["text"] for e in read_entries(journal_path)] == ["second"]
+
+    def test_rotated_journal_is_reopened(self, tmp_path: Path) -> None:
+        """Test that appends follow a journal file replaced by rotation."""
+        journal_path = tmp_path / "journal.jsonl"
+        add_context("first", "text", "cli", journal_path)
+        journal_path.rename(tmp_path / "journal.jsonl.1")
+        journal_path.touch()
+
+        add_context("second", "text", "cli", journal_path)
+
+        assert [e["text"] for e in read_entries(journal_path)] == ["second"]
+        assert [e["text"] for e in read_entries(tmp_path / "journal.jsonl.1")] == ["first"]
+
+
 class TestReadEntries:
     """Tests for read_entries function."""
 
@@ -224,6 +377,24 @@ class TestGetAllContext:
         assert "Entry 2" not in result
         assert "Entry 3" not in result
 
+    def test_limit_with_blank_lines_and_small_tail_blocks(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that a limited read never parses a partial line next to blank lines."""
+        from ai_assistant import jsonio
+
+        monkeypatch.setattr(jsonio, "TAIL_BLOCK_SIZE", 16)
+        journal_path = tmp_path / "test_journal.jsonl"
+        lines = [
+            json.dumps({"timestamp_utc": f"2024-01-0{i}T00:00:00", "entry_type": "text", "text": f"Entry {i}"})
+            for i in range(1, 4)
+        ]
+        journal_path.write_text("\n\n".join(lines) + "\n\n")
+
+        assert [e["text"] for e in read_entries(journal_path)][-2:] == ["Entry 2", "Entry 3"]
+        result = get_all_context(journal_path, limit=2)
+        assert "Entry 2" in result
+        assert "Entry 3" in result
+        assert "Entry 1" not in result
+
     def test_limit_none_returns_all(self, tmp_path: Path) -> None:
         """Test that limit=None returns all entries."""
         journal_path = tmp_path / "test_journal.json"
@@ -254,6 +425,198 @@ class TestGetAllContext:
         assert "Test note" in result
 
 
+    def test_exact_format_from_jsonl_journal(self, tmp_path: Path) -> None:
+        """Test the separator and tag layout for a JSONL journal."""
+        journal_path = tmp_path / "test_journal.json"
+        add_context("Alpha", "text", "user", journal_path, fact_status="REALISED")
+        add_context("Beta", "email", "cli", journal_path)
+        entries = read_entries(journal_path)
+
+        result = get_all_context(journal_path)
+
+        assert result == (
+            f"[{entries[0]['timestamp_utc']}] [text] [REALISED] Alpha"
+            "\n\n---\n\n"
+            f"[{entries[1]['timestamp_utc']}] [email] Beta"
+        )
+        assert get_all_context(journal_path, limit=1) == f"[{entries[1]['timestamp_utc']}] [email] Beta"
+
+
+    def test_cached_output_invalidated_by_append(self, tmp_path: Path) -> None:
+        """Test that cached context is refreshed once the journal changes."""
+        journal_path = tmp_path / "test_journal.json"
+        add_context("First", "text", "user", journal_path)
+
+        first = get_all_context(journal_path)
+        assert get_all_context(journal_path) is first
+
+        add_context("Second", "text", "user", journal_path)
+        refreshed = get_all_context(journal_path)
+        assert "Second" in refreshed
+        assert get_all_context(journal_path, limit=1).endswith("Second")
+
+
+def _write_shard(base: Path, day: str, texts: list[str]) -> None:
+    base.mkdir(parents=True, exist_ok=True)
+    with open(base / f"{day}.jsonl", "a") as f:
+        for text in texts:
+            f.write(json.dumps({"timestamp_utc": f"{day}T12:00:00+00:00", "entry_type": "text", "source": "user", "text": text}) + "\n")
+
+
+class TestShardedJournal:
+    """Tests for the per-UTC-day sharded journal layout."""
+
+    def test_add_context_writes_todays_shard(self, tmp_path: Path) -> None:
+        """Test that a suffix-less path is treated as a shard directory."""
+        base = tmp_path / "daily_context"
+
+        add_context("Sharded entry", "text", "cli", base)
+
+        today = datetime.now(UTC).strftime("%Y-%m-%d")
+        shard = base / f"{today}.jsonl"
+        assert shard.exists()
+        assert json.loads(shard.read_text())["text"] == "Sharded entry"
+        assert [e["text"] for e in read_entries(base)] == ["Sharded entry"]
+
+    def test_days_filter_reads_recent_shards_only(self, tmp_path: Path) -> None:
+        """Test that days restricts reads to the most recent calendar days."""
+        base = tmp_path / "daily_context"
+        today = datetime.now(UTC).date()
+        _write_shard(base, (today - timedelta(days=10)).isoformat(), ["Old"])
+        _write_shard(base, (today - timedelta(days=1)).isoformat(), ["Yesterday"])
+        _write_shard(base, today.isoformat(), ["Today"])
+
+        assert [e["text"] for e in read_entries(base, days=2)] == ["Yesterday", "Today"]
+        context = get_all_context(base, days=1)
+        assert "Today" in context
+        assert "Yesterday" not in context
+        assert "Old" in get_all_context(base)
+
+    def test_limit_spans_shards(self, tmp_path: Path) -> None:
+        """Test that limit collects the newest entries across shard boundaries."""
+        base = tmp_path / "daily_context"
+        _write_shard(base, "2024-01-01", ["A", "B"])
+        _write_shard(base, "2024-01-02", ["C"])
+
+        result = get_all_context(base, limit=2)
+
+        assert result.index("B") < result.index("C")
+        assert "A" not in result
+
+    def test_single_file_journal_split_into_shards(self, tmp_path: Path) -> None:
+        """Test that <dir>.json next to a new shard directory is migrated once."""
+        base = tmp_path / "daily_context"
+        legacy = tmp_path / "daily_context.json"
+        legacy.write_text(json.dumps([
+            {"timestamp_utc": "2024-01-01T09:00:00+00:00", "entry_type": "text", "source": "user", "text": "Jan 1"},
+            {"timestamp_utc": "2024-01-02T09:00:00+00:00", "entry_type": "text", "source": "user", "text": "Jan 2"},
+        ]))
+
+        init_journal(base)
+
+        assert not legacy.exists()
+        assert (tmp_path / "daily_context.json.migrated").exists()
+        assert sorted(p.name for p in base.iterdir()) == ["2024-01-01.jsonl", "2024-01-02.jsonl"]
+        assert [e["text"] for e in read_entries(base)] == ["Jan 1", "Jan 2"]
+
+    def test_split_keeps_undated_entries_readable(self, tmp_path: Path) -> None:
+        """Test that entries without a timestamp land in a dated shard, in order."""
+        base = tmp_path / "daily_context"
+        legacy = tmp_path / "daily_context.json"
+        legacy.write_text(json.dumps([
+            {"entry_type": "text", "text": "Undated first"},
+            {"timestamp_utc": "2024-01-01T09:00:00+00:00", "entry_type": "text", "text": "Jan 1"},
+            {"timestamp_utc": None, "entry_type": "text", "text": "Undated after Jan 1"},
+            {"timestamp_utc": "2024-01-02T09:00:00+00:00", "entry_type": "text", "text": "Jan 2"},
+        ]))
+
+        init_journal(base)
+
+        assert sorted(p.name for p in base.iterdir()) == ["2024-01-01.jsonl", "2024-01-02.jsonl"]
+        assert [e["text"] for e in read_entries(base)] == [
+            "Undated first", "Jan 1", "Undated after Jan 1", "Jan 2",
+        ]
+
+    def test_split_puts_legacy_entries_before_existing_shard(self, tmp_path: Path) -> None:
+        """Test that legacy entries are merged ahead of newer entries already in a shard."""
+        base = tmp_path / "daily_context"
+        base.mkdir()
+        (base / "2024-01-01.jsonl").write_text(json.dumps(
+            {"timestamp_utc": "2024-01-01T18:00:00+00:00", "entry_type": "text", "text": "Sharded"}
+        ) + "\n")
+        (tmp_path / "daily_context.json").write_text(json.dumps([
+            {"timestamp_utc": "2024-01-01T09:00:00+00:00", "entry_type": "text", "text": "Legacy"},
+        ]))
+
+        init_journal(base)
+
+        assert [e["text"] for e in read_entries(base)] == ["Legacy", "Sharded"]
+        assert sorted(p.name for p in base.iterdir()) == ["2024-01-01.jsonl"]
+
+    def test_days_filter_on_single_file_journal(self, tmp_path: Path) -> None:
+        """Test that days also filters single-file journals by entry date."""
+        journal_path = tmp_path / "test_journal.json"
+        journal_path.write_text(json.dumps([
+            {"timestamp_utc": "2000-01-01T00:00:00", "entry_type": "text", "source": "user", "text": "Ancient"},
+        ]))
+        add_context("Fresh", "text", "user", journal_path)
+
+        assert [e["text"] for e in read_entries(journal_path, days=1)] == ["Fresh"]
+
+    def test_cached_days_window_expires_at_midnight(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that a cached days window drops entries once their day ages out."""
+        from ai_assistant import context_journal
+
+        class FrozenDatetime(datetime):
+            current = datetime(2024, 1, 10, 23, 59, tzinfo=UTC)
+
+            @classmethod
+            def now(cls, tz=None):
+                return cls.current
+
+        monkeypatch.setattr(context_journal, "datetime", FrozenDatetime)
+        journal_path = tmp_path / "test_journal.jsonl"
+        journal_path.write_text(json.dumps(
+            {"timestamp_utc": "2024-01-10T12:00:00+00:00", "entry_type": "text", "text": "Today"}
+        ) + "\n")
+
+        assert "Today" in get_all_context(journal_path, days=1)
+        FrozenDatetime.current = datetime(2024, 1, 11, 0, 1, tzinfo=UTC)
+        assert get_all_context(journal_path, days=1) == ""
+
+
+class TestStableContext:
+    """Tests for order-stable concatenation and context deltas."""
+
+    def test_matches_get_all_context_and_ignores_input_order(self, tmp_path: Path) -> None:
+        """Test that shuffled entries concatenate to the journal's own context text."""
+        journal_path = tmp_path / "journal.json"
+        for text in ("one", "two", "three"):
+            add_context(text, "text", "user", journal_path)
+        entries = read_entries(journal_path)
+
+        assert stable_concat_context(entries[::-1]) == get_all_context(journal_path)
+
+    def test_delta_since_returns_only_new_entries(self, tmp_path: Path) -> None:
+        """Test that an appended entry is the whole delta, without a leading separator."""
+        journal_path = tmp_path / "journal.json"
+        add_context("one", "text", "user", journal_path)
+        before = get_all_context(journal_path)
+        add_context("two", "text", "user", journal_path)
+        after = get_all_context(journal_path)
+
+        delta = delta_since(before, after)
+
+        assert delta.endswith(" two")
+        assert "one" not in delta
+        assert not delta.startswith("\n")
+
+    def test_delta_since_falls_back_to_full_text(self) -> None:
+        """Test that a non-prefix or empty previous context yields the full text."""
+        assert delta_since("", "abc") == "abc"
+        assert delta_since("xyz", "abc") == "abc"
+
+
 class TestIntegration:
     """Integration tests for the full journal workflow."""
 
@@ -11,8 +11,10 @@ import pytest
 from ai_assistant.daily_calibration import (
     DailyAICalibrator,
     export_prompt_markdown,
+    parse_and_validate,
     parse_llm_output,
     save_daily_report,
+    validate_calibration_output,
 )
 
 
@@ -171,6 +173,7 @@ class TestDailyAICalibrator:
         assert "raw_prompt" in result
         assert result["new_context"] == "New test"
         assert result["llm_response_json"] is None
+        assert result["validation_errors"] is None
         assert result["delta_summary"] is None
         assert "@LEVQUANT_CALIBRATION_TEMPLATE" in result["raw_prompt"]
 
@@ -194,6 +197,7 @@ class TestDailyAICalibrator:
 
         mock_llm.query.assert_called_once()
         assert result["llm_response_json"] == {"test": "response"}
+        assert "Missing required key: timestamp_utc" in result["validation_errors"]
         assert result["delta_summary"] is not None
 
     def test_run_handles_llm_error(self) -> None:
@@ -217,6 +221,30 @@ class TestDailyAICalibrator:
         assert "llm_error" in result
         assert "LLM connection failed" in result["llm_error"]
 
+    def test_delta_summary_extracts_fields(self) -> None:
+        """Test that the delta summary picks the expected nested values."""
+        summary = DailyAICalibrator()._extract_delta_summary({
+            "drift_detection": {"drift_score": 0.3},
+            "settlement_corridor_check": {"corridor_alignment": "aligned"},
+            "daily_actions": {"what_to_update_in_inputs": ["a", "b"], "what_to_watch_next": ["x", "y", "z"]},
+        })
+
+        assert summary == {
+            "drift_score": 0.3,
+            "corridor_alignment": "aligned",
+            "key_action": ["a"],
+            "watch_next": ["x", "y"],
+        }
+
+    def test_delta_summary_tolerates_malformed_sections(self) -> None:
+        """Test that null or wrongly typed sections fall back to defaults."""
+        summary = DailyAICalibrator()._extract_delta_summary({
+            "drift_detection": None,
+            "daily_actions": {"what_to_update_in_inputs": None, "what_to_watch_next": "text"},
+        })
+
+        assert summary == {"drift_score": 0, "corridor_alignment": "unknown", "key_action": [], "watch_next": []}
+
 
 class TestParseLlmOutput:
     """Tests for parse_llm_output function."""
@@ -245,6 +273,15 @@ class TestParseLlmOutput:
 
         assert result == {"key": "value"}
 
+    def test_parses_json_with_unbalanced_fences(self) -> None:
+        """Test that a lone opening or closing fence is stripped, as before."""
+        assert parse_llm_output('  ```json{"key": 1}') == {"key": 1}
+        assert parse_llm_output('{"key": 1}```\n') == {"key": 1}
+
+    def test_fence_inside_string_value_preserved(self) -> None:
+        """Test that backticks inside the JSON body are not treated as fences."""
+        assert parse_llm_output('```json\n{"key": "a```b"}\n```') == {"key": "a```b"}
+
     def test_raises_on_invalid_json(self) -> None:
         """Test that invalid JSON raises ValueError."""
         output = "not valid json"
@@ -252,6 +289,18 @@ class TestParseLlmOutput:
         with pytest.raises(ValueError, match="not valid JSON"):
             parse_llm_output(output)
 
+    def test_error_message_has_bounded_preview(self) -> None:
+        """Test that the rendered error keeps the original wording and a 500-char preview."""
+        from ai_assistant.daily_calibration import LLMJsonError
+
+        with pytest.raises(LLMJsonError) as exc_info:
+            parse_llm_output("  x" * 1000)
+
+        message = str(exc_info.value)
+        assert message.startswith("LLM output is not valid JSON: ")
+        assert message.split("\nOutput preview: ", 1)[1] == ("x" + "  x" * 1000)[:500]
+        assert isinstance(exc_info.value, ValueError)
+
     def test_raises_on_empty_string(self) -> None:
         """Test that empty string raises ValueError."""
         output = ""
@@ -260,6 +309,66 @@ class TestParseLlmOutput:
             parse_llm_output(output)
 
 
+class TestValidateCalibrationOutput:
+    """Tests for validate_calibration_output function."""
+
+    VALID = {
+        "timestamp_utc": "2024-01-01T00:00:00Z",
+        "model_version": "LEVQUANT_CALIBRATION_TEMPLATE_v1.0",
+        "engine_snapshot": {},
+        "fact_checks": [],
+        "drift_detection": {"drift_score": 0.1},
+        "tripwire_calibration": {},
+        "settlement_corridor_check": {},
+        "daily_actions": {"what_to_watch_next": ["Defence deadline"]},
+    }
+
+    def test_clean_output_is_valid(self) -> None:
+        """Test that schema-complete, non-narrative output passes."""
+        assert validate_calibration_output(self.VALID) == (True, [])
+
+    def test_narrative_found_in_nested_strings(self) -> None:
+        """Test that each indicator is reported once, in indicator order."""
+        output = {
+            **self.VALID,
+            "fact_checks": [{"notes": "we recommend X; I think Y"}, {"notes": "recommend again"}],
+        }
+
+        valid, errors = validate_calibration_output(output)
+
+        assert not valid
+        assert errors == [
+            "Possible narrative content detected: 'I think'",
+            "Possible narrative content detected: 'recommend'",
+        ]
+
+    def test_missing_keys_reported(self) -> None:
+        """Test that missing required keys are listed."""
+        valid, errors = validate_calibration_output({"model_version": "LEVQUANT_CALIBRATION_TEMPLATE_v1.0"})
+
+        assert not valid
+        assert "Missing required key: fact_checks" in errors
+
+    def test_parse_and_validate_fenced_output(self) -> None:
+        """Test that parsing and validation run together on raw LLM text."""
+        parsed, errors = parse_and_validate("```json\n" + json.dumps(self.VALID) + "\n```")
+
+        assert parsed == self.VALID
+        assert errors == []
+
+    def test_parse_and_validate_rejects_non_object(self) -> None:
+        """Test that a top-level array is reported instead of crashing."""
+        parsed, errors = parse_and_validate("[1, 2]")
+
+        assert parsed == [1, 2]
+        assert errors == ["Expected a JSON object, got list"]
+
+    def test_parse_and_validate_raises_on_invalid_json(self) -> None:
+        """Test that undecodable output still raises ValueError."""
+        with pytest.raises(ValueError, match="not valid JSON"):
+            parse_and_validate("nope")
+
+
 class TestSaveDailyReport:
     """Tests for save_daily_report function."""
 
@@ -288,6 +397,54 @@ class TestSaveDailyReport:
 
         assert outputs_dir.exists()
 
+    def test_run_stamp_names_report_and_prompt(self, tmp_path: Path) -> None:
+        """Test that the stamp from run() matches the report date and both filenames."""
+        result = DailyAICalibrator().run("new", "", {"scores": {"tripwire": 5}}, {})
+
+        report_path = save_daily_report(result, outputs_dir=tmp_path, stamp=result["stamp"])
+        md_path = export_prompt_markdown(result["raw_prompt"], outputs_dir=tmp_path, stamp=result["stamp"])
+
+        compact_date = result["date"][:19].replace("-", "").replace(":", "")
+        assert result["stamp"] == compact_date
+        assert report_path.name == f"daily_ai_{compact_date}.json"
+        assert md_path.name == f"daily_prompt_{compact_date}.md"
+
+    def test_recreates_outputs_dir_removed_after_first_save(self, tmp_path: Path) -> None:
+        """Test that a directory deleted after being cached as ensured is recreated."""
+        outputs_dir = tmp_path / "reports"
+        first = save_daily_report({"n": 1}, outputs_dir=outputs_dir)
+        first.unlink()
+        outputs_dir.rmdir()
+
+        second = save_daily_report({"n": 2}, outputs_dir=outputs_dir)
+
+        assert json.loads(second.read_text()) == {"n": 2}
+
+    def test_filename_stamp_matches_strftime(self, tmp_path: Path) -> None:
+        """Test that the hand-rolled stamp equals the strftime format it replaces."""
+        from datetime import UTC, datetime
+
+        before = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+        result_path = save_daily_report({}, outputs_dir=tmp_path)
+        after = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+
+        stamp = result_path.stem.removeprefix("daily_ai_")
+        assert before <= stamp <= after
+        assert datetime.strptime(stamp, "%Y%m%dT%H%M%S")
+
+    def test_compact_by_default_indented_on_request(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that reports are single-line unless indent is requested."""
+        monkeypatch.delenv("LEVQUANT_PRETTY", raising=False)
+        report = {"a": {"b": "£9m"}}
+
+        compact = save_daily_report(report, outputs_dir=tmp_path / "c")
+        pretty = save_daily_report(report, outputs_dir=tmp_path / "p", indent=True)
+
+        assert "\n" not in compact.read_text(encoding="utf-8")
+        assert pretty.read_text(encoding="utf-8").startswith("{\n  ")
+        assert json.loads(compact.read_text(encoding="utf-8")) == report
+        assert json.loads(pretty.read_text(encoding="utf-8")) == report
+
 
 class TestExportPromptMarkdown:
     """Tests for export_prompt_markdown function."""
@@ -403,3 +560,218 @@ class TestCalibrationOutputStructure:
 
         # Check for court-safe language guidance
         assert "alleged" in prompt.lower() or "court-safe" in prompt.lower() or "supported by evidence" in prompt.lower()
+
+
+class TestPromptLoaderCache:
+    """Tests for prompt template caching in ai_assistant.prompt_loader."""
+
+    def test_template_read_once(self, monkeypatch) -> None:
+        """Test that repeat loads are served from memory."""
+        from ai_assistant import prompt_loader
+
+        prompt_loader.clear_prompt_cache()
+        first = prompt_loader.load_calibration_prompt("v1")
+        monkeypatch.setattr(prompt_loader, "PROMPTS_DIR", Path("/nonexistent"))
+
+        assert prompt_loader.load_calibration_prompt("v1") is first
+        prompt_loader.clear_prompt_cache()
+        with pytest.raises(FileNotFoundError):
+            prompt_loader.load_calibration_prompt("v1")
+        monkeypatch.undo()
+        prompt_loader.clear_prompt_cache()
+
+    def test_metadata_is_a_fresh_copy(self) -> None:
+        """Test that callers cannot corrupt the cached metadata."""
+        from ai_assistant.prompt_loader import get_prompt_metadata
+
+        meta = get_prompt_metadata("v1")
+        meta["size_bytes"] = -1
+
+        assert get_prompt_metadata("v1")["size_bytes"] > 0
+
+
+class TestPromptCachePrefix:
+    """Tests for the static, cacheable prompt prefix."""
+
+    SNAPSHOT = {
+        "inputs": {"SV1a": 0.5, "SV1b": 0.6, "SV1c": 0.7},
+        "scores": {"upls": 0.55, "tripwire": 6.5},
+        "evaluation": {"decision": "HOLD", "confidence": "Moderate", "tripwire_triggered": False},
+    }
+
+    def test_static_sections_precede_placeholders(self) -> None:
+        """Test that role, lexicon, questionnaire and schema come before any placeholder."""
+        from ai_assistant.prompt_loader import load_calibration_prompt, static_prompt_prefix
+
+        prefix = static_prompt_prefix(load_calibration_prompt("v1"))
+
+        assert "{{" not in prefix
+        for heading in ("ROLE", "LEXICON", "CALIBRATION QUESTIONNAIRE", "OUTPUT SCHEMA"):
+            assert heading in prefix
+
+    def test_prompt_starts_with_static_prefix(self) -> None:
+        """Test that interpolated prompts share the prefix regardless of runtime inputs."""
+        from ai_assistant.prompt_loader import load_calibration_prompt, static_prompt_prefix
+
+        calibrator = DailyAICalibrator()
+        prefix = static_prompt_prefix(load_calibration_prompt("v1"))
+        low = calibrator.build_prompt("", "a", self.SNAPSHOT, {})
+        high = calibrator.build_prompt("ctx", "b", {**self.SNAPSHOT, "scores": {"tripwire": 9}}, {"x": 1})
+
+        assert low.startswith(prefix)
+        assert high.startswith(prefix)
+        assert "Current Pressure Level: 9/10" in high
+
+    def test_run_reports_stable_cache_key(self) -> None:
+        """Test that run() exposes the same prompt_cache_key across different inputs."""
+        calibrator = DailyAICalibrator()
+
+        first = calibrator.run("a", "", self.SNAPSHOT, {})
+        second = calibrator.run("b", "more", self.SNAPSHOT, {"x": 1})
+
+        assert len(first["prompt_cache_key"]) == 64
+        assert first["prompt_cache_key"] == second["prompt_cache_key"]
+
+
+class TestCompactSchema:
+    """Tests for the compact output schema prompt variant."""
+
+    def test_compact_prompt_is_shorter_and_equivalent(self) -> None:
+        """Test that only the schema block changes and it decodes to the same example."""
+        import re
+
+        from ai_assistant.prompt_loader import load_calibration_prompt, load_compact_calibration_prompt
+
+        full = load_calibration_prompt("v1")
+        compact = load_compact_calibration_prompt("v1")
+        pattern = re.compile(r"```json\n(.*?)\n```", re.DOTALL)
+
+        assert len(compact) < len(full)
+        assert "\n" not in pattern.search(compact).group(1)
+        assert json.loads(pattern.search(compact).group(1)) == json.loads(pattern.search(full).group(1))
+        assert pattern.sub("", compact) == pattern.sub("", full)
+
+    def test_calibrator_flag_selects_variant(self) -> None:
+        """Test that compact_schema changes the prompt and its cache key."""
+        snapshot = {"scores": {"tripwire": 5}}
+
+        default = DailyAICalibrator().run("n", "", snapshot, {})
+        compact = DailyAICalibrator(compact_schema=True).run("n", "", snapshot, {})
+
+        assert len(compact["raw_prompt"]) < len(default["raw_prompt"])
+        assert compact["prompt_cache_key"] != default["prompt_cache_key"]
+
+    def test_compact_prompt_metadata_describes_prompt_sent(self) -> None:
+        """Test that run() records metadata for the template it actually used."""
+        from ai_assistant.prompt_loader import load_compact_calibration_prompt
+
+        snapshot = {"inputs": {}, "scores": {"tripwire": 5.0}, "evaluation": {}}
+        default = DailyAICalibrator().run("n", "", snapshot, {})["prompt_metadata"]
+        compact = DailyAICalibrator(compact_schema=True).run("n", "", snapshot, {})["prompt_metadata"]
+        template = load_compact_calibration_prompt("v1")
+
+        assert default["compact_schema"] is False
+        assert compact["compact_schema"] is True
+        assert compact["size_chars"] == len(template) < default["size_chars"]
+        assert compact["line_count"] == len(template.splitlines())
+
+
+class TestInterpolatePrompt:
+    """Tests for single-pass placeholder substitution."""
+
+    def test_injected_text_is_not_reinterpolated(self) -> None:
+        """Test that placeholder-like text inside user context is left verbatim."""
+        from ai_assistant.prompt_loader import interpolate_prompt
+
+        out = interpolate_prompt(
+            "{{NEW_CONTEXT}} | {{PRESSURE_LEVEL}}",
+            {"scores": {"tripwire": 7}},
+            {},
+            "note {{PRESSURE_LEVEL}}",
+            "",
+        )
+
+        assert out == "note {{PRESSURE_LEVEL}} | 7"
+
+    def test_template_without_placeholders_returned_unchanged(self) -> None:
+        """Test the fast path for templates with nothing to substitute."""
+        from ai_assistant.prompt_loader import interpolate_prompt
+
+        template = "static text only"
+
+        assert interpolate_prompt(template, {}, {}, "x", "y") is template
+
+
+class TestBuildPromptCache:
+    """Tests for DailyAICalibrator's per-instance prompt cache."""
+
+    SNAPSHOT = {"scores": {"upls": 0.5, "tripwire": 6}}
+
+    def test_repeat_inputs_skip_rebuild(self, monkeypatch) -> None:
+        """Test that unchanged inputs return the cached prompt without interpolating."""
+        from ai_assistant import daily_calibration
+
+        calibrator = DailyAICalibrator()
+        first = calibrator.build_prompt("all", "new", self.SNAPSHOT, {})
+        monkeypatch.setattr(daily_calibration, "interpolate_prompt", MagicMock(side_effect=AssertionError))
+
+        assert calibrator.build_prompt("all", "new", self.SNAPSHOT, {}) is first
+
+    def test_changed_inputs_rebuild(self) -> None:
+        """Test that any input change produces a fresh prompt."""
+        calibrator = DailyAICalibrator()
+
+        first = calibrator.build_prompt("all", "new", self.SNAPSHOT, {})
+        second = calibrator.build_prompt("all", "new", {"scores": {"upls": 0.5, "tripwire": 7}}, {})
+
+        assert first != second
+        assert "Current Pressure Level: 7/10" in second
+
+    def test_changed_journal_context_rebuilds(self) -> None:
+        """Test that a different all_context misses the cache."""
+        calibrator = DailyAICalibrator()
+
+        first = calibrator.build_prompt("old journal", "new", self.SNAPSHOT, {})
+        second = calibrator.build_prompt("old journal plus more", "new", self.SNAPSHOT, {})
+
+        assert "old journal plus more" in second
+        assert second != first
+        assert calibrator.build_prompt("old journal plus more", "new", self.SNAPSHOT, {}) is second
+
+    def test_unchanged_journal_hits_cache_without_serialising_context(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that an unchanged journal is a cache hit and all_context is never encoded."""
+        from ai_assistant import daily_calibration
+        from ai_assistant.context_journal import add_context, get_all_context
+
+        journal = tmp_path / "journal.jsonl"
+        add_context("Journal entry", "text", "cli", journal)
+        calibrator = DailyAICalibrator()
+        first = calibrator.build_prompt(get_all_context(journal), "new", self.SNAPSHOT, {})
+
+        real_dumps = daily_calibration.jsonio.dumps_bytes
+
+        def dumps_without_context(obj, **kwargs):
+            assert "Journal entry" not in repr(obj)
+            return real_dumps(obj, **kwargs)
+
+        monkeypatch.setattr(daily_calibration.jsonio, "dumps_bytes", dumps_without_context)
+        assert calibrator.build_prompt(get_all_context(journal), "new", self.SNAPSHOT, {}) is first
+
+    def test_key_order_does_not_change_prompt(self) -> None:
+        """Test that reordered snapshot dicts hit the same cache entry and render identically."""
+        calibrator = DailyAICalibrator()
+
+        first = calibrator.build_prompt("all", "new", {"scores": {"upls": 0.5, "tripwire": 6}}, {"b": 1, "a": 2})
+        second = calibrator.build_prompt("all", "new", {"scores": {"tripwire": 6, "upls": 0.5}}, {"a": 2, "b": 1})
+
+        assert second is first
+        assert len(calibrator._prompt_cache) == 1
+
+    def test_cache_is_bounded(self) -> None:
+        """Test that the least recently used prompt is evicted."""
+        calibrator = DailyAICalibrator()
+
+        for i in range(DailyAICalibrator.PROMPT_CACHE_MAX + 2):
+            calibrator.build_prompt("all", f"new {i}", self.SNAPSHOT, {})
+
+        assert len(calibrator._prompt_cache) == DailyAICalibrator.PROMPT_CACHE_MAX
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from decision_support.gdpr_forensics import (
     GDPRForensics,
     ForensicAssumptions,
+    IntegrityRiskResult,
     quick_integrity_check,
 )
 
@@ -25,8 +28,8 @@ class TestGDPRForensics:
             systemic_pattern=False,
         )
         
-        assert result["integrity_risk"]["risk_score"] == 0
-        assert "LOW" in result["integrity_risk"]["risk_level"]
+        assert result.integrity_risk["risk_score"] == 0
+        assert "LOW" in result.integrity_risk["risk_level"]
 
     def test_high_risk_with_manual_override(self) -> None:
         """Test high risk with manual override."""
@@ -39,9 +42,9 @@ class TestGDPRForensics:
             systemic_pattern=True,
         )
         
-        assert result["integrity_risk"]["risk_score"] >= 60
-        assert result["integrity_risk"]["risk_level"].startswith("HIGH") or \
-               result["integrity_risk"]["risk_level"].startswith("CRITICAL")
+        assert result.integrity_risk["risk_score"] >= 60
+        assert result.integrity_risk["risk_level"].startswith("HIGH") or \
+               result.integrity_risk["risk_level"].startswith("CRITICAL")
 
     def test_ico_reportable_threshold(self) -> None:
         """Test ICO reportability at 50+ score."""
@@ -55,7 +58,7 @@ class TestGDPRForensics:
             shadow_data_discovered=False,
             systemic_pattern=False,
         )
-        assert high["ico_reportable"] is True
+        assert high.ico_reportable is True
         
         # Low score - should not be reportable
         low = forensics.calculate_integrity_risk(
@@ -65,7 +68,7 @@ class TestGDPRForensics:
             shadow_data_discovered=False,
             systemic_pattern=False,
         )
-        assert low["ico_reportable"] is False
+        assert low.ico_reportable is False
 
     def test_statutory_exposures_court_safe(self) -> None:
         """Test statutory exposures use court-safe language."""
@@ -75,12 +78,64 @@ class TestGDPRForensics:
             manual_override_proven=True,
         )
         
-        for exposure in result["statutory_exposures"]:
+        for exposure in result.statutory_exposures:
             desc = exposure["description"]
             assert "indicator" in desc.lower() or "potential" in desc.lower()
             assert "proven" not in desc.lower()
             assert "guilty" not in desc.lower()
 
+    def test_statutory_exposures_are_shared_read_only(self) -> None:
+        """Test exposure order is stable and records cannot be mutated through a result."""
+        forensics = GDPRForensics()
+        first = forensics.calculate_integrity_risk(
+            sar_gap_proven=True,
+            manual_override_proven=True,
+        )
+        with pytest.raises(TypeError):
+            first.statutory_exposures[0]["severity"] = "edited"
+        second = forensics.calculate_integrity_risk(
+            sar_gap_proven=True,
+            manual_override_proven=True,
+        )
+        
+        sections = [e["section"] for e in second.statutory_exposures]
+        assert sections == ["s.173", "s.1-3", "Article 5(1)(d)", "Article 12(3)", "Article 15", "Article 9"]
+        assert second.statutory_exposures[0] is first.statutory_exposures[0]
+        assert second.statutory_exposures[0]["severity"] == "high"
+
+    def test_to_dict_copies_exposures_to_plain_dicts(self) -> None:
+        """Test to_dict output is JSON-serialisable and safe to annotate."""
+        result = GDPRForensics().calculate_integrity_risk(
+            sar_gap_proven=True,
+            manual_override_proven=False,
+        )
+        data = result.to_dict()
+        
+        assert all(type(e) is dict for e in data["statutory_exposures"])
+        data["statutory_exposures"][0]["severity"] = "edited"
+        assert result.statutory_exposures[0]["severity"] == "moderate"
+        assert json.loads(json.dumps(data))["statutory_exposures"][0]["section"] == "Article 5(1)(d)"
+
+    @pytest.mark.parametrize("score,prefix", [
+        (0, "LOW"), (19, "LOW"), (20, "ELEVATED"), (39, "ELEVATED"), (40, "MODERATE"),
+        (59, "MODERATE"), (60, "HIGH"), (79, "HIGH"), (80, "CRITICAL"), (100, "CRITICAL"),
+    ])
+    def test_risk_band_boundaries(self, score: int, prefix: str) -> None:
+        """Test each band starts exactly at its threshold."""
+        assert GDPRForensics()._categorize_risk(score).startswith(prefix)
+
+    def test_summary_lists_first_three_indicators_readably(self) -> None:
+        """Test the summary names the first three triggered indicators in plain words."""
+        result = GDPRForensics().calculate_integrity_risk(
+            sar_gap_proven=False,
+            manual_override_proven=True,
+        )
+        
+        assert (
+            "Exposure indicators include: manual override proven, "
+            "special category involved, shadow data discovered."
+        ) in result.court_safe_summary
+
     def test_insurer_impact_assessment(self) -> None:
         """Test insurer impact assessment."""
         forensics = GDPRForensics()
@@ -89,7 +144,7 @@ class TestGDPRForensics:
             manual_override_proven=True,  # High risk
         )
         
-        impact = result["insurer_impact"]
+        impact = result.insurer_impact
         assert "reservation_of_rights" in impact
         assert "iniquity_exclusion" in impact
         assert "coverage_stress" in impact
@@ -102,8 +157,23 @@ class TestGDPRForensics:
             manual_override_proven=False,
         )
         
-        assert result["assumptions"]["sar_gap_proven"] is True
-        assert result["assumptions"]["manual_override_proven"] is False
+        assert result.assumptions["sar_gap_proven"] is True
+        assert result.assumptions["manual_override_proven"] is False
+
+    def test_risk_weights_cannot_be_mutated_through_results(self) -> None:
+        """Test the class weights are read-only and results carry a plain copy."""
+        import json
+        
+        result = GDPRForensics().calculate_integrity_risk(
+            sar_gap_proven=True,
+            manual_override_proven=True,
+        )
+        result.assumptions["risk_weights"]["sar_gap_proven"] = 0
+        
+        assert GDPRForensics.RISK_WEIGHTS["sar_gap_proven"] == 25
+        with pytest.raises(TypeError):
+            GDPRForensics.RISK_WEIGHTS["sar_gap_proven"] = 0
+        assert json.loads(json.dumps(result.to_dict()))["assumptions"]["risk_weights"]["systemic_pattern"] == 15
 
     def test_audit_hash_present(self) -> None:
         """Test audit hash is generated."""
@@ -113,8 +183,29 @@ class TestGDPRForensics:
             manual_override_proven=True,
         )
         
-        assert "audit_hash" in result
-        assert len(result["audit_hash"]) == 16
+        assert len(result.audit_hash) == 16
+
+    def test_audit_hash_reproducible_from_reported_timestamp(self) -> None:
+        """Test that the audit hash is computed over the returned timestamp."""
+        import hashlib
+        import json
+        
+        result = GDPRForensics().calculate_integrity_risk(
+            sar_gap_proven=True,
+            manual_override_proven=False,
+        )
+        audit_data = {
+            "sar_gap": True,
+            "manual_override": False,
+            "special_category": True,
+            "shadow_data": True,
+            "systemic": True,
+            "score": result.integrity_risk["risk_score"],
+            "timestamp": result.timestamp_utc,
+        }
+        expected = hashlib.sha256(json.dumps(audit_data, sort_keys=True).encode()).hexdigest()[:16]
+        
+        assert result.audit_hash == expected
 
     def test_disclaimer_present(self) -> None:
         """Test disclaimer is present."""
@@ -125,7 +216,7 @@ class TestGDPRForensics:
         )
         
         # Case-insensitive check for disclaimer content
-        disclaimer_lower = result["disclaimer"].lower()
+        disclaimer_lower = result.disclaimer.lower()
         assert "potential exposure indicators" in disclaimer_lower
         assert "requires proof" in disclaimer_lower
 
@@ -142,7 +233,115 @@ class TestGDPRForensics:
             manual_override_proven=True,
         )
         
-        assert on["integrity_risk"]["risk_score"] > off["integrity_risk"]["risk_score"]
+        assert on.integrity_risk["risk_score"] > off.integrity_risk["risk_score"]
+
+    def test_weights_and_indicator_order(self) -> None:
+        """Test score is the capped weight sum and indicators keep argument order."""
+        forensics = GDPRForensics()
+        
+        partial = forensics.calculate_integrity_risk(
+            sar_gap_proven=False,
+            manual_override_proven=True,
+            special_category_involved=False,
+            shadow_data_discovered=True,
+            systemic_pattern=False,
+        )
+        full = forensics.calculate_integrity_risk(
+            sar_gap_proven=True,
+            manual_override_proven=True,
+        )
+        
+        assert partial.integrity_risk["risk_score"] == 35 + 15
+        assert partial.integrity_risk["triggered_indicators"] == [
+            "manual_override_proven", "shadow_data_discovered",
+        ]
+        assert full.integrity_risk["risk_score"] == 100
+        assert full.integrity_risk["triggered_indicators"] == list(GDPRForensics.RISK_WEIGHTS)
+
+
+class TestIntegrityRiskBatch:
+    """Tests for GDPRForensics.calculate_integrity_risk_batch."""
+
+    def test_matches_scalar_for_all_combinations(self) -> None:
+        """Test every one of the 32 flag combinations against the scalar method."""
+        import itertools
+        
+        import numpy as np
+        
+        forensics = GDPRForensics()
+        combos = np.array(list(itertools.product([False, True], repeat=5)))
+        
+        scores, masks = forensics.calculate_integrity_risk_batch(combos)
+        
+        names = list(GDPRForensics.RISK_WEIGHTS)
+        for row, score, mask in zip(combos, scores, masks, strict=True):
+            scalar = forensics.calculate_integrity_risk(*map(bool, row)).integrity_risk
+            assert score == scalar["risk_score"]
+            assert [n for j, n in enumerate(names) if mask >> j & 1] == scalar["triggered_indicators"]
+
+    def test_rejects_wrong_shape(self) -> None:
+        """Test that a flat or wrongly sized array is rejected."""
+        with pytest.raises(ValueError, match="shape"):
+            GDPRForensics().calculate_integrity_risk_batch([True, False, True, False, True])
+        with pytest.raises(ValueError, match="shape"):
+            GDPRForensics().calculate_integrity_risk_batch([[True, False, True, False]])
+
+    @pytest.mark.parametrize("flags", [
+        [[0.5, 0.0, 0.0, 0.0, 0.0]],
+        [["False", "False", "False", "False", "False"]],
+    ])
+    def test_rejects_non_boolean_dtype(self, flags: list) -> None:
+        """Test that floats and strings are rejected rather than coerced to True."""
+        with pytest.raises(TypeError, match="dtype"):
+            GDPRForensics().calculate_integrity_risk_batch(flags)
+
+    def test_integer_flags(self) -> None:
+        """Test 0/1 integer flags are accepted and other integers rejected."""
+        forensics = GDPRForensics()
+        scores, masks = forensics.calculate_integrity_risk_batch([[1, 0, 0, 0, 1]])
+        
+        assert scores.tolist() == [40]
+        assert masks.tolist() == [0b10001]
+        with pytest.raises(ValueError, match="0 or 1"):
+            forensics.calculate_integrity_risk_batch([[2, 0, 0, 0, 0]])
+
+    def test_empty_batch(self) -> None:
+        """Test a (0, 5) array returns empty results."""
+        import numpy as np
+        
+        scores, masks = GDPRForensics().calculate_integrity_risk_batch(np.zeros((0, 5), dtype=bool))
+        
+        assert scores.shape == masks.shape == (0,)
+
+
+class TestIntegrityRiskResult:
+    """Tests for the IntegrityRiskResult record."""
+
+    def test_to_dict_keeps_json_schema(self) -> None:
+        """Test to_dict exposes the original top-level keys in order."""
+        result = GDPRForensics().calculate_integrity_risk(
+            sar_gap_proven=True,
+            manual_override_proven=True,
+        )
+        
+        assert isinstance(result, IntegrityRiskResult)
+        data = result.to_dict()
+        assert list(data) == [
+            "timestamp_utc", "audit_hash", "model_version", "assumptions",
+            "integrity_risk", "statutory_exposures", "ico_reportable",
+            "ico_reportability_note", "insurer_impact", "court_safe_summary",
+            "disclaimer",
+        ]
+        assert data["audit_hash"] == result.audit_hash
+        assert json.loads(json.dumps(data))["integrity_risk"] == result.integrity_risk
+
+    def test_slots_reject_unknown_fields(self) -> None:
+        """Test the record has no per-instance __dict__."""
+        result = GDPRForensics().calculate_integrity_risk(False, False)
+        
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.extra = 1
 
 
 class TestQuickIntegrityCheck:
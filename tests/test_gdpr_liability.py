@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import dataclasses
+import itertools
+import json
+
+import numpy as np
 import pytest
 
 from decision_support.gdpr_liability import (
+    CONTROLLER_DTYPE,
     DataControllerExposure,
     GdprLiabilityPricer,
+    controllers_to_array,
     create_hiloka_exposure,
     create_maven_exposure,
     HILOKA_GDPR_EXPOSURE,
@@ -30,9 +37,9 @@ class TestGdprLiabilityPricer:
         pricer = GdprLiabilityPricer(controller)
         result = pricer.calculate_article_82_exposure()
         
-        assert result["distress_level"] == "low"
-        assert result["total_exposure_low"] == 100 * 100  # 100 subjects × £100
-        assert result["total_exposure_high"] == 100 * 500  # 100 subjects × £500
+        assert result.distress_level == "low"
+        assert result.total_exposure_low == 100 * 100  # 100 subjects × £100
+        assert result.total_exposure_high == 100 * 500  # 100 subjects × £500
 
     def test_calculate_article_82_severe_distress(self) -> None:
         """Test Article 82 calculation for severe distress."""
@@ -47,9 +54,9 @@ class TestGdprLiabilityPricer:
         pricer = GdprLiabilityPricer(controller)
         result = pricer.calculate_article_82_exposure()
         
-        assert result["distress_level"] == "severe"
-        assert result["total_exposure_low"] == 50 * 5000
-        assert result["total_exposure_high"] == 50 * 10000
+        assert result.distress_level == "severe"
+        assert result.total_exposure_low == 50 * 5000
+        assert result.total_exposure_high == 50 * 10000
 
     def test_calculate_ico_fine_minor(self) -> None:
         """Test ICO fine calculation for minor violations."""
@@ -64,8 +71,8 @@ class TestGdprLiabilityPricer:
         pricer = GdprLiabilityPricer(controller)
         result = pricer.calculate_ico_fine_exposure()
         
-        assert result["fine_band"] == "minor"
-        assert result["max_fine_calculated"] == 10_000_000 * 0.005  # 0.5%
+        assert result.fine_band == "minor"
+        assert result.max_fine_calculated == 10_000_000 * 0.005  # 0.5%
 
     def test_calculate_ico_fine_serious(self) -> None:
         """Test ICO fine calculation for serious violations."""
@@ -80,11 +87,11 @@ class TestGdprLiabilityPricer:
         pricer = GdprLiabilityPricer(controller)
         result = pricer.calculate_ico_fine_exposure()
         
-        assert result["fine_band"] == "serious"
-        assert result["violations_identified"] >= 4
+        assert result.fine_band == "serious"
+        assert result.violations_identified >= 4
         # Should be max of 4% turnover or £17.5m
         expected_fine = max(10_000_000 * 0.04, 17_500_000)
-        assert result["max_fine_calculated"] == expected_fine
+        assert result.max_fine_calculated == expected_fine
 
     def test_shadow_data_risk_no_dsar(self) -> None:
         """Test shadow data risk when no DSAR refused."""
@@ -99,7 +106,7 @@ class TestGdprLiabilityPricer:
         pricer = GdprLiabilityPricer(controller)
         result = pricer.calculate_shadow_data_risk()
         
-        assert result["risk_present"] is False
+        assert result.risk_present is False
 
     def test_shadow_data_risk_critical(self) -> None:
         """Test shadow data risk with special category data."""
@@ -114,9 +121,9 @@ class TestGdprLiabilityPricer:
         pricer = GdprLiabilityPricer(controller)
         result = pricer.calculate_shadow_data_risk()
         
-        assert result["risk_present"] is True
-        assert result["risk_level"] == "CRITICAL"
-        assert result["multiplier"] == 3.0
+        assert result.risk_present is True
+        assert result.risk_level == "CRITICAL"
+        assert result.multiplier == 3.0
 
     def test_generate_total_exposure_report(self) -> None:
         """Test comprehensive exposure report generation."""
@@ -131,12 +138,33 @@ class TestGdprLiabilityPricer:
         pricer = GdprLiabilityPricer(controller)
         report = pricer.generate_total_exposure_report()
         
-        assert report["controller"] == "Test Controller"
-        assert "article_82_exposure" in report
-        assert "ico_fine_exposure" in report
-        assert "shadow_data_risk" in report
-        assert "combined_maximum_exposure" in report
-        assert "tactical_insights" in report
+        assert report.controller == "Test Controller"
+        data = report.to_dict()
+        assert "article_82_exposure" in data
+        assert "ico_fine_exposure" in data
+        assert "shadow_data_risk" in data
+        assert "combined_maximum_exposure" in data
+        assert "tactical_insights" in data
+        assert data["total_compensatory_exposure"] == {
+            "low": report.total_compensatory_low,
+            "high": report.total_compensatory_high,
+        }
+        assert json.loads(json.dumps(data)) == data
+
+    def test_shadow_data_to_dict_without_dsar(self) -> None:
+        """Test the no-DSAR shadow result keeps its two-key JSON shape."""
+        controller = DataControllerExposure(
+            controller_name="Test",
+            annual_turnover_gbp=1_000_000,
+            data_subjects_affected=10,
+            special_category_data=True,
+            dsar_refused=False,
+            shadow_data_discovered=True,
+        )
+        
+        result = GdprLiabilityPricer(controller).calculate_shadow_data_risk()
+        
+        assert set(result.to_dict()) == {"risk_present", "notes"}
 
     def test_tactical_insights_special_category(self) -> None:
         """Test tactical insights for special category data."""
@@ -149,7 +177,7 @@ class TestGdprLiabilityPricer:
             shadow_data_discovered=False,
         )
         pricer = GdprLiabilityPricer(controller)
-        insights = pricer._generate_tactical_insights()
+        insights = pricer.generate_total_exposure_report().tactical_insights
         
         assert any("Article 9" in i for i in insights)
 
@@ -164,11 +192,110 @@ class TestGdprLiabilityPricer:
             shadow_data_discovered=False,
         )
         pricer = GdprLiabilityPricer(controller)
-        insights = pricer._generate_tactical_insights()
+        insights = pricer.generate_total_exposure_report().tactical_insights
         
         assert any("Article 82" in i for i in insights)
         assert any("ICO complaint" in i for i in insights)
 
+    def test_display_strings(self) -> None:
+        """Test per-subject range and fine percentage strings."""
+        report = HILOKA_GDPR_EXPOSURE.generate_total_exposure_report()
+        
+        assert report.article_82_exposure.per_subject_range == "£5,000 - £10,000"
+        assert report.ico_fine_exposure.fine_percentage == "4.0%"
+
+
+    def test_flat_report_has_fixed_schema(self) -> None:
+        """Test flat records share one key order and hold only scalars."""
+        with_dsar = HILOKA_GDPR_EXPOSURE.generate_total_exposure_report_flat()
+        controller = dataclasses.replace(HILOKA_GDPR_EXPOSURE.controller, dsar_refused=False)
+        without_dsar = GdprLiabilityPricer(controller).generate_total_exposure_report_flat()
+        
+        assert list(with_dsar) == list(without_dsar)
+        assert all(not isinstance(v, (dict, list, tuple)) for v in with_dsar.values())
+        nested = HILOKA_GDPR_EXPOSURE.generate_total_exposure_report().to_dict()
+        assert with_dsar["article_82.total_exposure_high"] == nested["article_82_exposure"]["total_exposure_high"]
+        assert with_dsar["total_compensatory.low"] == nested["total_compensatory_exposure"]["low"]
+        assert with_dsar["tactical_insights"].split("\n") == nested["tactical_insights"]
+        assert without_dsar["shadow_data.risk_present"] is False
+
+
+    def test_band_tables_read_only(self) -> None:
+        """Test class-level band tables cannot be edited at runtime."""
+        with pytest.raises(TypeError):
+            GdprLiabilityPricer.FINE_BANDS["serious"] = 0.1
+        with pytest.raises(TypeError):
+            GdprLiabilityPricer.DISTRESS_RANGES["low"] = (0, 0)
+
+
+    def test_sub_result_to_dict_matches_asdict(self) -> None:
+        """Test the shallow to_dict equals dataclasses.asdict, keys in order."""
+        report = HILOKA_GDPR_EXPOSURE.generate_total_exposure_report()
+        
+        for result in (report.article_82_exposure, report.ico_fine_exposure, report.shadow_data_risk):
+            data = result.to_dict()
+            assert data == dataclasses.asdict(result)
+            assert list(data) == [f.name for f in dataclasses.fields(result)]
+
+
+class TestReportMemoization:
+    """Tests for per-controller report caching."""
+
+    def test_controller_is_frozen(self) -> None:
+        """Test exposure configs cannot be mutated after construction."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            HILOKA_GDPR_EXPOSURE.controller.dsar_refused = False
+
+    def test_cached_report_is_frozen_and_reused(self) -> None:
+        """Test repeat calls share one immutable report."""
+        pricer = create_hiloka_exposure()
+        first = pricer.generate_total_exposure_report()
+        
+        assert pricer.generate_total_exposure_report() is first
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.article_82_exposure.distress_level = "edited"
+
+    def test_to_dict_not_shared_with_callers(self) -> None:
+        """Test editing a to_dict() copy does not leak into later calls."""
+        pricer = create_hiloka_exposure()
+        first = pricer.generate_total_exposure_report().to_dict()
+        first["article_82_exposure"]["distress_level"] = "edited"
+        first["tactical_insights"].clear()
+        
+        second = pricer.generate_total_exposure_report().to_dict()
+        
+        assert second["article_82_exposure"]["distress_level"] == "severe"
+        assert second["tactical_insights"]
+
+    def test_truthy_int_flags_match_bools(self) -> None:
+        """Test non-bool truthy flags price the same as True instead of raising."""
+        def pricer(flag: object) -> GdprLiabilityPricer:
+            return GdprLiabilityPricer(DataControllerExposure(
+                controller_name="Test",
+                annual_turnover_gbp=1_000_000,
+                data_subjects_affected=100,
+                special_category_data=flag,
+                dsar_refused=flag,
+                shadow_data_discovered=flag,
+            ))
+        
+        as_int = pricer(2).generate_total_exposure_report()
+        as_bool = pricer(True).generate_total_exposure_report()
+        
+        assert as_int.combined_maximum_exposure == as_bool.combined_maximum_exposure
+        assert as_int.shadow_data_risk.risk_level == as_bool.shadow_data_risk.risk_level
+
+    def test_replacing_controller_refreshes_reports(self) -> None:
+        """Test assigning a new controller invalidates cached reports."""
+        pricer = create_maven_exposure()
+        before = pricer.calculate_ico_fine_exposure()
+        
+        pricer.controller = dataclasses.replace(pricer.controller, annual_turnover_gbp=1_000_000)
+        after = pricer.calculate_ico_fine_exposure()
+        
+        assert after.annual_turnover == 1_000_000
+        assert after.max_fine_calculated < before.max_fine_calculated
+
 
 class TestPreconfiguredExposures:
     """Tests for pre-configured exposure models."""
@@ -178,7 +305,7 @@ class TestPreconfiguredExposures:
         hiloka = create_hiloka_exposure()
         report = hiloka.generate_total_exposure_report()
         
-        assert report["controller"] == "Hiloka Ltd"
+        assert report.controller == "Hiloka Ltd"
         assert hiloka.controller.special_category_data is True
         assert hiloka.controller.dsar_refused is True
 
@@ -187,21 +314,99 @@ class TestPreconfiguredExposures:
         maven = create_maven_exposure()
         report = maven.generate_total_exposure_report()
         
-        assert report["controller"] == "Maven Capital Partners"
+        assert report.controller == "Maven Capital Partners"
         assert maven.controller.annual_turnover_gbp == 50_000_000
 
+    def test_preconfigured_exposures_built_once(self) -> None:
+        """Test lazy module attributes are cached after first access."""
+        import decision_support.gdpr_liability as module
+        
+        assert module.HILOKA_GDPR_EXPOSURE is module.HILOKA_GDPR_EXPOSURE
+        assert "HILOKA_GDPR_EXPOSURE" in vars(module)
+        with pytest.raises(AttributeError):
+            module.NOT_A_PRECONFIGURED_EXPOSURE
+
     def test_hiloka_significant_exposure(self) -> None:
         """Test that Hiloka has significant exposure."""
         report = HILOKA_GDPR_EXPOSURE.generate_total_exposure_report()
         
         # Hiloka should have substantial Article 82 exposure
-        article_82 = report["article_82_exposure"]
-        assert article_82["total_exposure_high"] > 200_000
+        article_82 = report.article_82_exposure
+        assert article_82.total_exposure_high > 200_000
 
     def test_maven_large_turnover_fine(self) -> None:
         """Test that Maven has large ICO fine exposure."""
         report = MAVEN_GDPR_EXPOSURE.generate_total_exposure_report()
         
         # Maven's £50m turnover × 2% = £1m potential fine (moderate band)
-        ico_fine = report["ico_fine_exposure"]
-        assert ico_fine["max_fine_calculated"] >= 1_000_000
+        ico_fine = report.ico_fine_exposure
+        assert ico_fine.max_fine_calculated >= 1_000_000
+
+
+class TestBatchReport:
+    """Tests for GdprLiabilityPricer.batch_report."""
+
+    @staticmethod
+    def _all_flag_combinations() -> list[DataControllerExposure]:
+        return [
+            DataControllerExposure(
+                controller_name=f"C{i}",
+                annual_turnover_gbp=turnover,
+                data_subjects_affected=120,
+                special_category_data=special,
+                dsar_refused=dsar,
+                shadow_data_discovered=shadow,
+            )
+            for i, (turnover, special, dsar, shadow) in enumerate(
+                itertools.product((3_000_000, 900_000_000), (False, True), (False, True), (False, True))
+            )
+        ]
+
+    def test_matches_scalar_report(self) -> None:
+        """Test every flag combination agrees with the scalar report."""
+        controllers = self._all_flag_combinations()
+        rows = GdprLiabilityPricer.batch_report(controllers_to_array(controllers))
+        levels = list(GdprLiabilityPricer.DISTRESS_RANGES)
+        bands = list(GdprLiabilityPricer.FINE_BANDS)
+        
+        for controller, row in zip(controllers, rows, strict=True):
+            report = GdprLiabilityPricer(controller).generate_total_exposure_report().to_dict()
+            article_82 = report["article_82_exposure"]
+            ico_fine = report["ico_fine_exposure"]
+            shadow = report["shadow_data_risk"]
+            
+            assert levels[row["distress_index"]] == article_82["distress_level"]
+            assert row["total_exposure_low"] == article_82["total_exposure_low"]
+            assert row["total_exposure_high"] == article_82["total_exposure_high"]
+            assert row["violations"] == ico_fine["violations_identified"]
+            assert bands[row["fine_band_index"]] == ico_fine["fine_band"]
+            assert row["max_fine_calculated"] == ico_fine["max_fine_calculated"]
+            assert row["shadow_adjusted_exposure"] == shadow.get("adjusted_exposure", 0)
+            assert row["compensatory_low"] == report["total_compensatory_exposure"]["low"]
+            assert row["compensatory_high"] == report["total_compensatory_exposure"]["high"]
+            assert row["combined_maximum_exposure"] == report["combined_maximum_exposure"]
+
+    def test_accepts_recarray(self) -> None:
+        """Test a recarray input with the controller columns is accepted."""
+        controllers = controllers_to_array([HILOKA_GDPR_EXPOSURE.controller]).view(np.recarray)
+        
+        rows = GdprLiabilityPricer.batch_report(controllers)
+        
+        expected = HILOKA_GDPR_EXPOSURE.generate_total_exposure_report()
+        assert rows[0]["combined_maximum_exposure"] == expected.combined_maximum_exposure
+
+    def test_empty_portfolio(self) -> None:
+        """Test an empty input yields an empty report."""
+        rows = GdprLiabilityPricer.batch_report(np.empty(0, dtype=CONTROLLER_DTYPE))
+        
+        assert rows.shape == (0,)
+
+    def test_ico_fine_batch_bands_and_floor(self) -> None:
+        """Test band lookup per violation count and the serious-band floor."""
+        violations = np.array([0, 1, 2, 3, 4, 7])
+        turnover = np.full(violations.shape, 100_000_000.0)
+        
+        band, max_fine = GdprLiabilityPricer.ico_fine_batch(turnover, violations)
+        
+        assert band.tolist() == [0, 0, 1, 1, 2, 2]
+        assert max_fine.tolist() == [500_000, 500_000, 2_000_000, 2_000_000, 17_500_000, 17_500_000]
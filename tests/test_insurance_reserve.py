@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import itertools
+
+import numpy as np
 import pytest
 
 from decision_support.insurance_reserve import (
+    FLAG_BITS,
     InsuranceReserveModel,
+    coverage_stress_scores,
+    flags_to_mask,
     calculate_settlement_with_reserve_pressure,
+    calculate_settlement_with_reserve_pressure_batch,
+    reserve_pressure_sweep,
 )
 
 
@@ -122,6 +130,92 @@ class TestInsuranceReserveModel:
         assert any("personal liability" in t.lower() for t in tactics)
 
 
+    def test_tactical_recommendations_default(self) -> None:
+        """Test the standard tactic is the only one without reserve pressure."""
+        model = InsuranceReserveModel(case_reserve_gbp=10_000_000)
+        report = model.generate_reserve_report(5_000_000, [])
+        
+        assert report["tactical_recommendations"] == [
+            "Standard negotiation approach - reserves not a pressure point"
+        ]
+
+
+class TestBandLabels:
+    """Tests for stress and leverage band boundaries."""
+
+    @pytest.mark.parametrize("score,prefix", [
+        (0.0, "NORMAL"), (1e-9, "MODERATE"), (0.29, "MODERATE"), (0.3, "ELEVATED"),
+        (0.5, "HIGH"), (0.69, "HIGH"), (0.7, "CRITICAL"), (1.0, "CRITICAL"),
+    ])
+    def test_stress_bands(self, score: float, prefix: str) -> None:
+        """Test each stress boundary is inclusive of its lower bound."""
+        assert InsuranceReserveModel()._categorize_stress(score).startswith(prefix)
+
+    @pytest.mark.parametrize("score,prefix", [
+        (0.0, "NONE"), (0.01, "LIMITED"), (2.99, "LIMITED"), (3, "MODERATE"),
+        (5, "HIGH"), (6.99, "HIGH"), (7, "MAXIMUM"), (10, "MAXIMUM"),
+    ])
+    def test_leverage_bands(self, score: float, prefix: str) -> None:
+        """Test each leverage boundary is inclusive of its lower bound."""
+        assert InsuranceReserveModel()._categorize_leverage(score).startswith(prefix)
+
+
+class TestCoverageStressMask:
+    """Tests for the bitmask coverage stress scoring."""
+
+    def test_flags_to_mask_ignores_unknown_and_duplicates(self) -> None:
+        """Test unknown flags are dropped and repeats set the bit once."""
+        mask = flags_to_mask(["sra_formal_action", "not_a_flag", "sra_formal_action"])
+        
+        assert mask == FLAG_BITS["sra_formal_action"]
+
+    def test_duplicate_flag_counted_once(self) -> None:
+        """Test a repeated flag does not inflate the stress score."""
+        model = InsuranceReserveModel()
+        once = model.check_coverage_stress(["shadow_director_proven"])
+        twice = model.check_coverage_stress(["shadow_director_proven"] * 2)
+        
+        assert twice["coverage_stress_score"] == once["coverage_stress_score"] == 0.2
+        assert twice["triggered_exclusions"] == ["shadow_director_proven"]
+
+    def test_unique_flags_match_per_flag_weights(self) -> None:
+        """Test distinct flags still sum their weights, unknown flags are dropped."""
+        model = InsuranceReserveModel()
+        result = model.check_coverage_stress(
+            ["criminal_investigation_escalation", "unknown", "sra_formal_action"]
+        )
+        
+        assert result["coverage_stress_score"] == pytest.approx(0.7)
+        assert result["triggered_exclusions"] == [
+            "sra_formal_action", "criminal_investigation_escalation",
+        ]
+
+    def test_score_independent_of_flag_order(self) -> None:
+        """Test flag order changes neither score nor exclusion order."""
+        model = InsuranceReserveModel()
+        flags = ["metadata_12june_creation", "adverse_judicial_language", "sra_formal_action"]
+        
+        results = [model.check_coverage_stress(list(p)) for p in itertools.permutations(flags)]
+        
+        assert len({r["coverage_stress_score"] for r in results}) == 1
+        assert all(r["triggered_exclusions"] == [
+            "sra_formal_action", "adverse_judicial_language", "metadata_12june_creation",
+        ] for r in results)
+
+    def test_batch_matches_scalar(self) -> None:
+        """Test batch scores agree with check_coverage_stress for every mask."""
+        model = InsuranceReserveModel()
+        names = list(FLAG_BITS)
+        masks = np.arange(1 << len(names))
+        
+        scores = coverage_stress_scores(masks)
+        
+        for mask, score in zip(masks, scores, strict=True):
+            flags = [n for n in names if mask & FLAG_BITS[n]]
+            assert score == model.check_coverage_stress(flags)["coverage_stress_score"]
+        assert scores.max() == 1.0
+
+
 class TestSettlementWithReservePressure:
     """Tests for settlement calculation with reserve pressure."""
 
@@ -151,3 +245,55 @@ class TestSettlementWithReservePressure:
         result = calculate_settlement_with_reserve_pressure(10_000_000, model, [])
         
         assert result["recommended_demand"] <= 8_000_000
+
+
+    def test_check_coverage_stress_batch(self) -> None:
+        """Test batch scores and masks agree with per-scenario calls."""
+        model = InsuranceReserveModel()
+        flag_sets = [
+            [],
+            ["sra_formal_action", "unknown"],
+            ["criminal_investigation_escalation", "sra_formal_action", "adverse_judicial_language"],
+        ]
+        
+        scores, masks = model.check_coverage_stress_batch(flag_sets)
+        
+        assert masks.tolist() == [0, 1, 7]
+        assert scores.tolist() == [
+            model.check_coverage_stress(flags)["coverage_stress_score"] for flags in flag_sets
+        ]
+
+
+class TestReservePressureSweep:
+    """Tests for the vectorised reserve pressure sweep."""
+
+    @pytest.mark.parametrize("flags", [
+        [],
+        ["sra_formal_action", "criminal_investigation_escalation"],
+    ])
+    def test_matches_scalar(self, flags: list[str]) -> None:
+        """Test each draw equals the scalar settlement calculation."""
+        model = InsuranceReserveModel(case_reserve_gbp=1_500_000, policy_limit_gbp=8_000_000)
+        bases = np.array([0.0, 1_000_000, 2_000_000, 5_000_000, 7_900_000, 9_000_000, 20_000_000])
+        
+        sweep = reserve_pressure_sweep(bases, model, flags)
+        
+        assert sweep.shape == (len(bases), 3)
+        for base, (adjusted, multiplier, recommended) in zip(bases, sweep, strict=True):
+            result = calculate_settlement_with_reserve_pressure(float(base), model, flags)
+            assert adjusted == result["reserve_adjusted_settlement"]
+            assert multiplier == result["leverage_multiplier"]
+            assert recommended == result["recommended_demand"]
+
+    def test_batch_dict_matches_scalar_keys(self) -> None:
+        """Test the dict batch API mirrors the scalar result per settlement."""
+        model = InsuranceReserveModel(case_reserve_gbp=1_000_000)
+        flags = ["sra_formal_action", "criminal_investigation_escalation"]
+        bases = [3_000_000, 12_000_000]
+        
+        batch = calculate_settlement_with_reserve_pressure_batch(bases, model, flags)
+        
+        for i, base in enumerate(bases):
+            result = calculate_settlement_with_reserve_pressure(base, model, flags)
+            for key, column in batch.items():
+                assert column[i] == result[key]
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from decision_support.insurance_shadow import (
     InsuranceShadowReserve,
     ShadowReserveAssumptions,
+    ShadowReserveResult,
     quick_shadow_check,
 )
 
@@ -18,10 +20,10 @@ class TestInsuranceShadowReserve:
         """Test that reserve increases with litigation stage."""
         shadow = InsuranceShadowReserve()
         
-        notification = shadow.calculate_shadow_reserve(5_000_000, "notification")
-        defence = shadow.calculate_shadow_reserve(5_000_000, "defence_filed")
-        procedural = shadow.calculate_shadow_reserve(5_000_000, "procedural_irregularity_flagged")
-        trial = shadow.calculate_shadow_reserve(5_000_000, "trial_listed")
+        notification = shadow.calculate_shadow_reserve(5_000_000, "notification").to_dict()
+        defence = shadow.calculate_shadow_reserve(5_000_000, "defence_filed").to_dict()
+        procedural = shadow.calculate_shadow_reserve(5_000_000, "procedural_irregularity_flagged").to_dict()
+        trial = shadow.calculate_shadow_reserve(5_000_000, "trial_listed").to_dict()
         
         n_reserve = notification["shadow_reserve"]["estimated_reserve_locked_gbp"]
         d_reserve = defence["shadow_reserve"]["estimated_reserve_locked_gbp"]
@@ -34,8 +36,8 @@ class TestInsuranceShadowReserve:
         """Test that reserve scales with claim value."""
         shadow = InsuranceShadowReserve()
         
-        small = shadow.calculate_shadow_reserve(1_000_000, "procedural_irregularity_flagged")
-        large = shadow.calculate_shadow_reserve(10_000_000, "procedural_irregularity_flagged")
+        small = shadow.calculate_shadow_reserve(1_000_000, "procedural_irregularity_flagged").to_dict()
+        large = shadow.calculate_shadow_reserve(10_000_000, "procedural_irregularity_flagged").to_dict()
         
         small_reserve = small["shadow_reserve"]["estimated_reserve_locked_gbp"]
         large_reserve = large["shadow_reserve"]["estimated_reserve_locked_gbp"]
@@ -45,7 +47,7 @@ class TestInsuranceShadowReserve:
     def test_dead_money_cost_calculated(self) -> None:
         """Test dead money cost calculation."""
         shadow = InsuranceShadowReserve()
-        result = shadow.calculate_shadow_reserve(5_000_000, "procedural_irregularity_flagged")
+        result = shadow.calculate_shadow_reserve(5_000_000, "procedural_irregularity_flagged").to_dict()
         
         locked = result["shadow_reserve"]["estimated_reserve_locked_gbp"]
         annual = result["dead_money_cost"]["annual_cost_gbp"]
@@ -67,20 +69,52 @@ class TestInsuranceShadowReserve:
         assert progression["target_stage"] == "trial_listed"
         assert progression["reserve_increase_gbp"] > 0
 
+    def test_stage_progression_matches_full_reports(self) -> None:
+        """Test progression reserves equal those in the full shadow reports."""
+        shadow = InsuranceShadowReserve()
+        claim = 3_333_333.33
+        
+        progression = shadow.calculate_stage_progression(claim, "defence_filed", "unknown_stage")
+        
+        current = shadow.calculate_shadow_reserve(claim, "defence_filed").to_dict()["shadow_reserve"]
+        target = shadow.calculate_shadow_reserve(claim, "unknown_stage").to_dict()["shadow_reserve"]
+        assert progression["current_reserve_gbp"] == current["estimated_reserve_locked_gbp"]
+        assert progression["target_reserve_gbp"] == target["estimated_reserve_locked_gbp"]
+
     def test_negotiation_lever_generated(self) -> None:
         """Test negotiation lever is generated."""
         shadow = InsuranceShadowReserve()
-        result = shadow.calculate_shadow_reserve(5_000_000, "trial_listed")
+        result = shadow.calculate_shadow_reserve(5_000_000, "trial_listed").to_dict()
         
         lever = result["negotiation_lever"]
         assert "lever_strength" in lever
         assert "rationale" in lever
         assert "suggested_tactic" in lever
 
+    def test_trial_lever_rationale_text(self) -> None:
+        """Test the trial lever rationale fills locked capital and monthly cost."""
+        shadow = InsuranceShadowReserve()
+        result = shadow.calculate_shadow_reserve(10_000_000, "trial_listed").to_dict()
+        lever = result["negotiation_lever"]
+        
+        assert lever["lever_strength"] == "MAXIMUM"
+        assert lever["rationale"] == (
+            "Trial listed with £6,500,000 locked capital. "
+            "Insurer paying £32,500/month in dead money costs. "
+            "Strong incentive to settle before trial costs escalate."
+        )
+
+    def test_notification_lever_is_low(self) -> None:
+        """Test stages without a template (notification) get the LOW lever."""
+        result = InsuranceShadowReserve().calculate_shadow_reserve(1_000_000, "notification").to_dict()
+        
+        assert result["negotiation_lever"]["lever_strength"] == "LOW"
+        assert "£50,000 provisionally reserved" in result["negotiation_lever"]["rationale"]
+
     def test_illustrative_disclaimer_present(self) -> None:
         """Test illustrative disclaimer is present."""
         shadow = InsuranceShadowReserve()
-        result = shadow.calculate_shadow_reserve(5_000_000, "procedural_irregularity_flagged")
+        result = shadow.calculate_shadow_reserve(5_000_000, "procedural_irregularity_flagged").to_dict()
         
         # Case-insensitive check
         note_lower = result["illustrative_note"].lower()
@@ -90,7 +124,7 @@ class TestInsuranceShadowReserve:
     def test_assumptions_echoed(self) -> None:
         """Test assumptions are echoed in output."""
         shadow = InsuranceShadowReserve()
-        result = shadow.calculate_shadow_reserve(7_000_000, "defence_filed")
+        result = shadow.calculate_shadow_reserve(7_000_000, "defence_filed").to_dict()
         
         assert result["assumptions"]["claim_value_gbp"] == 7_000_000
         assert result["assumptions"]["litigation_stage"] == "defence_filed"
@@ -98,21 +132,188 @@ class TestInsuranceShadowReserve:
     def test_audit_hash_present(self) -> None:
         """Test audit hash is generated."""
         shadow = InsuranceShadowReserve()
-        result = shadow.calculate_shadow_reserve(5_000_000, "procedural_irregularity_flagged")
+        result = shadow.calculate_shadow_reserve(5_000_000, "procedural_irregularity_flagged").to_dict()
         
         assert "audit_hash" in result
         assert len(result["audit_hash"]) == 16
 
+    def test_audit_hash_reproducible_from_reported_timestamp(self) -> None:
+        """Test that the audit hash is computed over the returned timestamp."""
+        import hashlib
+        import json
+        
+        result = InsuranceShadowReserve().calculate_shadow_reserve(2_000_000, "defence_filed").to_dict()
+        audit_data = {
+            "claim_value": 2_000_000,
+            "stage": "defence_filed",
+            "reserve_ratio": 0.15,
+            "coc": 0.06,
+            "timestamp": result["timestamp_utc"],
+        }
+        expected = hashlib.sha256(json.dumps(audit_data, sort_keys=True).encode()).hexdigest()[:16]
+        
+        assert result["audit_hash"] == expected
+
+    @pytest.mark.parametrize(
+        "claim_value, coc",
+        [(1e16, 0.1), (0.1 + 0.2, 1e-7), (np.float64(3.5e6), np.float64(0.06)), (float("nan"), 0.06)],
+    )
+    def test_audit_hash_matches_json_dumps(self, claim_value, coc) -> None:
+        """Test the assembled audit payload hashes like json.dumps(sort_keys=True)."""
+        import hashlib
+        import json
+
+        result = InsuranceShadowReserve().calculate_shadow_reserve(
+            claim_value, "trial_listed", cost_of_capital_rate=coc
+        )
+        audit_data = {
+            "claim_value": claim_value,
+            "stage": "trial_listed",
+            "reserve_ratio": 0.65,
+            "coc": coc,
+            "timestamp": result.timestamp_utc,
+        }
+        expected = hashlib.sha256(json.dumps(audit_data, sort_keys=True).encode()).hexdigest()[:16]
+
+        assert result.audit_hash == expected
+
+    @pytest.mark.parametrize(
+        "ns", [1_700_000_000_000_000_000, 1_700_000_000_123_456_789, 1_700_000_001_000_001_000]
+    )
+    def test_timestamp_matches_datetime_isoformat(self, ns, monkeypatch) -> None:
+        """Test the cached-prefix timestamp renders like datetime.isoformat()."""
+        import time
+        from datetime import UTC, datetime, timedelta
+
+        monkeypatch.setattr(time, "time_ns", lambda: ns)
+        result = InsuranceShadowReserve().calculate_shadow_reserve(1_000_000, "notification")
+        expected = (datetime(1970, 1, 1, tzinfo=UTC) + timedelta(microseconds=ns // 1000)).isoformat()
+
+        assert result.timestamp_utc == expected
+
     def test_court_safe_summary(self) -> None:
         """Test court-safe summary language."""
         shadow = InsuranceShadowReserve()
-        result = shadow.calculate_shadow_reserve(5_000_000, "procedural_irregularity_flagged")
+        result = shadow.calculate_shadow_reserve(5_000_000, "procedural_irregularity_flagged").to_dict()
         
         summary = result["court_safe_summary"]
         assert "illustrative" in summary.lower() or "analysis" in summary.lower()
         assert "not an actual insurer" in summary.lower()
 
 
+    def test_unknown_stage_falls_back_to_notification(self) -> None:
+        """Test an unrecognised stage uses the notification ratio."""
+        shadow = InsuranceShadowReserve()
+        result = shadow.calculate_shadow_reserve(1_000_000, "unknown_stage").to_dict()
+        
+        assert result["assumptions"]["reserve_ratio_applied"] == 0.05
+        assert result["assumptions"]["stage_description"] == "Claim notified, initial assessment"
+        assert result["assumptions"]["litigation_stage"] == "unknown_stage"
+
+    def test_litigation_stages_read_only(self) -> None:
+        """Test the class-level stage table keeps its dict shape and is read-only."""
+        stages = InsuranceShadowReserve.LITIGATION_STAGES
+        
+        assert stages["trial_listed"] == {
+            "reserve_ratio": 0.65,
+            "description": "Trial listed, full reserve required",
+        }
+        with pytest.raises(TypeError):
+            stages["trial_listed"] = {"reserve_ratio": 1.0, "description": ""}
+
+
+    def test_subclass_stage_override(self) -> None:
+        """Test a subclass LITIGATION_STAGES drives scalar, batch and progression paths."""
+        class StrictReserve(InsuranceShadowReserve):
+            LITIGATION_STAGES = {
+                "notification": {"reserve_ratio": 0.1, "description": "Notified"},
+                "appeal": {"reserve_ratio": 0.8, "description": "Appeal lodged"},
+            }
+        
+        model = StrictReserve()
+        result = model.calculate_shadow_reserve(1_000_000, "appeal")
+        
+        assert result.reserve_ratio == 0.8
+        assert result.stage_description == "Appeal lodged"
+        assert result.to_dict()["shadow_reserve"]["reserve_percentage"] == "80%"
+        assert model.calculate_shadow_reserve(1_000_000, "trial_listed").reserve_ratio == 0.1
+        batch = model.calculate_shadow_reserve_batch([1_000_000, 1_000_000], ["appeal", "unknown"])
+        assert batch["reserve_ratio"].tolist() == [0.8, 0.1]
+        assert model.calculate_stage_progression(1_000_000, "notification", "appeal")[
+            "reserve_increase_gbp"
+        ] == 700_000
+        assert InsuranceShadowReserve().calculate_shadow_reserve(1_000_000, "appeal").reserve_ratio == 0.05
+
+    def test_subclass_stages_require_notification(self) -> None:
+        """Test a stage override without the notification fallback is rejected."""
+        with pytest.raises(ValueError, match="notification"):
+            class NoFallback(InsuranceShadowReserve):
+                LITIGATION_STAGES = {"appeal": {"reserve_ratio": 0.8, "description": ""}}
+
+    def test_result_exposes_raw_figures(self) -> None:
+        """Test the result object carries unrounded figures and is frozen."""
+        result = InsuranceShadowReserve().calculate_shadow_reserve(1_234_567.891, "trial_listed")
+        
+        assert isinstance(result, ShadowReserveResult)
+        assert result.reserve_locked_gbp == 1_234_567.891 * 0.65
+        assert result.annual_dead_money_gbp == result.reserve_locked_gbp * 0.06
+        assert result.monthly_dead_money_gbp == result.annual_dead_money_gbp / 12
+        with pytest.raises(AttributeError):
+            result.reserve_ratio = 1.0
+
+
+class TestShadowReserveBatch:
+    """Tests for calculate_shadow_reserve_batch."""
+
+    def test_matches_scalar_by_stage_name(self) -> None:
+        """Test each row equals the scalar report before rounding."""
+        shadow = InsuranceShadowReserve()
+        stages = ["notification", "defence_filed", "procedural_irregularity_flagged", "trial_listed", "unknown"]
+        claims = np.array([1_000_000, 2_500_000.5, 3_333_333, 10_000_000, 750_000])
+        
+        batch = shadow.calculate_shadow_reserve_batch(claims, stages)
+        
+        assert batch["stage_index"].tolist() == [0, 1, 2, 3, 0]
+        for i, (claim, stage) in enumerate(zip(claims, stages, strict=True)):
+            scalar = shadow.calculate_shadow_reserve(float(claim), stage).to_dict()
+            assert round(batch["estimated_reserve_locked_gbp"][i], 2) == (
+                scalar["shadow_reserve"]["estimated_reserve_locked_gbp"]
+            )
+            assert round(batch["annual_cost_gbp"][i], 2) == scalar["dead_money_cost"]["annual_cost_gbp"]
+            assert round(batch["monthly_cost_gbp"][i], 2) == scalar["dead_money_cost"]["monthly_cost_gbp"]
+
+    def test_integer_stages_and_coc_override(self) -> None:
+        """Test integer stage indices and a cost of capital override."""
+        batch = InsuranceShadowReserve().calculate_shadow_reserve_batch(
+            [1_000_000, 1_000_000], np.array([3, 1]), cost_of_capital_rate=0.1
+        )
+        
+        assert batch["estimated_reserve_locked_gbp"].tolist() == [650_000, 150_000]
+        assert batch["annual_cost_gbp"].tolist() == [65_000, 15_000]
+        assert len(batch["audit_hash"]) == 16
+
+    def test_empty_portfolio(self) -> None:
+        """Test empty claims and stages return empty arrays rather than raising."""
+        batch = InsuranceShadowReserve().calculate_shadow_reserve_batch([], [])
+        
+        for key in ("stage_index", "reserve_ratio", "estimated_reserve_locked_gbp",
+                    "annual_cost_gbp", "monthly_cost_gbp"):
+            assert batch[key].shape == (0,)
+        assert len(batch["audit_hash"]) == 16
+
+    @pytest.mark.parametrize("stages", [np.array([0, 4]), np.array([-1, 0]), ["notification"]])
+    def test_rejects_bad_stages(self, stages) -> None:
+        """Test out-of-range indices and mismatched shapes are rejected."""
+        with pytest.raises(ValueError):
+            InsuranceShadowReserve().calculate_shadow_reserve_batch([1.0, 2.0], stages)
+
+    @pytest.mark.parametrize("stages", [np.array([3.0, 2.0]), np.array([True, False])])
+    def test_rejects_non_integer_non_name_stages(self, stages) -> None:
+        """Test float or bool stages raise instead of falling back to notification."""
+        with pytest.raises(TypeError):
+            InsuranceShadowReserve().calculate_shadow_reserve_batch([1.0, 2.0], stages)
+
+
 class TestQuickShadowCheck:
     """Tests for quick_shadow_check function."""
 
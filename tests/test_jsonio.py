@@ -0,0 +1,88 @@
+"""Tests for ai_assistant.jsonio module."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from ai_assistant import jsonio
+
+
+class TestJsonio:
+    """Tests for the JSON backend helpers."""
+
+    def test_pretty_round_trip(self) -> None:
+        """Pretty output is indented and parses back to the same object."""
+        obj = {"upls": 0.55, "decision": "HOLD", "nested": {"band": "£3m–£5m"}}
+        text = jsonio.dumps_pretty(obj)
+        assert '\n  "upls": 0.55' in text
+        assert jsonio.loads(text) == obj
+
+    def test_line_output_is_single_line(self) -> None:
+        """JSONL output never contains a newline."""
+        text = jsonio.dumps_line({"text": "a\nb", "n": 1})
+        assert "\n" not in text
+        assert json.loads(text) == {"text": "a\nb", "n": 1}
+
+    def test_unknown_types_fall_back_to_str(self) -> None:
+        """Non-JSON types are serialized via str(), matching default=str."""
+        assert jsonio.loads(jsonio.dumps_line({"d": date(2024, 1, 2)})) == {"d": "2024-01-02"}
+
+    def test_non_string_keys_are_stringified(self) -> None:
+        """Integer keys behave as with the stdlib encoder."""
+        assert jsonio.loads(jsonio.dumps_line({1: "a"})) == {"1": "a"}
+
+    def test_loads_accepts_bytes(self) -> None:
+        """Bytes input is accepted by both backends."""
+        assert jsonio.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_dumps_bytes_compact_and_pretty(self) -> None:
+        """dumps_bytes is compact by default and indented on request."""
+        obj = {"a": [1, 2], "b": "£"}
+        compact = jsonio.dumps_bytes(obj)
+        pretty = jsonio.dumps_bytes(obj, pretty=True)
+        assert b"\n" not in compact
+        assert b'\n  "a"' in pretty
+        assert jsonio.loads(compact) == jsonio.loads(pretty) == obj
+
+    def test_sort_keys_gives_order_independent_output(self) -> None:
+        """sort_keys renders equal dicts byte-identically whatever their insertion order."""
+        a = {"z": 1, "a": {"y": 2, "b": 3}}
+        b = {"a": {"b": 3, "y": 2}, "z": 1}
+        assert jsonio.dumps_pretty(a, sort_keys=True) == jsonio.dumps_pretty(b, sort_keys=True)
+        assert jsonio.dumps_bytes(a, sort_keys=True) == jsonio.dumps_bytes(b, sort_keys=True)
+        assert jsonio.dumps_pretty(a) != jsonio.dumps_pretty(b)
+
+    def test_tail_lines_skips_blank_lines_and_partial_first_line(self, tmp_path, monkeypatch) -> None:
+        """tail_lines never returns a partial line when blank lines pad the file."""
+        monkeypatch.setattr(jsonio, "TAIL_BLOCK_SIZE", 8)
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b'{"a":"xxxxxxxxxxxxxxxx"}\n\n\n{"b":1}\n\n')
+
+        assert jsonio.tail_lines(path, 2) == [b'{"a":"xxxxxxxxxxxxxxxx"}', b'{"b":1}']
+        assert jsonio.tail_lines(path, 1) == [b'{"b":1}']
+        assert jsonio.tail_lines(path, 5) == [b'{"a":"xxxxxxxxxxxxxxxx"}', b'{"b":1}']
+        assert jsonio.tail_lines(path, 0) == []
+
+    def test_tail_lines_across_many_blocks(self, tmp_path, monkeypatch) -> None:
+        """tail_lines stitches lines split across several small blocks."""
+        monkeypatch.setattr(jsonio, "TAIL_BLOCK_SIZE", 3)
+        path = tmp_path / "log.jsonl"
+        lines = [json.dumps({"i": i}).encode() for i in range(10)]
+        path.write_bytes(b"\n\n".join(lines) + b"\n")
+
+        for n in (1, 4, 10, 20):
+            assert jsonio.tail_lines(path, n) == lines[-n:]
+
+    def test_ensure_dir_is_cached_until_recreate(self, tmp_path) -> None:
+        """ensure_dir creates a directory once and again only when asked to recreate."""
+        target = tmp_path / "a" / "b"
+        jsonio.ensure_dir(target)
+        assert target.is_dir()
+
+        target.rmdir()
+        jsonio.ensure_dir(target)
+        assert not target.exists()
+
+        jsonio.ensure_dir(target, recreate=True)
+        assert target.is_dir()
@@ -246,6 +246,8 @@ def _render_daily_ai_panel(
                 report_path = save_daily_report(
                     st.session_state.last_result,
                     outputs_dir=PROJECT_ROOT / "outputs",
+                    indent=True,
+                    stamp=st.session_state.last_result.get("stamp"),
                 )
                 st.session_state.saved_report_path = str(report_path)
                 st.success(f"Saved to: {report_path.name}")
@@ -279,6 +281,7 @@ def _render_daily_ai_panel(
                 md_path = export_prompt_markdown(
                     st.session_state.generated_prompt,
                     outputs_dir=PROJECT_ROOT / "outputs",
+                    stamp=st.session_state.get("last_result", {}).get("stamp"),
                 )
                 st.success(f"Saved: {md_path.name}")
 